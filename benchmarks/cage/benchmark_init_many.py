@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+import stk
+
+NUM_CAGES = 50
+
+
+def get_topology_graphs() -> list[stk.cage.FourPlusSix]:
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock("BrCC(CBr)CBr", [stk.BromoFactory()])
+    return [
+        stk.cage.FourPlusSix(building_blocks=(bb1, bb2))
+        for _ in range(NUM_CAGES)
+    ]
+
+
+def build_in_loop() -> list[stk.ConstructedMolecule]:
+    return [
+        stk.ConstructedMolecule(topology_graph)
+        for topology_graph in get_topology_graphs()
+    ]
+
+
+def build_with_init_many() -> list[stk.ConstructedMolecule]:
+    with stk.ConstructionExecutor(num_processes=2) as executor:
+        return list(
+            stk.ConstructedMolecule.init_many(
+                topology_graphs=get_topology_graphs(),
+                executor=executor,
+            )
+        )
+
+
+@pytest.fixture(
+    params=(
+        build_in_loop,
+        build_with_init_many,
+    ),
+)
+def build(request):
+    return request.param
+
+
+def benchmark_init_many(benchmark, build) -> None:
+    benchmark(build)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import stk
+
+
+def build_m24l48() -> stk.ConstructedMolecule:
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock(
+        smiles="BrC1C(Br)CC(Br)C(Br)C1",
+        functional_groups=[stk.BromoFactory()],
+    )
+    cage = stk.ConstructedMolecule(
+        topology_graph=stk.cage.M24L48(
+            building_blocks=(bb2, bb1),
+        ),
+    )
+    return cage
+
+
+def benchmark_m24l48(benchmark) -> None:
+    benchmark(build_m24l48)
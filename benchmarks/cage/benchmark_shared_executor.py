@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+import stk
+
+NUM_CAGES = 50
+
+
+def build_cages(shared_executor: bool) -> list[stk.ConstructedMolecule]:
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock("BrCC(CBr)CBr", [stk.BromoFactory()])
+    topology_graph = stk.cage.FourPlusSix(
+        building_blocks=(bb1, bb2),
+        num_processes=2,
+    )
+    if not shared_executor:
+        return [
+            stk.ConstructedMolecule(topology_graph) for _ in range(NUM_CAGES)
+        ]
+
+    with stk.ConstructionExecutor(num_processes=2) as executor:
+        topology_graph = topology_graph.with_executor(executor)
+        return [
+            stk.ConstructedMolecule(topology_graph) for _ in range(NUM_CAGES)
+        ]
+
+
+@pytest.fixture(
+    params=(
+        False,
+        True,
+    ),
+)
+def shared_executor(request) -> bool:
+    return request.param
+
+
+def benchmark_shared_executor(
+    benchmark,
+    shared_executor: bool,
+) -> None:
+    benchmark(build_cages, shared_executor)
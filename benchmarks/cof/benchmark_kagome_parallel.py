@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+import stk
+
+
+def build_kagome(num_processes: int) -> stk.ConstructedMolecule:
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock(
+        smiles="BrC1C(Br)CC(Br)C(Br)C1",
+        functional_groups=[stk.BromoFactory()],
+    )
+    cof = stk.ConstructedMolecule(
+        topology_graph=stk.cof.Kagome(
+            building_blocks=(bb1, bb2),
+            lattice_size=(4, 4, 4),
+            num_processes=num_processes,
+        ),
+    )
+    return cof
+
+
+@pytest.fixture(
+    params=(
+        1,
+        2,
+        4,
+    ),
+)
+def num_processes(request) -> int:
+    return request.param
+
+
+def benchmark_kagome_parallel(
+    benchmark,
+    num_processes: int,
+) -> None:
+    benchmark(build_kagome, num_processes)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pymongo
+import pytest
+
+import stk
+
+NUM_PUTS = 200
+DATABASE = "_stk_benchmark_put"
+
+
+@pytest.fixture(scope="module")
+def mongo_client():
+    client = pymongo.MongoClient("mongodb://localhost:27017/")
+    client.drop_database(DATABASE)
+    yield client
+    client.drop_database(DATABASE)
+
+
+def put_molecules(
+    database: stk.MoleculeMongoDb,
+    molecules: list[stk.Molecule],
+) -> None:
+    for molecule in molecules:
+        database.put(molecule)
+
+
+def benchmark_repeated_put(
+    benchmark,
+    mongo_client: pymongo.MongoClient,
+) -> None:
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=DATABASE,
+    )
+    molecule = stk.BuildingBlock("BrC1C(Br)CC(Br)C(Br)C1")
+    benchmark(put_molecules, database, [molecule] * NUM_PUTS)
+
+
+def benchmark_unique_put(
+    benchmark,
+    mongo_client: pymongo.MongoClient,
+) -> None:
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=DATABASE,
+        put_lru_cache_size=0,
+    )
+    molecule = stk.BuildingBlock("BrC1C(Br)CC(Br)C(Br)C1")
+    # Distinct molecules with the same graph share a cached
+    # canonical ordering.
+    molecules = [
+        molecule.with_displacement((float(i), 0.0, 0.0))
+        for i in range(NUM_PUTS)
+    ]
+    benchmark(put_molecules, database, molecules)
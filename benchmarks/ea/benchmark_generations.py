@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import typing
+
+import stk
+from stk._internal.key_makers import inchi
+
+NUM_GENERATIONS = 10
+
+AMINES = ("NCCN", "NCCCN", "NCCCCN", "NC(C)CN", "NCC(C)CN")
+ALDEHYDES = ("O=CCC=O", "O=CCCC=O", "O=CCCCC=O", "O=CC(C)C=O")
+
+
+def get_building_blocks() -> tuple[
+    list[stk.BuildingBlock],
+    list[stk.BuildingBlock],
+]:
+    amines = [
+        stk.BuildingBlock(smiles, [stk.PrimaryAminoFactory()])
+        for smiles in AMINES
+    ]
+    aldehydes = [
+        stk.BuildingBlock(smiles, [stk.AldehydeFactory()])
+        for smiles in ALDEHYDES
+    ]
+    return amines, aldehydes
+
+
+def run_ea(key_maker: stk.CachedKeyMaker | None) -> None:
+    amines, aldehydes = get_building_blocks()
+    # With no key maker, every component uses its default one.
+    key_makers: dict[str, typing.Any] = (
+        {} if key_maker is None else {"key_maker": key_maker}
+    )
+    ea = stk.EvolutionaryAlgorithm(
+        initial_population=(
+            stk.MoleculeRecord(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(amine, aldehyde),
+                    repeating_unit="AB",
+                    num_repeating_units=2,
+                ),
+            )
+            for amine, aldehyde in zip(amines, aldehydes)
+        ),
+        fitness_calculator=stk.FitnessFunction(
+            lambda record: record.get_molecule().get_num_atoms(),
+        ),
+        mutator=stk.RandomMutator(
+            mutators=(
+                stk.RandomBuildingBlock(
+                    building_blocks=amines,
+                    is_replaceable=lambda building_block: (
+                        building_block in amines
+                    ),
+                    random_seed=1,
+                ),
+                stk.RandomBuildingBlock(
+                    building_blocks=aldehydes,
+                    is_replaceable=lambda building_block: (
+                        building_block in aldehydes
+                    ),
+                    random_seed=2,
+                ),
+            ),
+            random_seed=3,
+        ),
+        crosser=stk.GeneticRecombination(
+            get_gene=lambda building_block: building_block in amines,
+        ),
+        generation_selector=stk.Best(
+            num_batches=8,
+            duplicate_molecules=False,
+            **key_makers,
+        ),
+        mutation_selector=stk.Roulette(
+            num_batches=4,
+            random_seed=4,
+            **key_makers,
+        ),
+        crossover_selector=stk.Roulette(
+            num_batches=2,
+            batch_size=2,
+            random_seed=5,
+            **key_makers,
+        ),
+        **key_makers,
+        num_processes=1,
+    )
+    for _ in ea.get_generations(NUM_GENERATIONS):
+        pass
+
+
+def benchmark_generations(benchmark) -> None:
+    num_inchi_calls = 0
+
+    def get_inchi(molecule: stk.Molecule) -> str:
+        nonlocal num_inchi_calls
+        num_inchi_calls += 1
+        return stk.Inchi().get_key(molecule)
+
+    # Passing the same CachedKeyMaker everywhere means the EA and the
+    # selectors share one cache, and every key request is counted.
+    key_maker = stk.CachedKeyMaker(stk.MoleculeKeyMaker("InChI", get_inchi))
+    benchmark.pedantic(run_ea, args=(key_maker,), rounds=1, iterations=1)
+    num_requests = key_maker.get_num_hits() + key_maker.get_num_misses()
+    # Without the cache, every request would generate an InChI.
+    benchmark.extra_info["num_key_requests"] = num_requests
+    benchmark.extra_info["num_inchi_calls"] = num_inchi_calls
+    assert num_inchi_calls == key_maker.get_num_misses() < num_requests
+
+
+def benchmark_generations_default_key_makers(benchmark, monkeypatch) -> None:
+    num_inchi_calls = 0
+    make_inchi = inchi.get_inchi
+
+    def get_inchi(molecule: stk.Molecule) -> str:
+        nonlocal num_inchi_calls
+        num_inchi_calls += 1
+        return make_inchi(molecule)
+
+    # Count the InChIs made by the default key makers of the EA and
+    # its selectors.
+    monkeypatch.setattr(inchi, "get_inchi", get_inchi)
+    benchmark.pedantic(run_ea, args=(None,), rounds=1, iterations=1)
+    benchmark.extra_info["num_inchi_calls"] = num_inchi_calls
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+import stk
+
+POPULATION_SIZE = 200
+NUM_BATCHES = 100
+
+
+@pytest.fixture(scope="module")
+def population() -> dict[stk.MoleculeRecord[typing.Any], float]:
+    building_block = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    return {
+        stk.MoleculeRecord(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(building_block,),
+                repeating_unit="A",
+                num_repeating_units=num_repeating_units,
+            ),
+        ): float(num_repeating_units)
+        for num_repeating_units in range(2, POPULATION_SIZE + 2)
+    }
+
+
+def select(
+    selector: stk.Roulette[stk.MoleculeRecord[typing.Any]],
+    population: dict[stk.MoleculeRecord[typing.Any], float],
+) -> None:
+    for _ in selector.select(population):
+        pass
+
+
+def benchmark_roulette(
+    benchmark,
+    population: dict[stk.MoleculeRecord[typing.Any], float],
+) -> None:
+    selector = stk.Roulette(
+        num_batches=NUM_BATCHES,
+        batch_size=2,
+        duplicate_batches=False,
+        duplicate_molecules=False,
+        random_seed=1,
+        # The largest polymers have too many atoms for an InChI.
+        key_maker=stk.Smiles(),
+    )
+    # Make the keys of every molecule before timing.
+    select(selector, population)
+    benchmark(select, selector, population)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import stk
+
+
+def build_kagome() -> stk.ConstructedMolecule:
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock(
+        smiles="BrC1C(Br)CC(Br)C(Br)C1",
+        functional_groups=[stk.BromoFactory()],
+    )
+    return stk.ConstructedMolecule(
+        topology_graph=stk.cof.Kagome(
+            building_blocks=(bb1, bb2),
+            lattice_size=(4, 4, 4),
+        ),
+    )
+
+
+def get_bytes_per_atom(molecule: stk.ConstructedMolecule) -> float:
+    tracemalloc.start()
+    try:
+        objects = (
+            tuple(molecule.get_atoms()),
+            tuple(molecule.get_bonds()),
+            tuple(molecule.get_atom_infos()),
+            tuple(molecule.get_bond_infos()),
+        )
+        num_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return num_bytes / molecule.get_num_atoms()
+
+
+def benchmark_atom_memory(benchmark) -> None:
+    bytes_per_atom = benchmark.pedantic(
+        target=get_bytes_per_atom,
+        setup=lambda: ((build_kagome(),), {}),
+        rounds=3,
+    )
+    benchmark.extra_info["bytes_per_atom"] = bytes_per_atom
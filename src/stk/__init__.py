@@ -33,7 +33,16 @@ from stk._internal.databases.mongo_db.constructed_molecule import (
 )
 from stk._internal.databases.mongo_db.molecule import MoleculeMongoDb
 from stk._internal.databases.mongo_db.value import ValueMongoDb
+from stk._internal.databases.sqlite.constructed_molecule import (
+    ConstructedMoleculeSqliteDb,
+)
+from stk._internal.databases.sqlite.molecule import MoleculeSqliteDb
+from stk._internal.databases.sqlite.value import ValueSqliteDb
 from stk._internal.databases.value import ValueDatabase
+from stk._internal.databases.write_behind import (
+    WriteBehindMoleculeDb,
+    WriteBehindValueDb,
+)
 from stk._internal.ea.crossover.genetic_recombination import (
     GeneticRecombination,
 )
@@ -303,6 +312,7 @@ from stk._internal.json_serde.molecule import (
     MoleculeDejsonizer,
     MoleculeJsonizer,
 )
+from stk._internal.key_makers.cached import CachedKeyMaker
 from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.inchi_key import InchiKey
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
@@ -333,6 +343,9 @@ from stk._internal.reactions.ring_amine_reaction import RingAmineReaction
 from stk._internal.reactions.two_two_reaction import TwoTwoReaction
 from stk._internal.topology_graphs.edge import Edge
 from stk._internal.topology_graphs.edge_group import EdgeGroup
+from stk._internal.topology_graphs.topology_graph.construction_executor import (  # noqa
+    ConstructionExecutor,
+)
 from stk._internal.topology_graphs.topology_graph.topology_graph import (
     TopologyGraph,
 )
@@ -480,7 +493,13 @@ __all__ = [
     "ConstructedMoleculeDatabase",
     "MoleculeMongoDb",
     "ValueMongoDb",
+    "ConstructedMoleculeSqliteDb",
+    "MoleculeSqliteDb",
+    "ValueSqliteDb",
+    "WriteBehindMoleculeDb",
+    "WriteBehindValueDb",
     "MoleculeDatabase",
+    "CachedKeyMaker",
     "Inchi",
     "InchiKey",
     "Smiles",
@@ -488,6 +507,7 @@ __all__ = [
     "Molecule",
     "ConstructionState",
     "ConstructionResult",
+    "ConstructionExecutor",
     "ReactionResult",
     "GraphState",
     "OneOneReaction",
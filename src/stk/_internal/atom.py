@@ -52,6 +52,11 @@ class Atom:
 
     """
 
+    # Atom subclasses must not add any instance attributes, so that
+    # Atom.__init__ can change the class of an atom to that of its
+    # element.
+    __slots__ = ["_charge", "_id"]
+
     # Maps each atomic number (int) to the relevant Atom subclass.
     _elements: dict[int, type[Atom]] = {}
 
@@ -77,6 +82,30 @@ class Atom:
         self._elements[atomic_number].__init__(self, id, charge)
         self.__class__ = self._elements[atomic_number]
 
+    @classmethod
+    def _init_element(
+        cls,
+        id: int,
+        atomic_number: int,
+        charge: int = 0,
+    ) -> Atom:
+        """
+        Initialize an instance of the class of an element.
+
+        This is faster than :meth:`.__init__`, as the atom is created
+        with the class of its element, so its class does not need to
+        be changed.
+
+        Parameters:
+            id: The id of the atom.
+            atomic_number: The atomic number.
+            charge: The formal charge.
+
+        Returns:
+            The atom.
+        """
+        return cls._elements[atomic_number](id, charge)
+
     def get_id(self) -> int:
         """
         Get the id of the atom.
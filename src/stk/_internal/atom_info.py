@@ -7,6 +7,13 @@ class AtomInfo:
     Holds additional info about :class:`.ConstructedMolecule` atoms.
     """
 
+    __slots__ = [
+        "_atom",
+        "_building_block",
+        "_building_block_atom",
+        "_building_block_id",
+    ]
+
     def __init__(
         self,
         atom: Atom,
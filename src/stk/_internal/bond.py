@@ -30,6 +30,8 @@ class Bond:
             assert isinstance(clone.get_atom2(), stk.C)
     """
 
+    __slots__ = ["_atom1", "_atom2", "_order", "_periodicity"]
+
     def __init__(
         self,
         atom1: Atom,
@@ -7,6 +7,8 @@ class BondInfo:
     Holds additional info about :class:`.ConstructedMolecule` bonds.
     """
 
+    __slots__ = ["_bond", "_building_block", "_building_block_id"]
+
     def __init__(
         self,
         bond: Bond,
@@ -726,7 +726,9 @@ class BuildingBlock(Molecule):
         """
 
         atoms = tuple(
-            Atom(a.GetIdx(), a.GetAtomicNum(), a.GetFormalCharge())
+            Atom._init_element(
+                a.GetIdx(), a.GetAtomicNum(), a.GetFormalCharge()
+            )
             for a in molecule.GetAtoms()
         )
         bonds = tuple(
@@ -920,7 +922,7 @@ class BuildingBlock(Molecule):
         return self.clone()._with_functional_groups(functional_groups)
 
     def _with_canonical_atom_ordering(self) -> typing.Self:
-        ordering = rdkit.CanonicalRankAtoms(self.to_rdkit_mol())
+        ordering = self._get_canonical_ordering()
         super()._with_canonical_atom_ordering()
         id_map = {old_id: new_id for old_id, new_id in enumerate(ordering)}
         self._functional_groups = tuple(
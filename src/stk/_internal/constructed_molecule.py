@@ -1,11 +1,10 @@
 import logging
 import pathlib
 import typing
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 
 import atomlite
 import numpy as np
-import rdkit.Chem.AllChem as rdkit
 
 from stk._internal.atom import Atom
 from stk._internal.atom_info import AtomInfo
@@ -14,7 +13,15 @@ from stk._internal.bond_info import BondInfo
 from stk._internal.construction_result.construction_result import (
     ConstructionResult,
 )
+from stk._internal.construction_state.molecule_state.columns import (
+    _AtomColumns,
+    _BondColumns,
+)
 from stk._internal.molecule import Molecule
+from stk._internal.topology_graphs.topology_graph.construction_executor import (  # noqa
+    ConstructionExecutor,
+    _get_default_executor,
+)
 from stk._internal.topology_graphs.topology_graph.topology_graph import (
     TopologyGraph,
 )
@@ -103,8 +110,12 @@ class ConstructedMolecule(Molecule):
 
     """
 
-    _atom_infos: tuple[AtomInfo, ...]
-    _bond_infos: tuple[BondInfo, ...]
+    _atom_infos: Sequence[AtomInfo]
+    _bond_infos: Sequence[BondInfo]
+    # The columns the molecule was constructed from, or None if
+    # the atoms are no longer in the order of the columns.
+    _atom_columns: _AtomColumns | None
+    _bond_columns: _BondColumns | None
     _num_building_blocks: dict[Molecule, int]
 
     def __init__(self, topology_graph: TopologyGraph) -> None:
@@ -159,9 +170,87 @@ class ConstructedMolecule(Molecule):
         Molecule.__init__(molecule, atoms, bonds, position_matrix)
         molecule._atom_infos = tuple(atom_infos)
         molecule._bond_infos = tuple(bond_infos)
+        molecule._atom_columns = None
+        molecule._bond_columns = None
         molecule._num_building_blocks = dict(num_building_blocks)
         return molecule
 
+    @classmethod
+    def init_many(
+        cls,
+        topology_graphs: Iterable[TopologyGraph],
+        executor: ConstructionExecutor | None = None,
+    ) -> Iterator[typing.Self]:
+        """
+        Initialize many :class:`.ConstructedMolecule` instances.
+
+        Each molecule is constructed in a single worker process of
+        `executor`, so that the parallelism is across molecules,
+        rather than across the vertices of one molecule. The building
+        blocks shared by the topology graphs are sent to each worker
+        process only once.
+
+        Examples:
+
+            *Constructing Many Molecules*
+
+            .. testcode:: constructing-many-molecules
+
+                import stk
+
+                bb1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+                topology_graphs = [
+                    stk.cage.FourPlusSix(
+                        building_blocks=(
+                            bb1,
+                            stk.BuildingBlock(
+                                smiles=smiles,
+                                functional_groups=[stk.BromoFactory()],
+                            ),
+                        ),
+                    )
+                    for smiles in ('BrCC(CBr)CBr', 'BrCN(CBr)CBr')
+                ]
+                with stk.ConstructionExecutor(num_processes=2) as executor:
+                    cages = list(
+                        stk.ConstructedMolecule.init_many(
+                            topology_graphs=topology_graphs,
+                            executor=executor,
+                        )
+                    )
+
+        Parameters:
+
+            topology_graphs:
+                The topology graphs of the constructed molecules.
+
+            executor:
+                The executor used for construction. If ``None``, the
+                executor of the innermost active
+                :class:`.ConstructionExecutor` context is used, and if
+                there is none, the molecules are constructed one after
+                another in the current process.
+
+        Yields:
+            A constructed molecule, in the order of `topology_graphs`.
+        """
+        if executor is None:
+            executor = _get_default_executor()
+        if executor is None:
+            for topology_graph in topology_graphs:
+                yield cls(topology_graph)
+            return
+
+        for data in executor._get_construction_data(topology_graphs):
+            yield cls.init(
+                atoms=data.atoms,
+                bonds=data.bonds,
+                position_matrix=data.position_matrix,
+                atom_infos=data.atom_infos,
+                bond_infos=data.bond_infos,
+                num_building_blocks=data.num_building_blocks,
+            )
+
     @classmethod
     def init_from_construction_result(
         cls,
@@ -203,13 +292,19 @@ class ConstructedMolecule(Molecule):
         Returns:
             The `obj` instance.
         """
-        super(ConstructedMolecule, obj).__init__(
-            atoms=construction_result.get_atoms(),
-            bonds=construction_result.get_bonds(),
-            position_matrix=construction_result.get_position_matrix(),
+        # The construction result creates atoms, bonds and their
+        # infos on first access, so they are held as they are, rather
+        # than copied into tuples by Molecule.__init__.
+        obj._atoms = construction_result.get_atoms()
+        obj._bonds = construction_result.get_bonds()
+        obj._position_matrix = np.array(
+            construction_result.get_position_matrix().T,
+            dtype=np.float64,
         )
         obj._atom_infos = construction_result.get_atom_infos()
         obj._bond_infos = construction_result.get_bond_infos()
+        obj._atom_columns = construction_result.get_atom_columns()
+        obj._bond_columns = construction_result.get_bond_columns()
         obj._num_building_blocks = {
             building_block: construction_result.get_num_building_block(
                 building_block=building_block,
@@ -228,6 +323,8 @@ class ConstructedMolecule(Molecule):
         clone = super().clone()
         clone._atom_infos = self._atom_infos
         clone._bond_infos = self._bond_infos
+        clone._atom_columns = self._atom_columns
+        clone._bond_columns = self._bond_columns
         clone._num_building_blocks = dict(self._num_building_blocks)
         return clone
 
@@ -310,12 +407,6 @@ class ConstructedMolecule(Molecule):
         return self.clone()._with_canonical_atom_ordering()
 
     def _with_canonical_atom_ordering(self) -> typing.Self:
-        # Make all building blocks canonically ordered too.
-        building_blocks = {
-            building_block: building_block.with_canonical_atom_ordering()
-            for building_block in self._num_building_blocks
-        }
-
         # Cache these mappings for later, to avoid unnecessary
         # re-computations of canonical ordering.
         canonical_map = {
@@ -323,6 +414,12 @@ class ConstructedMolecule(Molecule):
             for building_block in self._num_building_blocks
         }
 
+        # Make all building blocks canonically ordered too.
+        building_blocks = {
+            building_block: building_block.with_canonical_atom_ordering()
+            for building_block in self._num_building_blocks
+        }
+
         self._num_building_blocks = dict(
             zip(
                 building_blocks.values(),
@@ -330,7 +427,7 @@ class ConstructedMolecule(Molecule):
             ),
         )
 
-        ordering = rdkit.CanonicalRankAtoms(self.to_rdkit_mol())
+        ordering = self._get_canonical_ordering()
         id_map = {
             new_id: atom.get_id()
             for new_id, atom in zip(ordering, self._atoms)
@@ -401,8 +498,72 @@ class ConstructedMolecule(Molecule):
                 key=get_bond_info_atom_ids,
             )
         )
+        self._atom_columns = None
+        self._bond_columns = None
         return self
 
+    def _get_identity_arrays(self) -> tuple[np.ndarray, ...]:
+        """
+        Get arrays, which together describe how the molecule is stored.
+
+        Returns:
+
+            The arrays of :meth:`.Molecule._get_identity_arrays`,
+            followed by the building block id and building block
+            atom id of each atom, and the building block id of each
+            bond. Ids are ``-1`` for atoms and bonds which do not
+            come from a building block.
+
+        """
+
+        if self._atom_columns is None or self._bond_columns is None:
+            return (
+                *super()._get_identity_arrays(),
+                np.array(
+                    [
+                        _get_building_block_id(info)
+                        for info in self._atom_infos
+                    ],
+                    dtype=np.int64,
+                ),
+                np.array(
+                    [
+                        _get_building_block_atom_id(info)
+                        for info in self._atom_infos
+                    ],
+                    dtype=np.int64,
+                ),
+                np.array(
+                    [
+                        _get_building_block_id(info)
+                        for info in self._bond_infos
+                    ],
+                    dtype=np.int64,
+                ),
+            )
+
+        # The columns are used, so that lazily created atoms, bonds
+        # and their infos are not created.
+        atom_columns = self._atom_columns
+        bond_columns = self._bond_columns
+        return (
+            np.asarray(atom_columns.atomic_numbers, dtype=np.int64),
+            np.asarray(atom_columns.charges, dtype=np.int64),
+            np.stack(
+                [bond_columns.atom1_ids, bond_columns.atom2_ids],
+                axis=1,
+            ).astype(np.int64, copy=False),
+            np.asarray(bond_columns.orders, dtype=np.float64),
+            np.asarray(bond_columns.periodicities, dtype=np.int64),
+            self._position_matrix,
+            np.asarray(atom_columns.building_block_ids, dtype=np.int64),
+            np.asarray(
+                atom_columns.building_block_atom_ids,
+                dtype=np.int64,
+            ),
+            np.asarray(bond_columns.building_block_ids, dtype=np.int64),
+        )
+
     def with_centroid(
         self,
         position: np.ndarray,
@@ -663,3 +824,13 @@ class ConstructedMolecule(Molecule):
             ConstructedMolecule: The molecule.
         """
         return super().write(path, atom_ids)
+
+
+def _get_building_block_id(info: AtomInfo | BondInfo) -> int:
+    building_block_id = info.get_building_block_id()
+    return -1 if building_block_id is None else building_block_id
+
+
+def _get_building_block_atom_id(info: AtomInfo) -> int:
+    building_block_atom = info.get_building_block_atom()
+    return -1 if building_block_atom is None else building_block_atom.get_id()
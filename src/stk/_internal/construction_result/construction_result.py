@@ -4,6 +4,8 @@ Construction Result
 
 """
 
+from stk._internal.utilities.lazy_sequence import LazySequence
+
 
 class ConstructionResult:
     """
@@ -16,6 +18,8 @@ class ConstructionResult:
         "_bonds",
         "_atom_infos",
         "_bond_infos",
+        "_atom_columns",
+        "_bond_columns",
         "_position_matrix",
         "_num_building_blocks",
     ]
@@ -33,10 +37,22 @@ class ConstructionResult:
 
         self._position_matrix = construction_state.get_position_matrix()
         self._position_matrix.setflags(write=False)
-        self._atoms = tuple(construction_state.get_atoms())
-        self._bonds = tuple(construction_state.get_bonds())
-        self._atom_infos = tuple(construction_state.get_atom_infos())
-        self._bond_infos = tuple(construction_state.get_bond_infos())
+        # Atoms, bonds and their infos are only created when they
+        # are first accessed.
+        num_atoms = construction_state.get_num_atoms()
+        num_bonds = construction_state.get_num_bonds()
+        self._atoms = LazySequence(construction_state.get_atoms, num_atoms)
+        self._bonds = LazySequence(construction_state.get_bonds, num_bonds)
+        self._atom_infos = LazySequence(
+            get_items=construction_state.get_atom_infos,
+            num_items=num_atoms,
+        )
+        self._bond_infos = LazySequence(
+            get_items=construction_state.get_bond_infos,
+            num_items=num_bonds,
+        )
+        self._atom_columns = construction_state.get_atom_columns()
+        self._bond_columns = construction_state.get_bond_columns()
         self._num_building_blocks = {
             building_block: construction_state.get_num_building_block(
                 building_block=building_block,
@@ -63,7 +79,7 @@ class ConstructionResult:
 
         Returns
         -------
-        :class:`tuple` of :class:`.Atom`
+        :class:`~collections.abc.Sequence` of :class:`.Atom`
             The atoms of the constructed molecule.
 
         """
@@ -76,7 +92,7 @@ class ConstructionResult:
 
         Returns
         -------
-        :class:`tuple` of :class:`.Bond`
+        :class:`~collections.abc.Sequence` of :class:`.Bond`
             The bonds of the constructed molecule.
 
         """
@@ -89,7 +105,7 @@ class ConstructionResult:
 
         Returns
         -------
-        :class:`tuple` of :class:`.AtomInfo`
+        :class:`~collections.abc.Sequence` of :class:`.AtomInfo`
             The atom infos of the constructed molecule.
 
         """
@@ -102,13 +118,39 @@ class ConstructionResult:
 
         Returns
         -------
-        :class:`tuple` of :class:`.BondInfo`
+        :class:`~collections.abc.Sequence` of :class:`.BondInfo`
             The bond infos of the constructed molecule.
 
         """
 
         return self._bond_infos
 
+    def get_atom_columns(self):
+        """
+        Get the per-atom columns of the constructed molecule.
+
+        Returns
+        -------
+        :class:`._AtomColumns`
+            Read-only views of the columns, with a row for each atom.
+
+        """
+
+        return self._atom_columns
+
+    def get_bond_columns(self):
+        """
+        Get the per-bond columns of the constructed molecule.
+
+        Returns
+        -------
+        :class:`._BondColumns`
+            Read-only views of the columns, with a row for each bond.
+
+        """
+
+        return self._bond_columns
+
     def get_num_building_block(self, building_block):
         """
         Get the number of times `building_block` is present.
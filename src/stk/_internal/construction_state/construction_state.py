@@ -45,7 +45,14 @@ class ConstructionState:
             edges=edges,
             lattice_constants=lattice_constants,
         )
-        self._molecule_state = MoleculeState()
+        self._molecule_state = MoleculeState(
+            num_atoms=sum(
+                building_block.get_num_atoms() * len(vertices)
+                for building_block, vertices in (
+                    building_block_vertices.items()
+                )
+            ),
+        )
 
     def clone(self):
         """
@@ -396,6 +403,32 @@ class ConstructionState:
 
         return self._molecule_state.get_position_matrix()
 
+    def get_num_atoms(self):
+        """
+        Get the number of atoms in the molecule being constructed.
+
+        Returns
+        -------
+        :class:`int`
+            The number of atoms.
+
+        """
+
+        return self._molecule_state.get_num_atoms()
+
+    def get_num_bonds(self):
+        """
+        Get the number of bonds in the molecule being constructed.
+
+        Returns
+        -------
+        :class:`int`
+            The number of bonds.
+
+        """
+
+        return self._molecule_state.get_num_bonds()
+
     def get_atoms(self):
         """
         Yield the atoms of the molecule being constructed.
@@ -422,6 +455,32 @@ class ConstructionState:
 
         yield from self._molecule_state.get_bonds()
 
+    def get_atom_columns(self):
+        """
+        Get the per-atom columns of the molecule being constructed.
+
+        Returns
+        -------
+        :class:`._AtomColumns`
+            Read-only views of the columns, with a row for each atom.
+
+        """
+
+        return self._molecule_state.get_atom_columns()
+
+    def get_bond_columns(self):
+        """
+        Get the per-bond columns of the molecule being constructed.
+
+        Returns
+        -------
+        :class:`._BondColumns`
+            Read-only views of the columns, with a row for each bond.
+
+        """
+
+        return self._molecule_state.get_bond_columns()
+
     def get_atom_infos(self):
         """
         Yield the atom infos of the molecule being constructed.
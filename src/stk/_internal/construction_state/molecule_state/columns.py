@@ -0,0 +1,361 @@
+"""
+Columns
+=======
+
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+
+class _AtomColumns(typing.NamedTuple):
+    """
+    Per-atom data of a molecule under construction.
+
+    Each attribute holds one row for every atom.
+
+    Attributes:
+
+        atomic_numbers:
+            The atomic number of each atom.
+
+        charges:
+            The formal charge of each atom.
+
+        building_block_ids:
+            The id of the building block placement each atom
+            originates from, or ``-1`` if the atom was added by the
+            construction process.
+
+        building_block_atom_ids:
+            The id of the building block atom each atom originates
+            from, or ``-1`` if the atom was added by the construction
+            process.
+
+    """
+
+    atomic_numbers: np.ndarray
+    charges: np.ndarray
+    building_block_ids: np.ndarray
+    building_block_atom_ids: np.ndarray
+
+
+class _BondColumns(typing.NamedTuple):
+    """
+    Per-bond data of a molecule under construction.
+
+    Each attribute holds one row for every bond.
+
+    Attributes:
+
+        atom1_ids:
+            The id of the first atom of each bond.
+
+        atom2_ids:
+            The id of the second atom of each bond.
+
+        orders:
+            The order of each bond. This is an ``object`` array, so
+            that bond orders keep their original type.
+
+        periodicities:
+            A ``(n, 3)`` array holding the periodicity of each bond.
+
+        building_block_ids:
+            The id of the building block placement each bond
+            originates from, or ``-1`` if the bond was added by the
+            construction process.
+
+    """
+
+    atom1_ids: np.ndarray
+    atom2_ids: np.ndarray
+    orders: np.ndarray
+    periodicities: np.ndarray
+    building_block_ids: np.ndarray
+
+
+class _PositionColumns(typing.NamedTuple):
+    """
+    Atomic positions of a molecule under construction.
+
+    Attributes:
+
+        positions:
+            A ``(n, 3)`` array holding the position of each atom.
+
+    """
+
+    positions: np.ndarray
+
+
+_Columns = typing.TypeVar(
+    "_Columns",
+    _AtomColumns,
+    _BondColumns,
+    _PositionColumns,
+)
+
+
+def _get_empty_atom_columns() -> _AtomColumns:
+    """
+    Get atom columns holding no atoms.
+
+    Returns:
+
+        The empty columns.
+
+    """
+
+    return _AtomColumns(
+        atomic_numbers=np.empty(0, dtype=np.int64),
+        charges=np.empty(0, dtype=np.int64),
+        building_block_ids=np.empty(0, dtype=np.int64),
+        building_block_atom_ids=np.empty(0, dtype=np.int64),
+    )
+
+
+def _get_empty_bond_columns() -> _BondColumns:
+    """
+    Get bond columns holding no bonds.
+
+    Returns:
+
+        The empty columns.
+
+    """
+
+    return _BondColumns(
+        atom1_ids=np.empty(0, dtype=np.int64),
+        atom2_ids=np.empty(0, dtype=np.int64),
+        orders=np.empty(0, dtype=object),
+        periodicities=np.empty((0, 3), dtype=np.int64),
+        building_block_ids=np.empty(0, dtype=np.int64),
+    )
+
+
+def _get_empty_position_columns() -> _PositionColumns:
+    """
+    Get position columns holding no atoms.
+
+    Returns:
+
+        The empty columns.
+
+    """
+
+    return _PositionColumns(
+        positions=np.empty((0, 3), dtype=np.float64),
+    )
+
+
+def _concatenate_columns(
+    columns: typing.Iterable[_Columns],
+    empty: _Columns,
+) -> _Columns:
+    """
+    Concatenate columns row-wise.
+
+    Parameters:
+
+        columns:
+            The columns to join.
+
+        empty:
+            The columns to return if `columns` is empty.
+
+    Returns:
+
+        The joined columns.
+
+    """
+
+    columns = tuple(columns)
+    if not columns:
+        return empty
+    return type(empty)(*map(np.concatenate, zip(*columns)))
+
+
+class _ColumnsBuffer(typing.Generic[_Columns]):
+    """
+    Append-only column storage shared between molecule states.
+
+    A single buffer can be shared by many :class:`.MoleculeState`
+    instances. Each instance only sees the rows up to its own length
+    and rows below the length of any instance are never overwritten.
+    Appending to the instance which owns the last row of the buffer
+    writes in place, while appending to any other instance copies
+    the rows it sees into a new buffer first.
+
+    """
+
+    __slots__ = ["_data", "_num_rows"]
+
+    _data: _Columns
+    _num_rows: int
+
+    def __init__(
+        self,
+        columns: _Columns,
+        capacity: int = 0,
+    ) -> None:
+        """
+        Initialize a :class:`._ColumnsBuffer`.
+
+        Parameters:
+
+            columns:
+                The initial rows of the buffer.
+
+            capacity:
+                The number of rows to allocate up front. If this is
+                smaller than the number of rows in `columns`, no
+                extra rows are allocated.
+
+        """
+
+        num_rows = len(columns[0])
+        if capacity > num_rows:
+            columns = type(columns)(
+                *(
+                    _get_resized_column(column, num_rows, capacity)
+                    for column in columns
+                )
+            )
+        self._data = columns
+        self._num_rows = num_rows
+
+    def get_rows(self, num_rows: int) -> _Columns:
+        """
+        Get read-only views of the first rows.
+
+        Parameters:
+
+            num_rows:
+                The number of rows to get.
+
+        Returns:
+
+            The rows.
+
+        """
+
+        def get_view(column: np.ndarray) -> np.ndarray:
+            view = column[:num_rows]
+            view.setflags(write=False)
+            return view
+
+        return type(self._data)(*map(get_view, self._data))
+
+    def with_empty_rows(
+        self,
+        num_rows: int,
+        num_new_rows: int,
+    ) -> tuple[_ColumnsBuffer[_Columns], _Columns]:
+        """
+        Get a buffer holding the first rows of this one and new rows.
+
+        Parameters:
+
+            num_rows:
+                The number of rows of this buffer, which should be
+                kept.
+
+            num_new_rows:
+                The number of rows to add after the kept rows.
+
+        Returns:
+
+            The buffer holding the rows and writable views of the
+            new rows, which the caller is expected to fill. The
+            buffer will be the same instance if no reallocation was
+            necessary.
+
+        """
+
+        total = num_rows + num_new_rows
+        if num_rows == self._num_rows and total <= len(self._data[0]):
+            buffer = self
+        else:
+            buffer = self.__class__.__new__(self.__class__)
+            capacity = max(2 * total, 16)
+            buffer._data = type(self._data)(
+                *(
+                    _get_resized_column(column, num_rows, capacity)
+                    for column in self._data
+                )
+            )
+
+        buffer._num_rows = total
+        new_rows = type(self._data)(
+            *(column[num_rows:total] for column in buffer._data)
+        )
+        return buffer, new_rows
+
+    def with_rows(
+        self,
+        num_rows: int,
+        rows: _Columns,
+    ) -> _ColumnsBuffer[_Columns]:
+        """
+        Get a buffer holding the first rows of this one and `rows`.
+
+        Parameters:
+
+            num_rows:
+                The number of rows of this buffer, which should be
+                kept.
+
+            rows:
+                The rows to add after the kept rows.
+
+        Returns:
+
+            The buffer holding the rows. This will be the same
+            instance if `rows` could be written in place.
+
+        """
+
+        buffer, new_rows = self.with_empty_rows(
+            num_rows=num_rows,
+            num_new_rows=len(rows[0]),
+        )
+        for column, rows_ in zip(new_rows, rows):
+            column[:] = rows_
+        return buffer
+
+
+def _get_resized_column(
+    column: np.ndarray,
+    num_rows: int,
+    capacity: int,
+) -> np.ndarray:
+    """
+    Copy the first rows of a column into a new array.
+
+    Parameters:
+
+        column:
+            The column to copy.
+
+        num_rows:
+            The number of rows of `column` to copy.
+
+        capacity:
+            The number of rows in the new array.
+
+    Returns:
+
+        The new array. Rows after `num_rows` are uninitialized.
+
+    """
+
+    new_column = np.empty(
+        shape=(capacity, *column.shape[1:]),
+        dtype=column.dtype,
+    )
+    new_column[:num_rows] = column[:num_rows]
+    return new_column
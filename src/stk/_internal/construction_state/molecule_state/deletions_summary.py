@@ -6,8 +6,7 @@ Deletions Summary
 
 import numpy as np
 
-from stk._internal.atom_info import AtomInfo
-from stk._internal.bond_info import BondInfo
+from .columns import _AtomColumns
 
 
 class _DeletionsSummary:
@@ -17,26 +16,20 @@ class _DeletionsSummary:
     """
 
     __slots__ = [
-        "_atoms",
-        "_atom_infos",
-        "_bonds",
-        "_bond_infos",
+        "_atom_columns",
+        "_bond_columns",
         "_position_matrix",
         "_deleted_atom_ids",
         "_deleted_bond_ids",
-        "_valid_atoms",
-        "_valid_atom_infos",
-        "_valid_bonds",
-        "_valid_bond_infos",
+        "_valid_atom_columns",
+        "_valid_bond_columns",
         "_valid_positions",
     ]
 
     def __init__(
         self,
-        atoms,
-        atom_infos,
-        bonds,
-        bond_infos,
+        atom_columns,
+        bond_columns,
         position_matrix,
         deleted_atom_ids,
         deleted_bond_ids,
@@ -46,42 +39,28 @@ class _DeletionsSummary:
 
         Parameters
         ----------
-        atoms : :class:`iterable` of :class:`.Atom`
+        atom_columns : :class:`._AtomColumns`
             Atoms, some of which are to be deleted.
 
-        atom_infos : :class:`iterable` of :class:`.AtomInfo`
-            Info on every atom in `atoms`.
-
-        bonds : :class:`iterable` of :class:`.Bond`
+        bond_columns : :class:`._BondColumns`
             The bonds of the molecule being constructed.
 
-        bond_infos : :class:`iterable` of :class:`.BondInfo`
-            Info on every bond in `bonds`.
-
         position_matrix : :class:`numpy.ndarray`
-            The position matrix for all the `atoms`.
+            The position matrix for all the atoms.
 
         deleted_atom_ids : :class:`iterable` of :class:`int`
-            The ids of `atoms`, which should be deleted.
+            The ids of atoms, which should be deleted.
 
         deleted_bond_ids : :class:`iterable` of :class:`._BondId`
             Ids of bonds that should be deleted.
 
         """
 
-        self._atoms = tuple(atoms)
-        self._atom_infos = tuple(atom_infos)
-        self._bonds = tuple(bonds)
-        self._bond_infos = tuple(bond_infos)
-        self._position_matrix = np.array(position_matrix)
+        self._atom_columns = atom_columns
+        self._bond_columns = bond_columns
+        self._position_matrix = np.asarray(position_matrix)
         self._deleted_atom_ids = set(deleted_atom_ids)
         self._deleted_bond_ids = set(deleted_bond_ids)
-
-        self._valid_atoms = []
-        self._valid_atom_infos = []
-        self._valid_bonds = []
-        self._valid_bond_infos = []
-        self._valid_positions = []
         self._with_valid_data()
 
     def _with_valid_data(self):
@@ -94,128 +73,81 @@ class _DeletionsSummary:
 
         """
 
-        atoms = self._atoms
-        atom_infos = self._atom_infos
-        position_matrix = self._position_matrix
-        deleted_atom_ids = self._deleted_atom_ids
-        deleted_bond_ids = self._deleted_bond_ids
-
-        def valid_atom(atom):
-            return atom.get_id() not in deleted_atom_ids
-
-        valid_atoms = self._valid_atoms
-        valid_atom_infos = self._valid_atom_infos
-        valid_positions = self._valid_positions
-        atom_map = {}
-
-        def with_atom(atom):
-            atom_id = atom.get_id()
-            valid_atoms.append(atom.with_id(len(valid_atoms)))
-            atom_map[atom_id] = valid_atoms[-1]
-            info = atom_infos[atom_id]
-            valid_atom_infos.append(
-                AtomInfo(
-                    atom=valid_atoms[-1],
-                    building_block_atom=info.get_building_block_atom(),
-                    building_block=info.get_building_block(),
-                    building_block_id=info.get_building_block_id(),
-                )
+        num_atoms = len(self._position_matrix)
+        atom_mask = np.ones(num_atoms, dtype=bool)
+        atom_mask[
+            np.fromiter(
+                self._deleted_atom_ids,
+                dtype=np.int64,
+                count=len(self._deleted_atom_ids),
             )
-            valid_positions.append(position_matrix[atom_id])
-
-        for atom in filter(valid_atom, atoms):
-            with_atom(atom)
-
-        def valid_bond(bond_data):
-            index, bond = bond_data
-            atom1_id = bond.get_atom1().get_id()
-            atom2_id = bond.get_atom2().get_id()
-            return (
-                atom1_id not in deleted_atom_ids
-                and atom2_id not in deleted_atom_ids
-                and (atom1_id, atom2_id) not in deleted_bond_ids
+        ] = False
+        # Maps the id of each kept atom to its id once deleted atoms
+        # are removed.
+        id_map = np.cumsum(atom_mask) - 1
+
+        self._valid_atom_columns = _AtomColumns(
+            *(column[atom_mask] for column in self._atom_columns)
+        )
+        self._valid_positions = self._position_matrix[atom_mask]
+
+        bonds = self._bond_columns
+        bond_mask = atom_mask[bonds.atom1_ids] & atom_mask[bonds.atom2_ids]
+        if self._deleted_bond_ids:
+            # Bonds are identified by a single integer, so that they
+            # can be compared with array operations.
+            deleted_bond_ids = np.array(
+                tuple(self._deleted_bond_ids),
+                dtype=np.int64,
             )
-
-        bonds = self._bonds
-        bond_infos = self._bond_infos
-        valid_bonds = self._valid_bonds
-        valid_bond_infos = self._valid_bond_infos
-
-        def with_bond(index, bond):
-            valid_bonds.append(bond.with_atoms(atom_map))
-            info = bond_infos[index]
-            valid_bond_infos.append(
-                BondInfo(
-                    bond=valid_bonds[-1],
-                    building_block=info.get_building_block(),
-                    building_block_id=info.get_building_block_id(),
-                )
+            bond_mask &= ~np.isin(
+                bonds.atom1_ids * num_atoms + bonds.atom2_ids,
+                deleted_bond_ids[:, 0] * num_atoms + deleted_bond_ids[:, 1],
             )
 
-        for index, bond in filter(valid_bond, enumerate(bonds)):
-            with_bond(index, bond)
-
-    def get_atoms(self):
-        """
-        Yield the atoms in the summary.
-
-        Yields
-        ------
-        :class:`.Atom`
-            An atom.
-
-        """
-
-        yield from self._valid_atoms
-
-    def get_atom_infos(self):
-        """
-        Yield infos about atoms in the summary.
-
-        Yields
-        ------
-        :class:`.AtomInfo`
-            Info about an atom.
-
-        """
-
-        yield from self._valid_atom_infos
+        self._valid_bond_columns = bonds._replace(
+            atom1_ids=id_map[bonds.atom1_ids[bond_mask]],
+            atom2_ids=id_map[bonds.atom2_ids[bond_mask]],
+            orders=bonds.orders[bond_mask],
+            periodicities=bonds.periodicities[bond_mask],
+            building_block_ids=bonds.building_block_ids[bond_mask],
+        )
 
-    def get_bonds(self):
+    def get_atom_columns(self):
         """
-        Yield the bonds in the summary.
+        Get the columns of the atoms in the summary.
 
-        Yields
-        ------
-        :class:`.Bond`
-            A bond.
+        Returns
+        -------
+        :class:`._AtomColumns`
+            The columns of the atoms which were not deleted.
 
         """
 
-        yield from self._valid_bonds
+        return self._valid_atom_columns
 
-    def get_bond_infos(self):
+    def get_bond_columns(self):
         """
-        Yield infos about the bonds in the summary.
+        Get the columns of the bonds in the summary.
 
-        Yields
-        ------
-        :class:`.BondInfo`
-            Info about a bond.
+        Returns
+        -------
+        :class:`._BondColumns`
+            The columns of the bonds which were not deleted.
 
         """
 
-        yield from self._valid_bond_infos
+        return self._valid_bond_columns
 
-    def get_positions(self):
+    def get_position_matrix(self):
         """
-        Yield the positions of atoms held by the summary.
+        Get the position matrix of atoms held by the summary.
 
-        Yields
-        ------
+        Returns
+        -------
         :class:`numpy.ndarray`
-            The position of an atom held by the summary.
+            The position matrix of atoms which were not deleted.
 
         """
 
-        yield from self._valid_positions
+        return self._valid_positions
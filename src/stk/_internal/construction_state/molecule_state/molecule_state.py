@@ -4,8 +4,22 @@ Molecule State
 
 """
 
+import itertools as it
+
 import numpy as np
 
+from stk._internal.atom import Atom
+from stk._internal.atom_info import AtomInfo
+from stk._internal.bond import Bond
+from stk._internal.bond_info import BondInfo
+
+from .columns import (
+    _ColumnsBuffer,
+    _get_empty_atom_columns,
+    _get_empty_bond_columns,
+    _get_empty_position_columns,
+    _PositionColumns,
+)
 from .deletions_summary import _DeletionsSummary
 from .placements_summary import _PlacementsSummary
 from .reactions_summary import _ReactionsSummary
@@ -15,31 +29,63 @@ class MoleculeState:
     """
     Represents the state of a molecule under construction.
 
+    Atoms, bonds and positions are held as columns of :mod:`numpy`
+    arrays, which are shared between a state and its clones.
+    Construction stages only append to the columns, so a new stage
+    writes just the rows it adds. :class:`.Atom`, :class:`.Bond`,
+    :class:`.AtomInfo` and :class:`.BondInfo` instances are only
+    created when requested.
+
     """
 
     __slots__ = [
+        "_position_buffer",
         "_position_matrix",
+        "_atom_columns",
+        "_bond_columns",
+        "_num_atoms",
+        "_num_bonds",
+        "_building_blocks",
+        "_edge_functional_groups",
         "_atoms",
-        "_atom_infos",
         "_bonds",
-        "_bond_infos",
-        "_edge_functional_groups",
-        "_num_placements",
     ]
 
-    def __init__(self):
+    def __init__(self, num_atoms=0):
         """
         Initialize a :class:`._MoleculeState` instance.
 
+        Parameters
+        ----------
+        num_atoms : :class:`int`, optional
+            The number of atoms the molecule is expected to have
+            once all building blocks are placed. Storage for this
+            many atoms is allocated up front, so that placement
+            stages can write into it without reallocating.
+
         """
 
-        self._position_matrix = np.empty((0, 3), dtype=np.float64)
-        self._atoms = []
-        self._atom_infos = []
-        self._bonds = []
-        self._bond_infos = []
+        self._position_buffer = _ColumnsBuffer(
+            columns=_get_empty_position_columns(),
+            capacity=num_atoms,
+        )
+        # A read-only view of the rows of the position buffer, which
+        # belong to this state.
+        self._position_matrix = self._position_buffer.get_rows(0).positions
+        self._atom_columns = _ColumnsBuffer(
+            columns=_get_empty_atom_columns(),
+            capacity=num_atoms,
+        )
+        self._bond_columns = _ColumnsBuffer(_get_empty_bond_columns())
+        self._num_atoms = 0
+        self._num_bonds = 0
+        # Maps the id of each building block placement to the
+        # placed building block.
+        self._building_blocks = ()
         self._edge_functional_groups = {}
-        self._num_placements = 0
+        # Created from the columns when first requested.
+        self._atoms = None
+        self._bonds = None
 
     def clone(self):
         """
@@ -53,20 +99,65 @@ class MoleculeState:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        clone._position_matrix = np.array(self._position_matrix)
-        clone._atoms = list(self._atoms)
-        clone._atom_infos = list(self._atom_infos)
-        clone._bonds = list(self._bonds)
-        clone._bond_infos = list(self._bond_infos)
-        clone._num_placements = self._num_placements
-
-        edge_functional_groups = self._edge_functional_groups.items()
-        clone._edge_functional_groups = {
-            edge_id: list(functional_groups)
-            for edge_id, functional_groups in edge_functional_groups
-        }
+        # None of these are modified in place, so they can be
+        # shared.
+        clone._position_buffer = self._position_buffer
+        clone._position_matrix = self._position_matrix
+        clone._atom_columns = self._atom_columns
+        clone._bond_columns = self._bond_columns
+        clone._num_atoms = self._num_atoms
+        clone._num_bonds = self._num_bonds
+        clone._building_blocks = self._building_blocks
+        clone._edge_functional_groups = self._edge_functional_groups
+        clone._atoms = self._atoms
+        clone._bonds = self._bonds
         return clone
 
+    def _with_atom_columns(self, columns):
+        """
+        Add rows to the atom columns.
+
+        Parameters
+        ----------
+        columns : :class:`._AtomColumns`
+            The rows to add.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._atom_columns = self._atom_columns.with_rows(
+            num_rows=self._num_atoms,
+            rows=columns,
+        )
+        self._num_atoms += len(columns.atomic_numbers)
+        self._atoms = None
+        self._bonds = None
+
+    def _with_bond_columns(self, columns):
+        """
+        Add rows to the bond columns.
+
+        Parameters
+        ----------
+        columns : :class:`._BondColumns`
+            The rows to add.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._bond_columns = self._bond_columns.with_rows(
+            num_rows=self._num_bonds,
+            rows=columns,
+        )
+        self._num_bonds += len(columns.atom1_ids)
+        self._bonds = None
+
     def _with_placement_results(
         self,
         vertices,
@@ -79,31 +170,43 @@ class MoleculeState:
 
         """
 
+        building_blocks = tuple(building_blocks)
+        (
+            self._position_buffer,
+            new_positions,
+        ) = self._position_buffer.with_empty_rows(
+            num_rows=self._num_atoms,
+            num_new_rows=sum(
+                building_block.get_num_atoms()
+                for building_block in building_blocks
+            ),
+        )
         summary = _PlacementsSummary(
             building_blocks=building_blocks,
             placement_results=results,
-            num_atoms=len(self._atoms),
-            num_previous_placements=self._num_placements,
+            num_atoms=self._num_atoms,
+            num_previous_placements=len(self._building_blocks),
+            position_matrix=new_positions.positions,
         )
-        self._num_placements += len(vertices)
-        self._atoms.extend(summary.get_atoms())
-        self._atom_infos.extend(summary.get_atom_infos())
-        self._bonds.extend(summary.get_bonds())
-        self._bond_infos.extend(summary.get_bond_infos())
-        self._position_matrix = np.concatenate(
-            [
-                self._position_matrix,
-                summary.get_position_matrix(),
-            ]
+        self._building_blocks = (
+            *self._building_blocks,
+            *summary.get_building_blocks(),
         )
+        self._with_atom_columns(summary.get_atom_columns())
+        self._with_bond_columns(summary.get_bond_columns())
+        self._position_matrix = self._position_buffer.get_rows(
+            self._num_atoms
+        ).positions
+        edge_functional_groups = dict(self._edge_functional_groups)
         for (
             edge_id,
             functional_groups,
         ) in summary.get_edge_functional_groups():
-            self._edge_functional_groups[edge_id] = (
-                self._edge_functional_groups.get(edge_id, [])
+            edge_functional_groups[edge_id] = (
+                *edge_functional_groups.get(edge_id, ()),
+                *functional_groups,
             )
-            self._edge_functional_groups[edge_id].extend(functional_groups)
+        self._edge_functional_groups = edge_functional_groups
         return self
 
     def with_placement_results(
@@ -161,6 +264,85 @@ class MoleculeState:
 
         return np.array(self._position_matrix)
 
+    def _get_atoms(self):
+        """
+        Get the atoms of the molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Atom`
+            The atoms of the molecule.
+
+        """
+
+        if self._atoms is None:
+            columns = self._atom_columns.get_rows(self._num_atoms)
+            self._atoms = tuple(
+                map(
+                    Atom._init_element,
+                    it.count(),
+                    columns.atomic_numbers.tolist(),
+                    columns.charges.tolist(),
+                )
+            )
+        return self._atoms
+
+    def _get_bonds(self):
+        """
+        Get the bonds of the molecule.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.Bond`
+            The bonds of the molecule.
+
+        """
+
+        if self._bonds is None:
+            atoms = self._get_atoms()
+            columns = self._bond_columns.get_rows(self._num_bonds)
+            self._bonds = tuple(
+                Bond(
+                    atom1=atoms[atom1_id],
+                    atom2=atoms[atom2_id],
+                    order=order,
+                    periodicity=tuple(periodicity),
+                )
+                for atom1_id, atom2_id, order, periodicity in zip(
+                    columns.atom1_ids.tolist(),
+                    columns.atom2_ids.tolist(),
+                    columns.orders.tolist(),
+                    columns.periodicities.tolist(),
+                )
+            )
+        return self._bonds
+
+    def get_num_atoms(self):
+        """
+        Get the number of atoms in the molecule.
+
+        Returns
+        -------
+        :class:`int`
+            The number of atoms.
+
+        """
+
+        return self._num_atoms
+
+    def get_num_bonds(self):
+        """
+        Get the number of bonds in the molecule.
+
+        Returns
+        -------
+        :class:`int`
+            The number of bonds.
+
+        """
+
+        return self._num_bonds
+
     def get_atoms(self):
         """
         Yield the atoms of the molecule.
@@ -172,7 +354,7 @@ class MoleculeState:
 
         """
 
-        yield from self._atoms
+        yield from self._get_atoms()
 
     def get_bonds(self):
         """
@@ -185,7 +367,33 @@ class MoleculeState:
 
         """
 
-        yield from self._bonds
+        yield from self._get_bonds()
+
+    def get_atom_columns(self):
+        """
+        Get the per-atom columns of the molecule.
+
+        Returns
+        -------
+        :class:`._AtomColumns`
+            Read-only views of the columns, with a row for each atom.
+
+        """
+
+        return self._atom_columns.get_rows(self._num_atoms)
+
+    def get_bond_columns(self):
+        """
+        Get the per-bond columns of the molecule.
+
+        Returns
+        -------
+        :class:`._BondColumns`
+            Read-only views of the columns, with a row for each bond.
+
+        """
+
+        return self._bond_columns.get_rows(self._num_bonds)
 
     def get_atom_infos(self):
         """
@@ -198,7 +406,34 @@ class MoleculeState:
 
         """
 
-        yield from self._atom_infos
+        columns = self._atom_columns.get_rows(self._num_atoms)
+        building_block_atoms = {}
+        for atom, building_block_id, building_block_atom_id in zip(
+            self._get_atoms(),
+            columns.building_block_ids.tolist(),
+            columns.building_block_atom_ids.tolist(),
+        ):
+            if building_block_id == -1:
+                yield AtomInfo(
+                    atom=atom,
+                    building_block_atom=None,
+                    building_block=None,
+                    building_block_id=None,
+                )
+                continue
+
+            building_block = self._building_blocks[building_block_id]
+            atoms = building_block_atoms.get(building_block)
+            if atoms is None:
+                atoms = building_block_atoms[building_block] = tuple(
+                    building_block.get_atoms()
+                )
+            yield AtomInfo(
+                atom=atom,
+                building_block_atom=atoms[building_block_atom_id],
+                building_block=building_block,
+                building_block_id=building_block_id,
+            )
 
     def get_bond_infos(self):
         """
@@ -211,7 +446,23 @@ class MoleculeState:
 
         """
 
-        yield from self._bond_infos
+        columns = self._bond_columns.get_rows(self._num_bonds)
+        for bond, building_block_id in zip(
+            self._get_bonds(),
+            columns.building_block_ids.tolist(),
+        ):
+            if building_block_id == -1:
+                yield BondInfo(
+                    bond=bond,
+                    building_block=None,
+                    building_block_id=None,
+                )
+            else:
+                yield BondInfo(
+                    bond=bond,
+                    building_block=self._building_blocks[building_block_id],
+                    building_block_id=building_block_id,
+                )
 
     def get_edge_group_functional_groups(self, edge_group):
         """
@@ -258,7 +509,13 @@ class MoleculeState:
 
         """
 
-        self._position_matrix = np.array(position_matrix)
+        position_matrix = np.array(position_matrix, dtype=np.float64)
+        self._position_buffer = _ColumnsBuffer(
+            columns=_PositionColumns(position_matrix),
+        )
+        self._position_matrix = self._position_buffer.get_rows(
+            len(position_matrix)
+        ).positions
         return self
 
     def with_reaction_results(self, reactions, results):
@@ -290,16 +547,14 @@ class MoleculeState:
         """
 
         reactions_summary = _ReactionsSummary(
-            num_atoms=len(self._atoms),
+            num_atoms=self._num_atoms,
             reaction_results=results,
         )
         self._with_reactions_summary(reactions_summary)
         self._with_deletions_summary(
             _DeletionsSummary(
-                atoms=self._atoms,
-                atom_infos=self._atom_infos,
-                bonds=self._bonds,
-                bond_infos=self._bond_infos,
+                atom_columns=self._atom_columns.get_rows(self._num_atoms),
+                bond_columns=self._bond_columns.get_rows(self._num_bonds),
                 position_matrix=self._position_matrix,
                 deleted_atom_ids=reactions_summary.get_deleted_atom_ids(),
                 deleted_bond_ids=reactions_summary.get_deleted_bond_ids(),
@@ -322,19 +577,19 @@ class MoleculeState:
 
         """
 
-        self._atoms.extend(summary.get_atoms())
-        self._atom_infos.extend(summary.get_atom_infos())
-        self._bonds.extend(summary.get_bonds())
-        self._bond_infos.extend(summary.get_bond_infos())
-
-        positions = tuple(summary.get_positions())
-        if positions:
-            self._position_matrix = np.vstack(
-                [
-                    self._position_matrix,
-                    positions,
-                ]
-            )
+        positions = np.array(
+            tuple(summary.get_positions()),
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        self._position_buffer = self._position_buffer.with_rows(
+            num_rows=self._num_atoms,
+            rows=_PositionColumns(positions),
+        )
+        self._with_atom_columns(summary.get_atom_columns())
+        self._with_bond_columns(summary.get_bond_columns())
+        self._position_matrix = self._position_buffer.get_rows(
+            self._num_atoms
+        ).positions
 
     def _with_deletions_summary(self, summary):
         """
@@ -351,9 +606,17 @@ class MoleculeState:
 
         """
 
-        self._atoms = list(summary.get_atoms())
-        self._atom_infos = list(summary.get_atom_infos())
-        self._bonds = list(summary.get_bonds())
-        self._bond_infos = list(summary.get_bond_infos())
-        self._position_matrix = np.array(list(summary.get_positions()))
-        return self
+        atom_columns = summary.get_atom_columns()
+        bond_columns = summary.get_bond_columns()
+        self._atom_columns = _ColumnsBuffer(atom_columns)
+        self._bond_columns = _ColumnsBuffer(bond_columns)
+        self._num_atoms = len(atom_columns.atomic_numbers)
+        self._num_bonds = len(bond_columns.atom1_ids)
+        self._position_buffer = _ColumnsBuffer(
+            columns=_PositionColumns(summary.get_position_matrix()),
+        )
+        self._position_matrix = self._position_buffer.get_rows(
+            self._num_atoms
+        ).positions
+        self._atoms = None
+        self._bonds = None
@@ -6,11 +6,9 @@ Atom Batch
 
 from __future__ import annotations
 
-from typing import Iterable
+import numpy as np
 
-from stk._internal.atom import Atom
-from stk._internal.atom_info import AtomInfo
-from stk._internal.building_block import BuildingBlock
+from ..columns import _AtomColumns
 
 
 class _AtomBatch:
@@ -19,17 +17,15 @@ class _AtomBatch:
 
     """
 
-    __slots__ = ["_atoms", "_atom_infos", "_id_map"]
+    __slots__ = ["_columns", "_id_map"]
 
-    _atoms: tuple[Atom, ...]
-    _atom_infos: tuple[AtomInfo, ...]
+    _columns: _AtomColumns
     _id_map: dict[int, int]
 
     def __init__(
         self,
-        atoms: Iterable[Atom],
+        atoms: _AtomColumns,
         num_atoms: int,
-        building_block: BuildingBlock,
         building_block_id: int,
     ) -> None:
         """
@@ -38,71 +34,53 @@ class _AtomBatch:
         Parameters:
 
             atoms:
-                The atoms, which should be added to the batch.
+                The atoms of the building block, which should be added
+                to the batch.
 
             num_atoms:
                 The number of atoms in the molecule being constructed,
                 before atoms in this batch are taken into account.
 
-            building_block:
-                The building block from which the atoms originate.
-
             building_block_id:
                 An id, unique to that building block and placement.
 
         """
 
-        _atoms = []
-        atom_infos = []
-        self._id_map = {}
-
-        for id_, atom in enumerate(atoms, num_atoms):
-            _atoms.append(atom.with_id(id_))
-            self._id_map[atom.get_id()] = _atoms[-1].get_id()
-            atom_infos.append(
-                AtomInfo(
-                    atom=_atoms[-1],
-                    building_block_atom=atom,
-                    building_block=building_block,
-                    building_block_id=building_block_id,
-                )
+        batch_size = len(atoms.atomic_numbers)
+        self._columns = atoms._replace(
+            building_block_ids=np.full(
+                shape=batch_size,
+                fill_value=building_block_id,
+                dtype=np.int64,
+            ),
+        )
+        self._id_map = dict(
+            zip(
+                range(batch_size),
+                range(num_atoms, num_atoms + batch_size),
             )
+        )
 
-        self._atoms = tuple(_atoms)
-        self._atom_infos = tuple(atom_infos)
-
-    def get_atoms(self) -> Iterable[Atom]:
-        """
-        Yield the atoms in the batch.
-
-        Yields:
-
-            An atom.
-
+    def get_columns(self) -> _AtomColumns:
         """
+        Get the columns of the atoms in the batch.
 
-        yield from self._atoms
-
-    def get_atom_infos(self) -> Iterable[AtomInfo]:
-        """
-        Yield info about the atoms in the batch.
-
-        Yields:
+        Returns:
 
-            Info about an atom in the batch.
+            The columns.
 
         """
 
-        yield from self._atom_infos
+        return self._columns
 
     def get_id_map(self) -> dict[int, int]:
         """
-        Get a mapping from the old atom id to the new atom.
+        Get a mapping from the old atom id to the new atom id.
 
         Returns:
 
-            Maps the id of an atom provided to the initializer, to
-            the id of the new, corresponding, atom held by the batch.
+            Maps the id of a building block atom, to the id of the
+            new, corresponding, atom held by the batch.
 
         """
 
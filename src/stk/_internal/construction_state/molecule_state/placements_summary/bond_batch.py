@@ -6,11 +6,9 @@ Bond Batch
 
 from __future__ import annotations
 
-from typing import Iterable
+import numpy as np
 
-from stk._internal.bond import Bond
-from stk._internal.bond_info import BondInfo
-from stk._internal.building_block import BuildingBlock
+from ..columns import _BondColumns
 
 
 class _BondBatch:
@@ -19,16 +17,14 @@ class _BondBatch:
 
     """
 
-    __slots__ = ["_bonds", "_bond_infos"]
+    __slots__ = ["_columns"]
 
-    _bonds: list[Bond]
-    _bond_infos: list[BondInfo]
+    _columns: _BondColumns
 
     def __init__(
         self,
-        bonds: Iterable[Bond],
-        id_map: dict[int, int],
-        building_block: BuildingBlock,
+        bonds: _BondColumns,
+        num_atoms: int,
         building_block_id: int,
     ) -> None:
         """
@@ -37,54 +33,37 @@ class _BondBatch:
         Parameters:
 
             bonds:
-                The bonds, which should be added to the batch.
+                The bonds of the building block, which should be
+                added to the batch.
 
-            id_map:
-                Maps the ids of atoms held by `bonds`, to the new
-                atoms, which the bonds in the :class:`.BondBatch`
-                instance should hold.
-
-            building_block:
-                The building block from which the bonds originate.
+            num_atoms:
+                The number of atoms in the molecule being constructed,
+                before atoms of the building block are taken into
+                account.
 
             building_block_id:
                 An id, unique to that building block and placement.
 
         """
 
-        self._bonds = []
-        self._bond_infos = []
-
-        for bond in bonds:
-            self._bonds.append(bond.with_ids(id_map))
-            self._bond_infos.append(
-                BondInfo(
-                    bond=self._bonds[-1],
-                    building_block=building_block,
-                    building_block_id=building_block_id,
-                )
-            )
-
-    def get_bonds(self) -> Iterable[Bond]:
-        """
-        Yield the bonds in the batch.
-
-        Yields:
-
-            A bond in the batch.
-
-        """
-
-        yield from self._bonds
-
-    def get_bond_infos(self) -> Iterable[BondInfo]:
+        self._columns = bonds._replace(
+            atom1_ids=bonds.atom1_ids + num_atoms,
+            atom2_ids=bonds.atom2_ids + num_atoms,
+            building_block_ids=np.full(
+                shape=len(bonds.atom1_ids),
+                fill_value=building_block_id,
+                dtype=np.int64,
+            ),
+        )
+
+    def get_columns(self) -> _BondColumns:
         """
-        Yield info about the bonds in the batch.
+        Get the columns of the bonds in the batch.
 
-        Yields:
+        Returns:
 
-            Info about a bond in the batch.
+            The columns.
 
         """
 
-        yield from self._bond_infos
+        return self._columns
@@ -9,10 +9,6 @@ from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
 
-from stk._internal.atom import Atom
-from stk._internal.atom_info import AtomInfo
-from stk._internal.bond import Bond
-from stk._internal.bond_info import BondInfo
 from stk._internal.functional_groups.functional_group import (
     FunctionalGroup,
 )
@@ -20,6 +16,13 @@ from stk._internal.topology_graphs.topology_graph.utilities import (
     _PlacementResult,
 )
 
+from ..columns import (
+    _AtomColumns,
+    _BondColumns,
+    _concatenate_columns,
+    _get_empty_atom_columns,
+    _get_empty_bond_columns,
+)
 from .atom_batch import _AtomBatch
 from .bond_batch import _BondBatch
 
@@ -34,21 +37,27 @@ class _PlacementsSummary:
     """
 
     __slots__ = [
-        "_atoms",
-        "_atom_infos",
-        "_bonds",
-        "_bond_infos",
+        "_building_blocks",
+        "_building_block_columns",
+        "_atom_columns",
+        "_bond_columns",
         "_edge_functional_groups",
-        "_position_matrices",
+        "_position_matrix",
         "_num_atoms",
+        "_num_previous_atoms",
     ]
 
-    _atoms: list[Atom]
-    _atom_infos: list[AtomInfo]
-    _bonds: list[Bond]
-    _bond_infos: list[BondInfo]
+    _building_blocks: list["BuildingBlock"]
+    _building_block_columns: dict[
+        "BuildingBlock",
+        tuple[_AtomColumns, _BondColumns],
+    ]
+    _atom_columns: list[_AtomColumns]
+    _bond_columns: list[_BondColumns]
     _edge_functional_groups: defaultdict[int, list[FunctionalGroup]]
-    _position_matrices: list[np.ndarray]
+    _position_matrix: np.ndarray
+    _num_atoms: int
+    _num_previous_atoms: int
 
     def __init__(
         self,
@@ -56,6 +65,7 @@ class _PlacementsSummary:
         placement_results: Iterable[_PlacementResult],
         num_atoms: int,
         num_previous_placements: int,
+        position_matrix: np.ndarray,
     ) -> None:
         """
         Initialize a :class:`._PlacementsSummary` instance.
@@ -77,16 +87,22 @@ class _PlacementsSummary:
                 The total number of building block placements done
                 previously.
 
+            position_matrix:
+                A writable ``(n, 3)`` array, with a row for every atom
+                in `building_blocks`. It is filled in place with the
+                positions of the placed atoms.
+
         """
-        self._atoms = []
-        self._atom_infos = []
-        self._bonds = []
-        self._bond_infos = []
+        self._building_blocks = []
+        self._building_block_columns = {}
+        self._atom_columns = []
+        self._bond_columns = []
         self._edge_functional_groups = defaultdict(list)
-        self._position_matrices = []
+        self._position_matrix = position_matrix
         # This will get updated as placement results are added to the
         # summary.
         self._num_atoms = num_atoms
+        self._num_previous_atoms = num_atoms
 
         for id_, (building_block, result) in enumerate(
             zip(building_blocks, placement_results),
@@ -95,6 +111,72 @@ class _PlacementsSummary:
             self._with_placement_result(building_block, id_, result)
             self._num_atoms += building_block.get_num_atoms()
 
+    def _get_building_block_columns(
+        self,
+        building_block: "BuildingBlock",
+    ) -> tuple[_AtomColumns, _BondColumns]:
+        """
+        Get the atom and bond columns of a building block.
+
+        The columns are calculated only once for every building
+        block in the summary.
+
+        Parameters:
+
+            building_block:
+                The building block.
+
+        Returns:
+
+            The atom and bond columns of `building_block`. Atom ids
+            are the ones used by `building_block`.
+
+        """
+
+        columns = self._building_block_columns.get(building_block)
+        if columns is not None:
+            return columns
+
+        atoms = tuple(building_block.get_atoms())
+        bonds = tuple(building_block.get_bonds())
+        columns = self._building_block_columns[building_block] = (
+            _AtomColumns(
+                atomic_numbers=np.array(
+                    [atom.get_atomic_number() for atom in atoms],
+                    dtype=np.int64,
+                ),
+                charges=np.array(
+                    [atom.get_charge() for atom in atoms],
+                    dtype=np.int64,
+                ),
+                building_block_ids=np.empty(len(atoms), dtype=np.int64),
+                building_block_atom_ids=np.array(
+                    [atom.get_id() for atom in atoms],
+                    dtype=np.int64,
+                ),
+            ),
+            _BondColumns(
+                atom1_ids=np.array(
+                    [bond.get_atom1().get_id() for bond in bonds],
+                    dtype=np.int64,
+                ),
+                atom2_ids=np.array(
+                    [bond.get_atom2().get_id() for bond in bonds],
+                    dtype=np.int64,
+                ),
+                orders=np.array(
+                    [bond.get_order() for bond in bonds],
+                    dtype=object,
+                ),
+                periodicities=np.array(
+                    [bond.get_periodicity() for bond in bonds],
+                    dtype=np.int64,
+                ).reshape(-1, 3),
+                building_block_ids=np.empty(len(bonds), dtype=np.int64),
+            ),
+        )
+        return columns
+
     def _with_placement_result(
         self,
         building_block: "BuildingBlock",
@@ -117,67 +199,35 @@ class _PlacementsSummary:
 
         """
 
-        self._position_matrices.append(result.position_matrix)
+        self._building_blocks.append(building_block)
+        start = self._num_atoms - self._num_previous_atoms
+        self._position_matrix[
+            start : start + building_block.get_num_atoms()
+        ] = result.position_matrix
+        atom_columns, bond_columns = self._get_building_block_columns(
+            building_block=building_block,
+        )
 
         atom_batch = _AtomBatch(
-            atoms=building_block.get_atoms(),
+            atoms=atom_columns,
             num_atoms=self._num_atoms,
-            building_block=building_block,
             building_block_id=building_block_id,
         )
-        self._with_atom_batch(atom_batch)
-        id_map = atom_batch.get_id_map()
+        self._atom_columns.append(atom_batch.get_columns())
 
         bond_batch = _BondBatch(
-            bonds=building_block.get_bonds(),
-            id_map=id_map,
-            building_block=building_block,
+            bonds=bond_columns,
+            num_atoms=self._num_atoms,
             building_block_id=building_block_id,
         )
-        self._with_bond_batch(bond_batch)
+        self._bond_columns.append(bond_batch.get_columns())
 
         self._with_functional_group_edges(
             building_block=building_block,
             functional_group_edges=result.functional_group_edges,
-            id_map=id_map,
+            id_map=atom_batch.get_id_map(),
         )
 
-    def _with_atom_batch(self, batch):
-        """
-        Add a batch of atoms to the summary.
-
-        Parameters
-        ----------
-        batch : :class:`._AtomBatch`
-            A batch of atoms.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
-
-        self._atoms.extend(batch.get_atoms())
-        self._atom_infos.extend(batch.get_atom_infos())
-
-    def _with_bond_batch(self, batch):
-        """
-        Add a batch of bonds to the summary.
-
-        Parameters
-        ----------
-        batch : :class:`.BondBatch`
-            A batch of bonds.
-
-        Returns
-        -------
-        None : :class:`NoneType`
-
-        """
-
-        self._bonds.extend(batch.get_bonds())
-        self._bond_infos.extend(batch.get_bond_infos())
-
     def _with_functional_group_edges(
         self,
         building_block: "BuildingBlock",
@@ -227,70 +277,47 @@ class _PlacementsSummary:
             )
             raise
 
-    def get_atoms(self):
-        """
-        Yield the atoms in the summary.
-
-        Yields
-        ------
-        :class:`.Atom`
-            An atom.
-
+    def get_building_blocks(self) -> Iterable["BuildingBlock"]:
         """
+        Yield the placed building blocks.
 
-        yield from self._atoms
+        Yields:
 
-    def get_atom_infos(self):
-        """
-        Yield infos about atoms in the summary.
-
-        Yields
-        ------
-        :class:`.AtomInfo`
-            Info about an atom.
+            A building block, in the order of its placement.
 
         """
 
-        yield from self._atom_infos
+        yield from self._building_blocks
 
-    def get_bonds(self):
+    def get_atom_columns(self) -> _AtomColumns:
         """
-        Yield the bonds in the summary.
-
-        Yields
-        ------
-        :class:`.Bond`
-            A bond.
+        Get the columns of the atoms in the summary.
 
-        """
+        Returns:
 
-        yield from self._bonds
+            The columns.
 
-    def get_bond_infos(self):
         """
-        Yield infos about the bonds in the summary.
 
-        Yields
-        ------
-        :class:`.BondInfo`
-            Info about a bond.
+        return _concatenate_columns(
+            columns=self._atom_columns,
+            empty=_get_empty_atom_columns(),
+        )
 
+    def get_bond_columns(self) -> _BondColumns:
         """
+        Get the columns of the bonds in the summary.
 
-        yield from self._bond_infos
+        Returns:
 
-    def get_position_matrix(self):
-        """
-        Get a position matrix for the atoms in the summary.
-
-        Returns
-        -------
-        :class:`numpy.ndarray`
-            The position matrix.
+            The columns.
 
         """
 
-        return np.vstack(self._position_matrices)
+        return _concatenate_columns(
+            columns=self._bond_columns,
+            empty=_get_empty_bond_columns(),
+        )
 
     def get_edge_functional_groups(self):
         """
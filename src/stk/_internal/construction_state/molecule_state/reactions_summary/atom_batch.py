@@ -4,8 +4,6 @@ Atom Batch
 
 """
 
-from stk._internal.atom_info import AtomInfo
-
 
 class _AtomBatch:
     """
@@ -13,7 +11,12 @@ class _AtomBatch:
 
     """
 
-    __slots__ = ["_atoms", "_atom_infos", "_atom_map", "_positions"]
+    __slots__ = [
+        "_atomic_numbers",
+        "_charges",
+        "_id_map",
+        "_positions",
+    ]
 
     def __init__(self, atoms, num_atoms):
         """
@@ -30,22 +33,15 @@ class _AtomBatch:
 
         """
 
-        self._atoms = _atoms = []
+        self._atomic_numbers = atomic_numbers = []
+        self._charges = charges = []
         self._positions = positions = []
-        self._atom_infos = atom_infos = []
-        self._atom_map = atom_map = {}
+        self._id_map = id_map = {}
 
         for id_, (atom, position) in enumerate(atoms, num_atoms):
-            _atoms.append(atom.with_id(id_))
-            atom_map[atom.get_id()] = _atoms[-1]
-            atom_infos.append(
-                AtomInfo(
-                    atom=_atoms[-1],
-                    building_block_atom=None,
-                    building_block=None,
-                    building_block_id=None,
-                )
-            )
+            atomic_numbers.append(atom.get_atomic_number())
+            charges.append(atom.get_charge())
+            id_map[atom.get_id()] = id_
             positions.append(position)
 
     def get_positions(self):
@@ -61,42 +57,42 @@ class _AtomBatch:
 
         yield from self._positions
 
-    def get_atoms(self):
+    def get_atomic_numbers(self):
         """
-        Yield the atoms in the batch.
+        Yield the atomic numbers of atoms in the batch.
 
         Yields
         ------
-        :class:`.Atom`
-            An atom.
+        :class:`int`
+            The atomic number of an atom in the batch.
 
         """
 
-        yield from self._atoms
+        yield from self._atomic_numbers
 
-    def get_atom_infos(self):
+    def get_charges(self):
         """
-        Yield info about the atoms in the batch.
+        Yield the charges of atoms in the batch.
 
         Yields
         ------
-        :class:`.AtomInfo`
-            Info about an atom in the batch.
+        :class:`int`
+            The charge of an atom in the batch.
 
         """
 
-        yield from self._atom_infos
+        yield from self._charges
 
-    def get_atom_map(self):
+    def get_id_map(self):
         """
-        Get a mapping from the old atom id to the new atom.
+        Get a mapping from the old atom id to the new atom id.
 
         Returns
         -------
         :class:`dict`
             Maps the id of an atom provided to the initializer, to
-            the new atom held by the batch, which has an updated id.
+            the id the atom has in the batch.
 
         """
 
-        return dict(self._atom_map)
+        return dict(self._id_map)
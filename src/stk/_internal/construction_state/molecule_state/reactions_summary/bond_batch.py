@@ -5,8 +5,6 @@ Bond Batch
 
 """
 
-from stk._internal.bond_info import BondInfo
-
 
 class _BondBatch:
     """
@@ -14,9 +12,14 @@ class _BondBatch:
 
     """
 
-    __slots__ = ["_bonds", "_bond_infos"]
+    __slots__ = [
+        "_atom1_ids",
+        "_atom2_ids",
+        "_orders",
+        "_periodicities",
+    ]
 
-    def __init__(self, bonds, atom_map):
+    def __init__(self, bonds, id_map):
         """
         Initialize a :class:`.BondBatch` instance.
 
@@ -25,42 +28,74 @@ class _BondBatch:
         bonds : :class:`iterable` of :class:`.Bond`
             The bonds, which should be added to the batch.
 
-        atom_map : :class:`dict`
-            Maps the ids of atoms held by `bonds`, to the new atoms,
-            which the bonds in the :class:`.BondBatchData` instance
-            should hold.
+        id_map : :class:`dict`
+            Maps the ids of atoms held by `bonds`, to the new ids,
+            which the bonds in the :class:`.BondBatch` instance
+            should hold. Ids missing from `id_map` are kept.
 
         """
 
-        self._bonds = _bonds = []
-        self._bond_infos = bond_infos = []
+        self._atom1_ids = atom1_ids = []
+        self._atom2_ids = atom2_ids = []
+        self._orders = orders = []
+        self._periodicities = periodicities = []
 
         for bond in bonds:
-            _bonds.append(bond.with_atoms(atom_map))
-            bond_infos.append(BondInfo(_bonds[-1], None, None))
+            atom1_id = bond.get_atom1().get_id()
+            atom2_id = bond.get_atom2().get_id()
+            atom1_ids.append(id_map.get(atom1_id, atom1_id))
+            atom2_ids.append(id_map.get(atom2_id, atom2_id))
+            orders.append(bond.get_order())
+            periodicities.append(bond.get_periodicity())
+
+    def get_atom1_ids(self):
+        """
+        Yield the ids of the first atom of each bond in the batch.
+
+        Yields
+        ------
+        :class:`int`
+            The id of the first atom of a bond.
+
+        """
+
+        yield from self._atom1_ids
+
+    def get_atom2_ids(self):
+        """
+        Yield the ids of the second atom of each bond in the batch.
+
+        Yields
+        ------
+        :class:`int`
+            The id of the second atom of a bond.
+
+        """
+
+        yield from self._atom2_ids
 
-    def get_bonds(self):
+    def get_orders(self):
         """
-        Yield the bonds in the batch.
+        Yield the orders of bonds in the batch.
 
         Yields
         ------
-        :class:`.Bond`
-            A bond in the batch.
+        :class:`int`
+            The order of a bond.
 
         """
 
-        yield from self._bonds
+        yield from self._orders
 
-    def get_bond_infos(self):
+    def get_periodicities(self):
         """
-        Yield info about the bonds in the batch.
+        Yield the periodicities of bonds in the batch.
 
         Yields
         ------
-        :class:`.BondInfo`
-            Info about a bond in the batch.
+        :class:`tuple` of :class:`int`
+            The periodicity of a bond.
 
         """
 
-        yield from self._bond_infos
+        yield from self._periodicities
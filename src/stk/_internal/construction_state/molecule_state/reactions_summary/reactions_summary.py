@@ -6,6 +6,9 @@ Reactions Summary
 
 from typing import NamedTuple
 
+import numpy as np
+
+from ..columns import _AtomColumns, _BondColumns
 from .atom_batch import _AtomBatch
 from .bond_batch import _BondBatch
 
@@ -36,11 +39,13 @@ class _ReactionsSummary:
 
     __slots__ = [
         "_num_atoms",
-        "_atoms",
-        "_atom_infos",
+        "_atomic_numbers",
+        "_charges",
         "_positions",
-        "_bonds",
-        "_bond_infos",
+        "_bond_atom1_ids",
+        "_bond_atom2_ids",
+        "_bond_orders",
+        "_bond_periodicities",
         "_deleted_atom_ids",
         "_deleted_bond_ids",
     ]
@@ -64,11 +69,13 @@ class _ReactionsSummary:
         # This will get updated as reaction results are added to the
         # summary.
         self._num_atoms = num_atoms
-        self._atoms = []
-        self._atom_infos = []
+        self._atomic_numbers = []
+        self._charges = []
         self._positions = []
-        self._bonds = []
-        self._bond_infos = []
+        self._bond_atom1_ids = []
+        self._bond_atom2_ids = []
+        self._bond_orders = []
+        self._bond_periodicities = []
         self._deleted_atom_ids = set()
         self._deleted_bond_ids = set()
 
@@ -99,7 +106,7 @@ class _ReactionsSummary:
 
         bond_batch = _BondBatch(
             bonds=result.get_new_bonds(),
-            atom_map=atom_batch.get_atom_map(),
+            id_map=atom_batch.get_id_map(),
         )
         self._with_bond_batch(bond_batch)
 
@@ -130,8 +137,8 @@ class _ReactionsSummary:
 
         """
 
-        self._atoms.extend(batch.get_atoms())
-        self._atom_infos.extend(batch.get_atom_infos())
+        self._atomic_numbers.extend(batch.get_atomic_numbers())
+        self._charges.extend(batch.get_charges())
         self._positions.extend(batch.get_positions())
 
     def _with_bond_batch(self, batch):
@@ -149,60 +156,55 @@ class _ReactionsSummary:
 
         """
 
-        self._bonds.extend(batch.get_bonds())
-        self._bond_infos.extend(batch.get_bond_infos())
-
-    def get_atoms(self):
-        """
-        Yield the atoms in the summary.
-
-        Yields
-        ------
-        :class:`.Atom`
-            An atom.
-
-        """
-
-        yield from self._atoms
-
-    def get_atom_infos(self):
-        """
-        Yield infos about atoms in the summary.
-
-        Yields
-        ------
-        :class:`.AtomInfo`
-            Info about an atom.
-
-        """
-
-        yield from self._atom_infos
-
-    def get_bonds(self):
-        """
-        Yield the bonds in the summary.
-
-        Yields
-        ------
-        :class:`.Bond`
-            A bond.
+        self._bond_atom1_ids.extend(batch.get_atom1_ids())
+        self._bond_atom2_ids.extend(batch.get_atom2_ids())
+        self._bond_orders.extend(batch.get_orders())
+        self._bond_periodicities.extend(batch.get_periodicities())
 
+    def get_atom_columns(self):
         """
+        Get the columns of the atoms in the summary.
 
-        yield from self._bonds
+        Returns
+        -------
+        :class:`._AtomColumns`
+            The columns.
 
-    def get_bond_infos(self):
         """
-        Yield infos about the bonds in the summary.
 
-        Yields
-        ------
-        :class:`.BondInfo`
-            Info about a bond.
+        num_atoms = len(self._atomic_numbers)
+        return _AtomColumns(
+            atomic_numbers=np.array(self._atomic_numbers, dtype=np.int64),
+            charges=np.array(self._charges, dtype=np.int64),
+            building_block_ids=np.full(num_atoms, -1, dtype=np.int64),
+            building_block_atom_ids=np.full(num_atoms, -1, dtype=np.int64),
+        )
 
+    def get_bond_columns(self):
         """
+        Get the columns of the bonds in the summary.
 
-        yield from self._bond_infos
+        Returns
+        -------
+        :class:`._BondColumns`
+            The columns.
+
+        """
+
+        return _BondColumns(
+            atom1_ids=np.array(self._bond_atom1_ids, dtype=np.int64),
+            atom2_ids=np.array(self._bond_atom2_ids, dtype=np.int64),
+            orders=np.array(self._bond_orders, dtype=object),
+            periodicities=np.array(
+                self._bond_periodicities,
+                dtype=np.int64,
+            ).reshape(-1, 3),
+            building_block_ids=np.full(
+                shape=len(self._bond_orders),
+                fill_value=-1,
+                dtype=np.int64,
+            ),
+        )
 
     def get_deleted_atom_ids(self):
         """
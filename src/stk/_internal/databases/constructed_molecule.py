@@ -60,6 +60,56 @@ class ConstructedMoleculeDatabase:
 
         raise NotImplementedError()
 
+    def put_many(self, molecules):
+        """
+        Put many molecules into the database.
+
+        By default, this calls :meth:`.put` on each molecule, but
+        subclasses can override it to write them in bulk.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.ConstructedMolecule`
+            The molecules to place into the database.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        for molecule in molecules:
+            self.put(molecule)
+
+    def get_many(self, keys):
+        """
+        Get the molecules with `keys` from the database.
+
+        By default, this calls :meth:`.get` on each key, but
+        subclasses can override it to read them in bulk.
+
+        Parameters
+        ----------
+        keys : :class:`iterable` of :class:`object`
+            The keys of the molecules, which are to be returned from
+            the database.
+
+        Yields
+        ------
+        :class:`.ConstructedMolecule`
+            The molecule held in the database under each key, in the
+            order of `keys`.
+
+        Raises
+        ------
+        :class:`KeyError`
+            If any key is not found in the database.
+
+        """
+
+        for key in keys:
+            yield self.get(key)
+
     def get_all(self):
         """
         Get all entries in the database.
@@ -0,0 +1,271 @@
+"""
+Database Caches
+===============
+
+"""
+
+import collections
+import sys
+import threading
+import typing
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import numpy as np
+
+from stk._internal.atom import Atom
+from stk._internal.atom_info import AtomInfo
+from stk._internal.bond import Bond
+from stk._internal.bond_info import BondInfo
+
+
+class CacheInfo(typing.NamedTuple):
+    """
+    Statistics of a :class:`.LruCache`.
+
+    Attributes:
+
+        hits:
+            The number of calls, which were found in the cache.
+
+        misses:
+            The number of calls, which were not found in the cache.
+
+        evictions:
+            The number of entries removed to make space for new ones.
+
+        maxsize:
+            The maximum number of entries, or ``None`` if unbounded.
+
+        currsize:
+            The number of entries.
+
+        max_bytes:
+            The maximum estimated size of all entries, in bytes, or
+            ``None`` if unbounded.
+
+        num_bytes:
+            The estimated size of all entries, in bytes.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+    max_bytes: int | None
+    num_bytes: int
+
+
+class LruCache:
+    """
+    A least recently used cache, bounded by entries and by bytes.
+
+    Unlike :func:`functools.lru_cache`, the size of every entry is
+    estimated, so that a cache of large molecules cannot exhaust
+    memory.
+
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Any], Any],
+        maxsize: int | None,
+        max_bytes: int | None,
+        get_size: Callable[[Any, Any], int],
+        get_key: Callable[[Any], Hashable] | None = None,
+    ) -> None:
+        """
+        Parameters:
+
+            function:
+                The function to cache. It takes a single hashable
+                argument.
+
+            maxsize:
+                The maximum number of entries. If ``None``, the
+                number of entries is unbounded.
+
+            max_bytes:
+                The maximum estimated size of all entries, in bytes.
+                If ``None``, the size is unbounded.
+
+            get_size:
+                Takes the key and the result of `function` and
+                returns the estimated size of the entry, in bytes.
+
+            get_key:
+                Takes the argument of `function` and returns the key
+                its result is cached under. If ``None``, the argument
+                is the key. The argument itself is not kept by the
+                cache.
+
+        """
+
+        self._function = function
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._get_size = get_size
+        self._get_key = get_key
+        self._entries: collections.OrderedDict[
+            Hashable,
+            tuple[Any, int],
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._num_bytes = 0
+
+    def __call__(self, argument: Any) -> Any:
+        key = argument if self._get_key is None else self._get_key(argument)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry[0]
+            self._misses += 1
+
+        value = self._function(argument)
+        self._add(key, value)
+        return value
+
+    def _add(self, key: Hashable, value: Any) -> None:
+        if self._maxsize == 0:
+            return
+        size = self._get_size(key, value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._num_bytes -= old_entry[1]
+            self._entries[key] = (value, size)
+            self._num_bytes += size
+            while (
+                self._maxsize is not None
+                and len(self._entries) > self._maxsize
+            ) or (
+                self._max_bytes is not None
+                and self._num_bytes > self._max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._num_bytes -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove the entry of `key`, if there is one.
+
+        Parameters:
+
+            key:
+                The key of the entry to remove.
+
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._num_bytes -= entry[1]
+
+    def cache_clear(self) -> None:
+        """
+        Remove all entries and reset the statistics.
+
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._num_bytes = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get statistics of the cache.
+
+        Returns:
+
+            The statistics.
+
+        """
+
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+                max_bytes=self._max_bytes,
+                num_bytes=self._num_bytes,
+            )
+
+
+def get_molecule_size(molecule: Any) -> int:
+    """
+    Estimate the memory used by a molecule.
+
+    The estimate only needs the number of atoms and bonds, so it does
+    not create the atoms and bonds of a molecule which creates them
+    lazily.
+
+    Parameters:
+
+        molecule (Molecule):
+            The molecule.
+
+    Returns:
+
+        The estimated size of `molecule`, in bytes. Building blocks
+        of constructed molecules are not included, because they are
+        usually shared.
+
+    """
+
+    num_atoms = molecule.get_num_atoms()
+    num_bonds = molecule.get_num_bonds()
+    # Atoms, bonds and their infos use __slots__, so all instances
+    # of a class have the same size.
+    atom_size = Atom.__basicsize__
+    bond_size = Bond.__basicsize__
+    if hasattr(molecule, "get_atom_infos"):
+        atom_size += AtomInfo.__basicsize__
+        bond_size += BondInfo.__basicsize__
+    return (
+        sys.getsizeof(molecule)
+        + num_atoms * 3 * np.dtype(np.float64).itemsize
+        + num_atoms * atom_size
+        + num_bonds * bond_size
+    )
+
+
+def get_json_size(json: Any) -> int:
+    """
+    Estimate the memory used by a JSON.
+
+    Parameters:
+
+        json:
+            The JSON.
+
+    Returns:
+
+        The estimated size of `json`, in bytes.
+
+    """
+
+    size = sys.getsizeof(json)
+    if isinstance(json, dict):
+        size += sum(
+            get_json_size(key) + get_json_size(value)
+            for key, value in json.items()
+        )
+    elif isinstance(json, list | tuple):
+        size += sum(map(get_json_size, json))
+    return size
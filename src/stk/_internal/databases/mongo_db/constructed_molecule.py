@@ -1,14 +1,25 @@
-import itertools
-from functools import lru_cache
+import pymongo
 
 from stk._internal.json_serde.constructed_molecule import (
     ConstructedMoleculeDejsonizer,
     ConstructedMoleculeJsonizer,
 )
-from stk._internal.utilities.utilities import dedupe
 
 from ..constructed_molecule import ConstructedMoleculeDatabase
-from .utilities import HashableDict, get_any_value
+from .cache import LruCache, get_json_size, get_molecule_size
+from .utilities import (
+    HashableDict,
+    find_many,
+    find_many_by_any_key,
+    get_constructed_molecule_identity,
+    get_key_names,
+    get_keys,
+    get_map,
+    get_position_matrix,
+    get_query,
+    iter_batches,
+    iter_keys,
+)
 
 
 class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
@@ -359,7 +370,11 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         dejsonizer=ConstructedMoleculeDejsonizer(),
         put_lru_cache_size=128,
         get_lru_cache_size=128,
+        put_lru_cache_bytes=2**28,
+        get_lru_cache_bytes=2**28,
         indices=("InChIKey",),
+        building_block_lru_cache_size=128,
+        building_block_lru_cache_bytes=2**28,
     ):
         """
         Initialize a :class:`.ConstructedMoleculeMongoDb`.
@@ -411,10 +426,36 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
             the number of values which fit into the LRU cache. If
             ``None``, the cache size will be unlimited.
 
+        put_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the put
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
+        get_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the get
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
         indices : :class:`tuple` of :class:`str`, optional
             The names of molecule keys, on which an index should be
             created, in order to minimize lookup time.
 
+        building_block_lru_cache_size : :class:`int`, optional
+            A RAM-based least recently used cache is used to avoid
+            reading the same building block from the database
+            repeatedly, since many constructed molecules usually
+            share a few building blocks. This sets the number of
+            building blocks which fit into the LRU cache. If
+            ``None``, the cache size will be unlimited.
+
+        building_block_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the
+            building block LRU cache. Least recently used entries are
+            evicted to stay below it. If ``None``, only the number of
+            entries is bounded.
+
         """
 
         database = mongo_client[database]
@@ -427,8 +468,25 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
         self._jsonizer = jsonizer
         self._dejsonizer = dejsonizer
 
-        self._get = lru_cache(maxsize=get_lru_cache_size)(self._get)
-        self._put = lru_cache(maxsize=put_lru_cache_size)(self._put)
+        self._get = LruCache(
+            function=self._get,
+            maxsize=get_lru_cache_size,
+            max_bytes=get_lru_cache_bytes,
+            get_size=_get_get_entry_size,
+        )
+        self._put = LruCache(
+            function=self._put,
+            maxsize=put_lru_cache_size,
+            max_bytes=put_lru_cache_bytes,
+            get_size=_get_put_entry_size,
+            get_key=get_constructed_molecule_identity,
+        )
+        self._get_building_block = LruCache(
+            function=self._get_building_block,
+            maxsize=building_block_lru_cache_size,
+            max_bytes=building_block_lru_cache_bytes,
+            get_size=_get_building_block_entry_size,
+        )
 
         for index in indices:
             # Do not create the same index twice.
@@ -451,49 +509,16 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
                 )
 
     def put(self, molecule):
-        molecule = molecule.with_canonical_atom_ordering()
-        json = self._jsonizer.to_json(molecule)
-        # lru_cache requires that the parameters to the cached function
-        # are hashable objects.
-        json["matrix"]["m"] = tuple(tuple(row) for row in json["matrix"]["m"])
-        json["matrix"] = HashableDict(json["matrix"])
-        json["molecule"] = HashableDict(json["molecule"])
-        json["constructedMolecule"] = HashableDict(json["constructedMolecule"])
-        json["constructedMolecule"]["BB"] = tuple(
-            map(
-                HashableDict,
-                json["constructedMolecule"]["BB"],
-            )
+        # The cache is checked before canonical ordering and
+        # jsonization, so that repeated puts of the same molecule are
+        # cheap.
+        return self._put(molecule)
+
+    def _put(self, molecule):
+        json = self._jsonizer.to_json(
+            molecule.with_canonical_atom_ordering(),
         )
-
-        def make_hashable(json):
-            json["matrix"]["m"] = tuple(
-                tuple(row) for row in json["matrix"]["m"]
-            )
-            json["matrix"] = HashableDict(json["matrix"])
-            json["molecule"] = HashableDict(json["molecule"])
-            return HashableDict(json)
-
-        json["buildingBlocks"] = tuple(
-            map(
-                make_hashable,
-                json["buildingBlocks"],
-            )
-        )
-        return self._put(HashableDict(json))
-
-    @staticmethod
-    def _get_query(json):
-        keys = dict(json["matrix"])
-        keys.pop("m")
-
-        query = {"$or": []}
-        for key, value in keys.items():
-            query["$or"].append({key: value})
-        return query
-
-    def _put(self, json):
-        query = self._get_query(json)
+        query = get_query(json)
         self._molecules.update_many(
             filter=query,
             update={
@@ -522,7 +547,7 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
             upsert=True,
         )
         for building_block_json in json["buildingBlocks"]:
-            building_block_query = self._get_query(building_block_json)
+            building_block_query = get_query(building_block_json)
             self._molecules.update_many(
                 filter=building_block_query,
                 update={
@@ -538,6 +563,108 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
                 upsert=True,
             )
 
+    def put_many(self, molecules):
+        jsons = [
+            self._jsonizer.to_json(molecule.with_canonical_atom_ordering())
+            for molecule in molecules
+        ]
+        if not jsons:
+            return
+        self._add_many_building_block_keys_from_database(jsons)
+
+        molecule_requests = []
+        position_matrix_requests = []
+        constructed_molecule_requests = []
+        building_block_position_matrix_requests = []
+        for json in jsons:
+            query = get_query(json)
+            molecule_requests.append(
+                pymongo.UpdateMany(
+                    filter=query,
+                    update={"$set": json["molecule"]},
+                    upsert=True,
+                )
+            )
+            position_matrix_requests.append(
+                pymongo.UpdateMany(
+                    filter=query,
+                    update={"$set": json["matrix"]},
+                    upsert=True,
+                )
+            )
+            constructed_molecule_requests.append(
+                pymongo.UpdateMany(
+                    filter=query,
+                    update={"$set": json["constructedMolecule"]},
+                    upsert=True,
+                )
+            )
+            for building_block_json in json["buildingBlocks"]:
+                building_block_query = get_query(building_block_json)
+                molecule_requests.append(
+                    pymongo.UpdateMany(
+                        filter=building_block_query,
+                        update={"$set": building_block_json["molecule"]},
+                        upsert=True,
+                    )
+                )
+                building_block_position_matrix_requests.append(
+                    pymongo.UpdateMany(
+                        filter=building_block_query,
+                        update={"$set": building_block_json["matrix"]},
+                        upsert=True,
+                    )
+                )
+
+        self._molecules.bulk_write(molecule_requests)
+        self._position_matrices.bulk_write(position_matrix_requests)
+        self._constructed_molecules.bulk_write(constructed_molecule_requests)
+        if building_block_position_matrix_requests:
+            self._building_block_position_matrices.bulk_write(
+                building_block_position_matrix_requests,
+            )
+
+    def _add_many_building_block_keys_from_database(self, jsons):
+        """
+        Add previously deposited keys to the building block keys.
+
+        This does the same as
+        :meth:`._add_building_block_keys_from_database`, for many
+        constructed molecules, with a single query.
+
+        Parameters
+        ----------
+        jsons : :class:`list` of :class:`dict`
+            The JSON representations of the constructed molecules.
+            The building block keys of each are updated in-place.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        queries = [get_query(json)["$or"] for json in jsons]
+        matches = iter(
+            find_many(
+                collection=self._constructed_molecules,
+                keys=[key for query in queries for key in query],
+            )
+        )
+        for json, query in zip(jsons, queries):
+            # A constructed molecule entry can match more than one of
+            # the keys in the query, but should only be used once.
+            entries = {}
+            for _ in query:
+                for entry in next(matches):
+                    entries.setdefault(entry["_id"], entry)
+            for entry in entries.values():
+                for keys1, keys2 in zip(
+                    json["constructedMolecule"]["BB"],
+                    entry["BB"],
+                ):
+                    keys1.update(keys2)
+
     def _add_building_block_keys_from_database(
         self,
         query,
@@ -606,7 +733,7 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
                 keys1.update(keys2)
 
     def get(self, key):
-        # lru_cache requires that the parameters to the cached function
+        # The cache requires that the parameters to the cached function
         # are hashable objects.
         return self._get(HashableDict(key))
 
@@ -646,165 +773,335 @@ class ConstructedMoleculeMongoDb(ConstructedMoleculeDatabase):
                 f"of: {key}"
             )
 
-        return self._dejsonizer.from_json(
+        return self._dejsonizer._from_json(
             json={
                 "molecule": molecule_json,
                 "constructedMolecule": constructed_molecule_json,
                 "matrix": position_matrix,
-                "buildingBlocks": tuple(
-                    map(
-                        self._get_building_block,
-                        constructed_molecule_json["BB"],
-                    )
-                ),
             },
+            building_blocks=tuple(
+                self._get_building_block(HashableDict(key))
+                for key in constructed_molecule_json["BB"]
+            ),
         )
 
+    def get_many(self, keys):
+        keys = tuple(keys)
+        for key, (
+            molecule_json,
+            constructed_molecule_json,
+            position_matrix,
+            building_blocks,
+        ) in zip(
+            keys,
+            self._find_many(
+                keys=tuple((key,) for key in keys),
+                constructed_molecule_jsons=find_many(
+                    collection=self._constructed_molecules,
+                    keys=keys,
+                ),
+            ),
+        ):
+            if not molecule_json:
+                raise KeyError(
+                    f"No molecule found in the database with a key of: {key}"
+                )
+            if not constructed_molecule_json:
+                raise KeyError(
+                    f"No molecule found in the database with a key of: {key}"
+                )
+            if not position_matrix:
+                raise KeyError(
+                    "No position matrix found in the database with a key "
+                    f"of: {key}"
+                )
+            yield self._dejsonizer._from_json(
+                json={
+                    "molecule": molecule_json[0],
+                    "constructedMolecule": constructed_molecule_json[0],
+                    "matrix": position_matrix[0],
+                },
+                building_blocks=building_blocks,
+            )
+
+    def _find_many(self, keys, constructed_molecule_jsons):
+        """
+        Find the remaining documents of many constructed molecules.
+
+        The molecule and position matrix collections are searched
+        with a single query each. Building blocks are taken from the
+        building block cache.
+
+        Parameters
+        ----------
+        keys : :class:`tuple` of :class:`tuple` of :class:`dict`
+            The keys of each constructed molecule, in order of
+            preference. The documents matching the first key to
+            match any are found.
+
+        constructed_molecule_jsons : :class:`list` of :class:`list`
+            For each key, the matching documents of the constructed
+            molecule collection.
+
+        Yields
+        ------
+        :class:`tuple`
+            For each key, the matching documents of the molecule and
+            position matrix collections, the matching documents of
+            the constructed molecule collection, and the building
+            blocks of the first of them.
+
+        """
+
+        position_matrices = find_many_by_any_key(self._position_matrices, keys)
+        molecule_jsons = find_many_by_any_key(self._molecules, keys)
+
+        for (
+            molecule_json,
+            constructed_molecule_json,
+            position_matrix,
+        ) in zip(
+            molecule_jsons,
+            constructed_molecule_jsons,
+            position_matrices,
+        ):
+            building_blocks = tuple(
+                self._get_building_block(HashableDict(key))
+                for key in (
+                    constructed_molecule_json[0]["BB"]
+                    if constructed_molecule_json
+                    else ()
+                )
+            )
+            yield (
+                molecule_json,
+                constructed_molecule_json,
+                position_matrix,
+                building_blocks,
+            )
+
     def _get_building_block(self, key):
+        """
+        Get the building block with `key`.
+
+        Parameters
+        ----------
+        key : :class:`.HashableDict`
+            The key of the building block.
+
+        Returns
+        -------
+        :class:`.Molecule`
+            The building block.
+
+        Raises
+        ------
+        :class:`KeyError`
+            If the building block is not in the database.
+
+        """
+
+        molecule_json = self._molecules.find_one(key)
+        position_matrix = self._building_block_position_matrices.find_one(key)
+        # Raising an error, rather than returning, means that missing
+        # building blocks are not cached.
+        if molecule_json is None or position_matrix is None:
+            raise KeyError(
+                f"No building block found in the database with a key of: {key}"
+            )
+        return self._dejsonizer._get_building_block(
+            {"molecule": molecule_json, "matrix": position_matrix},
+        )
+
+    def get_position_matrix(self, key):
+        """
+        Get the position matrix of the constructed molecule with `key`.
+
+        Only the position matrix is loaded from the database, so this
+        is faster than :meth:`get`, if the rest of the constructed
+        molecule is not needed.
+
+        Parameters
+        ----------
+        key : :class:`dict`
+            The key of the constructed molecule.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The position matrix of the constructed molecule, with shape
+            ``(n, 3)``.
+
+        Raises
+        ------
+        :class:`KeyError`
+            If no position matrix is found for `key`.
+
+        """
+
+        return get_position_matrix(self._position_matrices, key)
+
+    def iter_keys(self, key_name="InChIKey"):
+        """
+        Yield a key of every constructed molecule in the database.
+
+        Only the key is loaded from the database, so no constructed
+        molecule is created.
+
+        Parameters
+        ----------
+        key_name : :class:`str`, optional
+            The name of the key to yield, for example ``"InChIKey"``.
+
+        Yields
+        ------
+        :class:`object`
+            The value of the key, usually a :class:`str`.
+
+        """
+
+        return iter_keys(self._constructed_molecules, key_name)
+
+    def get_cache_info(self):
+        """
+        Get statistics of the RAM-based caches.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each cache, ``"get"``, ``"put"`` or
+            ``"building_block"``, to a :class:`.CacheInfo`, which
+            holds its hits, misses, evictions and estimated size.
+
+        """
+
         return {
-            "molecule": self._molecules.find_one(key),
-            "matrix": self._building_block_position_matrices.find_one(key),
+            "get": self._get.cache_info(),
+            "put": self._put.cache_info(),
+            "building_block": self._get_building_block.cache_info(),
         }
 
+    def invalidate(self, key):
+        """
+        Remove the cached result of :meth:`get` for `key`.
+
+        Use this if the database was changed by someone else, for
+        example by another process.
+
+        Parameters
+        ----------
+        key : :class:`dict`
+            The key of the constructed molecule, which was passed
+            to :meth:`get`.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.invalidate(HashableDict(key))
+
+    def clear_cache(self):
+        """
+        Remove all entries from the RAM-based caches.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.cache_clear()
+        self._put.cache_clear()
+        self._get_building_block.cache_clear()
+
     def get_all(self):
-        # Get all potential indices.
-        indices = itertools.chain(
-            self._position_matrices.index_information().values(),
-            self._molecules.index_information().values(),
-            self._constructed_molecules.index_information().values(),
-        )
-        keys = tuple(
-            dedupe(
-                index["key"][0][0]
-                for index in indices
-                # Ignore "_id" index which is unique in a collection and
-                # cannot be used to match molecular data split across
-                # collections.
-                if index["key"][0][0] != "_id"
-            )
-        )
+        for molecules in self.get_all_batches():
+            yield from molecules
 
-        query = [
-            {
-                "$match": {
-                    "$or": [{key: {"$exists": True}} for key in keys],
-                },
-            },
-        ]
-        query.extend(
-            {
-                "$lookup": {
-                    "from": self._position_matrices.name,
-                    "let": {
-                        "molecule_key": f"${key}",
-                    },
-                    "as": f"posmat_{key}",
-                    "pipeline": [
-                        {
-                            "$match": {
-                                key: {"$ne": None},
-                            },
-                        },
-                        {
-                            "$match": {
-                                "$expr": {
-                                    "$eq": [
-                                        f"${key}",
-                                        "$$molecule_key",
-                                    ],
-                                },
-                            },
-                        },
-                    ],
-                },
-            }
-            for key in keys
-        )
-        query.extend(
-            {
-                "$lookup": {
-                    "from": self._molecules.name,
-                    "let": {
-                        "molecule_key": f"${key}",
-                    },
-                    "as": f"mol_{key}",
-                    "pipeline": [
-                        {
-                            "$match": {
-                                key: {"$ne": None},
-                            },
-                        },
-                        {
-                            "$match": {
-                                "$expr": {
-                                    "$eq": [
-                                        f"${key}",
-                                        "$$molecule_key",
-                                    ],
-                                },
-                            },
-                        },
-                    ],
-                },
-            }
-            for key in keys
-        )
-        query.append(
-            {
-                "$match": {
-                    "$expr": {
-                        "$or": [
-                            {
-                                "$gt": [
-                                    {"$size": f"$posmat_{key}"},
-                                    0,
-                                ],
-                            }
-                            for key in keys
-                        ],
-                    },
-                },
-            },
-        )
-        query.append(
-            {
-                "$match": {
-                    "$expr": {
-                        "$or": [
-                            {
-                                "$gt": [{"$size": f"$mol_{key}"}, 0],
-                            }
-                            for key in keys
-                        ],
-                    },
-                },
-            },
-        )
+    def get_all_batches(self, batch_size=1000, num_processes=1):
+        """
+        Yield every constructed molecule in the database, in batches.
 
-        cursor = self._constructed_molecules.aggregate(query)
-        for entry in cursor:
-            molecule_document = get_any_value(
-                mapping=entry,
-                keys=(f"mol_{key}" for key in keys),
-            )
-            position_matrix_document = get_any_value(
-                mapping=entry,
-                keys=(f"posmat_{key}" for key in keys),
-            )
-            if (
-                molecule_document is not None
-                and position_matrix_document is not None
+        The constructed molecules are streamed from the database, so
+        that only one batch is held in memory at a time. Each batch
+        needs a single query per collection.
+
+        Parameters
+        ----------
+        batch_size : :class:`int`, optional
+            The maximum number of constructed molecules in a batch.
+            This is also the batch size of the database cursor.
+
+        num_processes : :class:`int`, optional
+            The number of processes used to create the constructed
+            molecules from their JSON representations.
+
+        Yields
+        ------
+        :class:`tuple` of :class:`.ConstructedMolecule`
+            A batch of constructed molecules.
+
+        """
+
+        key_names = get_key_names(
+            self._position_matrices,
+            self._molecules,
+            self._constructed_molecules,
+        )
+        # Only the dejsonizer is sent to other processes, not the
+        # database.
+        dejsonizer = self._dejsonizer
+        with get_map(num_processes) as map_:
+            for constructed_molecule_jsons in iter_batches(
+                collection=self._constructed_molecules,
+                key_names=key_names,
+                batch_size=batch_size,
             ):
-                yield self._dejsonizer.from_json(
-                    {
-                        "molecule": molecule_document,
-                        "constructedMolecule": entry,
-                        "matrix": position_matrix_document,
-                        "buildingBlocks": tuple(
-                            map(
-                                self._get_building_block,
-                                entry["BB"],
+                jsons = self._find_many(
+                    keys=tuple(
+                        get_keys(json, key_names)
+                        for json in constructed_molecule_jsons
+                    ),
+                    constructed_molecule_jsons=[
+                        [json] for json in constructed_molecule_jsons
+                    ],
+                )
+                yield tuple(
+                    map_(
+                        lambda args: dejsonizer._from_json(*args),
+                        [
+                            (
+                                {
+                                    "molecule": molecule_json[0],
+                                    "constructedMolecule": (
+                                        constructed_molecule_json[0]
+                                    ),
+                                    "matrix": position_matrix[0],
+                                },
+                                building_blocks,
                             )
-                        ),
-                    }
+                            for (
+                                molecule_json,
+                                constructed_molecule_json,
+                                position_matrix,
+                                building_blocks,
+                            ) in jsons
+                            if molecule_json and position_matrix
+                        ],
+                    )
                 )
+
+
+def _get_get_entry_size(key, molecule):
+    return get_json_size(key) + get_molecule_size(molecule)
+
+
+def _get_put_entry_size(identity, _):
+    # Only the identity is kept, not the molecule.
+    return get_json_size(identity)
+
+
+def _get_building_block_entry_size(key, building_block):
+    return get_json_size(key) + get_molecule_size(building_block)
@@ -4,17 +4,28 @@ Molecule MongoDB
 
 """
 
-import itertools
-from functools import lru_cache
+import pymongo
 
 from stk._internal.json_serde.molecule import (
     MoleculeDejsonizer,
     MoleculeJsonizer,
 )
-from stk._internal.utilities.utilities import dedupe
 
 from ..molecule import MoleculeDatabase
-from .utilities import HashableDict, get_any_value
+from .cache import LruCache, get_json_size, get_molecule_size
+from .utilities import (
+    HashableDict,
+    find_many,
+    find_many_by_any_key,
+    get_key_names,
+    get_keys,
+    get_map,
+    get_molecule_identity,
+    get_position_matrix,
+    get_query,
+    iter_batches,
+    iter_keys,
+)
 
 
 class MoleculeMongoDb(MoleculeDatabase):
@@ -328,6 +339,8 @@ class MoleculeMongoDb(MoleculeDatabase):
         dejsonizer=MoleculeDejsonizer(),
         put_lru_cache_size=128,
         get_lru_cache_size=128,
+        put_lru_cache_bytes=2**28,
+        get_lru_cache_bytes=2**28,
         indices=("InChIKey",),
     ):
         """
@@ -370,6 +383,18 @@ class MoleculeMongoDb(MoleculeDatabase):
             the number of values which fit into the LRU cache. If
             ``None``, the cache size will be unlimited.
 
+        put_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the put
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
+        get_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the get
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
         indices : :class:`tuple` of :class:`str`, optional
             The names of molecule keys, on which an index should be
             created, in order to minimize lookup time.
@@ -382,8 +407,19 @@ class MoleculeMongoDb(MoleculeDatabase):
         self._jsonizer = jsonizer
         self._dejsonizer = dejsonizer
 
-        self._get = lru_cache(maxsize=get_lru_cache_size)(self._get)
-        self._put = lru_cache(maxsize=put_lru_cache_size)(self._put)
+        self._get = LruCache(
+            function=self._get,
+            maxsize=get_lru_cache_size,
+            max_bytes=get_lru_cache_bytes,
+            get_size=_get_get_entry_size,
+        )
+        self._put = LruCache(
+            function=self._put,
+            maxsize=put_lru_cache_size,
+            max_bytes=put_lru_cache_bytes,
+            get_size=_get_put_entry_size,
+            get_key=get_molecule_identity,
+        )
 
         for index in indices:
             # Do not create the same index twice.
@@ -393,23 +429,16 @@ class MoleculeMongoDb(MoleculeDatabase):
                 self._position_matrices.create_index(index)
 
     def put(self, molecule):
-        molecule = molecule.with_canonical_atom_ordering()
-        json = self._jsonizer.to_json(molecule)
-        # lru_cache requires that the parameters to the cached function
-        # are hashable objects.
-        json["matrix"]["m"] = tuple(tuple(row) for row in json["matrix"]["m"])
-        json["matrix"] = HashableDict(json["matrix"])
-        json["molecule"] = HashableDict(json["molecule"])
-        return self._put(HashableDict(json))
-
-    def _put(self, json):
-        keys = dict(json["matrix"])
-        keys.pop("m")
-
-        query = {"$or": []}
-        for key, value in keys.items():
-            query["$or"].append({key: value})
-
+        # The cache is checked before canonical ordering and
+        # jsonization, so that repeated puts of the same molecule are
+        # cheap.
+        return self._put(molecule)
+
+    def _put(self, molecule):
+        json = self._jsonizer.to_json(
+            molecule=molecule.with_canonical_atom_ordering(),
+        )
+        query = get_query(json)
         self._molecules.update_many(
             filter=query,
             update={
@@ -425,8 +454,36 @@ class MoleculeMongoDb(MoleculeDatabase):
             upsert=True,
         )
 
+    def put_many(self, molecules):
+        molecule_requests = []
+        position_matrix_requests = []
+        for molecule in molecules:
+            json = self._jsonizer.to_json(
+                molecule=molecule.with_canonical_atom_ordering(),
+            )
+            query = get_query(json)
+            molecule_requests.append(
+                pymongo.UpdateMany(
+                    filter=query,
+                    update={"$set": json["molecule"]},
+                    upsert=True,
+                )
+            )
+            position_matrix_requests.append(
+                pymongo.UpdateMany(
+                    filter=query,
+                    update={"$set": json["matrix"]},
+                    upsert=True,
+                )
+            )
+
+        # bulk_write() does not accept an empty list of requests.
+        if molecule_requests:
+            self._molecules.bulk_write(molecule_requests)
+            self._position_matrices.bulk_write(position_matrix_requests)
+
     def get(self, key):
-        # lru_cache requires that the parameters to the cached function
+        # The cache requires that the parameters to the cached function
         # are hashable objects.
         return self._get(HashableDict(key))
 
@@ -466,87 +523,195 @@ class MoleculeMongoDb(MoleculeDatabase):
             }
         )
 
-    def get_all(self):
-        # Get all potential indices.
-        indices = itertools.chain(
-            self._position_matrices.index_information().values(),
-            self._molecules.index_information().values(),
-        )
-        keys = tuple(
-            dedupe(
-                index["key"][0][0]
-                for index in indices
-                # Ignore "_id" index which is unique in a collection and
-                # cannot be used to match molecular data split across
-                # collections.
-                if index["key"][0][0] != "_id"
+    def get_many(self, keys):
+        keys = tuple(keys)
+        molecule_jsons = find_many(self._molecules, keys)
+        position_matrices = find_many(self._position_matrices, keys)
+        for key, json, position_matrix in zip(
+            keys,
+            molecule_jsons,
+            position_matrices,
+        ):
+            if not json:
+                raise KeyError(
+                    f"No molecule found in the database with a key of: {key}"
+                )
+            if not position_matrix:
+                raise KeyError(
+                    "No position matrix found in the database with a key "
+                    f"of: {key}"
+                )
+            yield self._dejsonizer.from_json(
+                {
+                    "molecule": json[0],
+                    "matrix": position_matrix[0],
+                }
             )
-        )
 
-        query = [
-            {
-                "$match": {
-                    "$or": [{key: {"$exists": True}} for key in keys],
-                },
-            },
-        ]
-        query.extend(
-            {
-                "$lookup": {
-                    "from": self._position_matrices.name,
-                    "let": {
-                        "molecule_key": f"${key}",
-                    },
-                    "as": f"posmat_{key}",
-                    "pipeline": [
-                        {
-                            "$match": {
-                                key: {"$ne": None},
-                            },
-                        },
-                        {
-                            "$match": {
-                                "$expr": {
-                                    "$eq": [
-                                        f"${key}",
-                                        "$$molecule_key",
-                                    ],
-                                },
-                            },
-                        },
+    def get_position_matrix(self, key):
+        """
+        Get the position matrix of the molecule with `key`.
+
+        Only the position matrix is loaded from the database, so this
+        is faster than :meth:`get`, if the rest of the molecule
+        is not needed.
+
+        Parameters
+        ----------
+        key : :class:`dict`
+            The key of the molecule.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The position matrix of the molecule, with shape
+            ``(n, 3)``.
+
+        Raises
+        ------
+        :class:`KeyError`
+            If no position matrix is found for `key`.
+
+        """
+
+        return get_position_matrix(self._position_matrices, key)
+
+    def iter_keys(self, key_name="InChIKey"):
+        """
+        Yield a key of every molecule in the database.
+
+        Only the key is loaded from the database, so no molecule
+        is created.
+
+        Parameters
+        ----------
+        key_name : :class:`str`, optional
+            The name of the key to yield, for example ``"InChIKey"``.
+
+        Yields
+        ------
+        :class:`object`
+            The value of the key, usually a :class:`str`.
+
+        """
+
+        return iter_keys(self._molecules, key_name)
+
+    def get_cache_info(self):
+        """
+        Get statistics of the RAM-based caches.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each cache, ``"get"`` or ``"put"``,
+            to a :class:`.CacheInfo`, which holds its hits, misses,
+            evictions and estimated size.
+
+        """
+
+        return {
+            "get": self._get.cache_info(),
+            "put": self._put.cache_info(),
+        }
+
+    def invalidate(self, key):
+        """
+        Remove the cached result of :meth:`get` for `key`.
+
+        Use this if the database was changed by someone else, for
+        example by another process.
+
+        Parameters
+        ----------
+        key : :class:`dict`
+            The key of the molecule, which was passed to :meth:`get`.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.invalidate(HashableDict(key))
+
+    def clear_cache(self):
+        """
+        Remove all entries from the RAM-based caches.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.cache_clear()
+        self._put.cache_clear()
+
+    def get_all(self):
+        for molecules in self.get_all_batches():
+            yield from molecules
+
+    def get_all_batches(self, batch_size=1000, num_processes=1):
+        """
+        Yield every molecule in the database, in batches.
+
+        The molecules are streamed from the database, so that only
+        one batch is held in memory at a time. Each batch needs a
+        single query for its position matrices.
+
+        Parameters
+        ----------
+        batch_size : :class:`int`, optional
+            The maximum number of molecules in a batch. This is also
+            the batch size of the database cursor.
+
+        num_processes : :class:`int`, optional
+            The number of processes used to create the molecules
+            from their JSON representations.
+
+        Yields
+        ------
+        :class:`tuple` of :class:`.Molecule`
+            A batch of molecules.
+
+        """
+
+        key_names = get_key_names(self._position_matrices, self._molecules)
+        with get_map(num_processes) as map_:
+            for molecule_jsons in iter_batches(
+                collection=self._molecules,
+                key_names=key_names,
+                batch_size=batch_size,
+            ):
+                position_matrices = find_many_by_any_key(
+                    collection=self._position_matrices,
+                    keys=[
+                        get_keys(json, key_names) for json in molecule_jsons
                     ],
-                },
-            }
-            for key in keys
-        )
-        query.append(
-            {
-                "$match": {
-                    "$expr": {
-                        "$or": [
+                )
+                yield tuple(
+                    map_(
+                        self._dejsonizer.from_json,
+                        [
                             {
-                                "$gt": [
-                                    {"$size": f"$posmat_{key}"},
-                                    0,
-                                ],
+                                "molecule": json,
+                                "matrix": position_matrix[0],
                             }
-                            for key in keys
+                            for json, position_matrix in zip(
+                                molecule_jsons,
+                                position_matrices,
+                            )
+                            if position_matrix
                         ],
-                    },
-                },
-            },
-        )
-
-        cursor = self._molecules.aggregate(query)
-        for entry in cursor:
-            position_matrix_document = get_any_value(
-                mapping=entry,
-                keys=(f"posmat_{key}" for key in keys),
-            )
-            if position_matrix_document is not None:
-                yield self._dejsonizer.from_json(
-                    {
-                        "molecule": entry,
-                        "matrix": position_matrix_document,
-                    }
+                    )
                 )
+
+
+def _get_get_entry_size(key, molecule):
+    return get_json_size(key) + get_molecule_size(molecule)
+
+
+def _get_put_entry_size(identity, _):
+    # Only the identity is kept, not the molecule.
+    return get_json_size(identity)
@@ -1,6 +1,15 @@
-from collections.abc import Iterable, Sequence
+import contextlib
+import hashlib
+import itertools
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Any
 
+import numpy as np
+import pathos
+
+from stk._internal.json_serde.utilities import to_position_matrix
+from stk._internal.utilities.utilities import dedupe
+
 
 class HashableDict(dict):
     def __hash__(self):
@@ -15,6 +24,69 @@ class HashableDict(dict):
         return super().__eq__(other)
 
 
+def get_molecule_identity(molecule: Any) -> bytes:
+    """
+    Get an identity, which is equal for molecules stored identically.
+
+    The identity is a fixed-size digest of the atoms, bonds and
+    positions of the molecule. It is cheap to compute compared with
+    canonical ordering and jsonization, and does not create lazily
+    created atoms and bonds, so it can be used to look up molecules
+    in an LRU cache before doing either.
+
+    Parameters:
+
+        molecule (Molecule):
+            The molecule.
+
+    Returns:
+
+        The identity of `molecule`.
+
+    """
+
+    hash_ = hashlib.blake2b(digest_size=32)
+    _update_identity(hash_, molecule)
+    return hash_.digest()
+
+
+def get_constructed_molecule_identity(molecule: Any) -> bytes:
+    """
+    Get an identity, which is equal for molecules stored identically.
+
+    Parameters:
+
+        molecule (ConstructedMolecule):
+            The molecule.
+
+    Returns:
+
+        The identity of `molecule`, which includes its building
+        blocks and where its atoms and bonds came from.
+
+    """
+
+    hash_ = hashlib.blake2b(digest_size=32)
+    _update_identity(hash_, molecule)
+    for building_block in molecule.get_building_blocks():
+        hash_.update(get_molecule_identity(building_block))
+        hash_.update(
+            np.int64(
+                molecule.get_num_building_block(building_block)
+            ).tobytes(),
+        )
+    return hash_.digest()
+
+
+def _update_identity(hash_: Any, molecule: Any) -> None:
+    hash_.update(type(molecule).__qualname__.encode())
+    for array in molecule._get_identity_arrays():
+        # The shape is included, so that the boundaries between
+        # arrays are part of the identity.
+        hash_.update(np.array(array.shape, dtype=np.int64))
+        hash_.update(np.ascontiguousarray(array))
+
+
 def _to_hashable(item):
     if isinstance(item, list):
         return tuple(_to_hashable(subitem) for subitem in item)
@@ -22,34 +94,292 @@ def _to_hashable(item):
         return item
 
 
-def get_any_value(
-    mapping: dict[str, Sequence[dict[Any, Any]]],
-    keys: Iterable[str],
-) -> dict[Any, Any] | None:
+def get_query(json: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Get a query matching any of the keys of a molecule.
+
+    Parameters:
+
+        json:
+            The JSON representation of the molecule.
+
+    Returns:
+
+        A query which matches any document holding any one of the
+        molecular keys in `json`.
+
     """
-    Return any value in `mapping` for any of the `keys`.
 
-    This function will only return a value if it is a non-empty
-    sequence. The function will not return the sequence itself, but
-    its first member.
+    keys = dict(json["matrix"])
+    keys.pop("m")
+    return {"$or": [{key: value} for key, value in keys.items()]}
+
+
+def find_many(
+    collection: Any,
+    keys: Sequence[dict[str, Any]],
+) -> list[list[dict[Any, Any]]]:
+    """
+    Find the documents matching each of `keys` in a single query.
 
     Parameters:
 
-        mapping:
-            A mapping from which a value is to be extracted.
+        collection (pymongo.collection.Collection):
+            The collection to search.
 
         keys:
-            The keys which are used to look up values in `mapping`.
+            Each key maps the names of molecular keys to their
+            values. A document matches a key if it holds all of
+            them.
 
     Returns:
 
-        The value of the first key found in `mapping` wll be returned.
-        If none of the `keys` are found in `mapping`, ``None`` will be
-        returned.
+        For each key, the documents which match it, in the order
+        they were returned by the database.
 
     """
 
+    values: dict[str, list[Any]] = {}
+    for key in keys:
+        for name, value in key.items():
+            values.setdefault(name, []).append(value)
+    if not values:
+        return [[] for _ in keys]
+
+    # Index the documents by the value of each molecular key, so
+    # that every key can be looked up without a scan.
+    documents: dict[tuple[str, Any], list[dict[Any, Any]]] = {}
+    for document in collection.find(
+        {"$or": [{name: {"$in": value}} for name, value in values.items()]}
+    ):
+        for name in values:
+            if name in document:
+                documents.setdefault(
+                    (name, _to_hashable(document[name])),
+                    [],
+                ).append(document)
+
+    matches: list[list[dict[Any, Any]]] = []
     for key in keys:
-        if key in mapping and len(mapping[key]) > 0:
-            return mapping[key][0]
-    return None
+        if not key:
+            matches.append([])
+            continue
+        name, value = next(iter(key.items()))
+        candidates = documents.get((name, _to_hashable(value)), [])
+        matches.append(
+            [
+                document
+                for document in candidates
+                if all(
+                    document.get(name) == value for name, value in key.items()
+                )
+            ]
+        )
+    return matches
+
+
+def get_position_matrix(collection: Any, key: dict[str, Any]) -> np.ndarray:
+    """
+    Get a position matrix, without loading the rest of its document.
+
+    Parameters:
+
+        collection (pymongo.collection.Collection):
+            The collection holding position matrices.
+
+        key:
+            The key of the molecule, whose position matrix is
+            returned.
+
+    Returns:
+
+        The position matrix.
+
+    Raises:
+
+        :class:`KeyError`: If no position matrix is found.
+
+    """
+
+    json = collection.find_one(key, projection={"_id": 0, "m": 1})
+    if json is None:
+        raise KeyError(
+            f"No position matrix found in the database with a key of: {key}"
+        )
+    return to_position_matrix(json["m"])
+
+
+def iter_keys(collection: Any, key_name: str) -> Iterator[Any]:
+    """
+    Yield a molecular key of every document, without loading the rest.
+
+    Parameters:
+
+        collection (pymongo.collection.Collection):
+            The collection to search.
+
+        key_name:
+            The name of the molecular key to yield.
+
+    Yields:
+
+        The value of the key. Documents without the key are skipped.
+
+    """
+
+    for json in collection.find(
+        {key_name: {"$exists": True}},
+        projection={"_id": 0, key_name: 1},
+    ):
+        yield json[key_name]
+
+
+def get_key_names(*collections: Any) -> tuple[str, ...]:
+    """
+    Get the names of the molecular keys indexed in `collections`.
+
+    Parameters:
+
+        collections (pymongo.collection.Collection):
+            The collections to check.
+
+    Returns:
+
+        The names of the indexed molecular keys.
+
+    """
+
+    indices = itertools.chain.from_iterable(
+        collection.index_information().values() for collection in collections
+    )
+    return tuple(
+        dedupe(
+            index["key"][0][0]
+            for index in indices
+            # Ignore "_id" index which is unique in a collection and
+            # cannot be used to match molecular data split across
+            # collections.
+            if index["key"][0][0] != "_id"
+        )
+    )
+
+
+def iter_batches(
+    collection: Any,
+    key_names: Sequence[str],
+    batch_size: int,
+) -> Iterator[list[dict[Any, Any]]]:
+    """
+    Yield the documents holding any of `key_names`, in batches.
+
+    Parameters:
+
+        collection (pymongo.collection.Collection):
+            The collection to search.
+
+        key_names:
+            The names of molecular keys. A document is yielded if it
+            holds any of them.
+
+        batch_size:
+            The maximum number of documents in a batch. This is also
+            the batch size of the cursor.
+
+    Yields:
+
+        A batch of documents.
+
+    """
+
+    if not key_names:
+        return
+
+    cursor = collection.find(
+        {"$or": [{name: {"$exists": True}} for name in key_names]},
+    ).batch_size(batch_size)
+    while batch := list(itertools.islice(cursor, batch_size)):
+        yield batch
+
+
+def get_keys(
+    document: dict[str, Any],
+    key_names: Iterable[str],
+) -> tuple[dict[str, Any], ...]:
+    """
+    Get every molecular key in `document`.
+
+    Parameters:
+
+        document:
+            The document.
+
+        key_names:
+            The names of molecular keys, in order of preference.
+
+    Returns:
+
+        For each key found in `document`, a :class:`dict` mapping
+        its name to its value, in the order of `key_names`.
+
+    """
+
+    return tuple(
+        {name: document[name]}
+        for name in key_names
+        if document.get(name) is not None
+    )
+
+
+def find_many_by_any_key(
+    collection: Any,
+    keys: Sequence[Sequence[dict[str, Any]]],
+) -> list[list[dict[Any, Any]]]:
+    """
+    Find the documents matching any of several keys, in one query.
+
+    Parameters:
+
+        collection (pymongo.collection.Collection):
+            The collection to search.
+
+        keys:
+            For each molecule, its keys in order of preference. Each
+            key maps the names of molecular keys to their values.
+
+    Returns:
+
+        For each molecule, the documents which match the first of
+        its keys to match any.
+
+    """
+
+    matches = iter(find_many(collection, list(itertools.chain(*keys))))
+    results = []
+    for molecule_keys in keys:
+        molecule_matches = [next(matches) for _ in molecule_keys]
+        results.append(next(filter(None, molecule_matches), []))
+    return results
+
+
+@contextlib.contextmanager
+def get_map(num_processes: int) -> Iterator[Callable[..., list[Any]]]:
+    """
+    Get a map function, which uses `num_processes`.
+
+    Parameters:
+
+        num_processes:
+            The number of processes to use.
+
+    Yields:
+
+        The map function, which returns a :class:`list`.
+
+    """
+
+    if num_processes == 1:
+        yield lambda function, items: list(map(function, items))
+        return
+
+    with pathos.pools.ProcessPool(num_processes) as pool:
+        yield pool.map
@@ -1,9 +1,12 @@
-from functools import lru_cache
+import functools
+
+import pymongo
 
 from stk._internal.key_makers.inchi_key import InchiKey
 
 from ..value import ValueDatabase
-from .utilities import HashableDict
+from .cache import LruCache, get_json_size
+from .utilities import HashableDict, get_map
 
 
 class ValueMongoDb(ValueDatabase):
@@ -102,6 +105,8 @@ class ValueMongoDb(ValueDatabase):
         key_makers=(InchiKey(),),
         put_lru_cache_size=128,
         get_lru_cache_size=128,
+        put_lru_cache_bytes=2**28,
+        get_lru_cache_bytes=2**28,
         indices=("InChIKey",),
     ):
         """
@@ -137,6 +142,18 @@ class ValueMongoDb(ValueDatabase):
             the number of values which fit into the LRU cache. If
             ``None``, the cache size will be unlimited.
 
+        put_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the put
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
+        get_lru_cache_bytes : :class:`int`, optional
+            The maximum estimated memory, in bytes, used by the get
+            LRU cache. Least recently used entries are evicted to
+            stay below it. If ``None``, only the number of entries
+            is bounded.
+
         indices : :class:`tuple` of :class:`str`, optional
             The names of molecule keys, on which an index should be
             created, in order to minimize lookup time.
@@ -145,8 +162,18 @@ class ValueMongoDb(ValueDatabase):
 
         self._values = mongo_client[database][collection]
         self._key_makers = key_makers
-        self._put = lru_cache(maxsize=put_lru_cache_size)(self._put)
-        self._get = lru_cache(maxsize=get_lru_cache_size)(self._get)
+        self._put = LruCache(
+            function=self._put,
+            maxsize=put_lru_cache_size,
+            max_bytes=put_lru_cache_bytes,
+            get_size=_get_entry_size,
+        )
+        self._get = LruCache(
+            function=self._get,
+            maxsize=get_lru_cache_size,
+            max_bytes=get_lru_cache_bytes,
+            get_size=_get_entry_size,
+        )
 
         index_information = self._values.index_information()
         if "v_1" not in index_information:
@@ -161,7 +188,7 @@ class ValueMongoDb(ValueDatabase):
         json = {"v": value}
         for key_maker in self._key_makers:
             json[key_maker.get_key_name()] = key_maker.get_key(molecule)
-        # lru_cache requires that the parameters to the cached function
+        # The cache requires that the parameters to the cached function
         # are hashable objects.
         return self._put(HashableDict(json))
 
@@ -179,16 +206,55 @@ class ValueMongoDb(ValueDatabase):
             upsert=True,
         )
 
+    def put_many(self, items):
+        requests = []
+        for molecule, value in items:
+            keys = {
+                key_maker.get_key_name(): key_maker.get_key(molecule)
+                for key_maker in self._key_makers
+            }
+            requests.append(
+                pymongo.UpdateMany(
+                    filter={
+                        "$or": [{name: key} for name, key in keys.items()],
+                    },
+                    update={"$set": {"v": value, **keys}},
+                    upsert=True,
+                )
+            )
+
+        # bulk_write() does not accept an empty list of requests.
+        if requests:
+            self._values.bulk_write(requests)
+
     def get(self, molecule):
+        return self._get(self._get_key(molecule))
+
+    def _get_key(self, molecule):
+        """
+        Get the query used to find the value of `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule.
+
+        Returns
+        -------
+        :class:`.HashableDict`
+            The query.
+
+        """
+
         def make_dict(key_maker):
             return HashableDict(
                 {key_maker.get_key_name(): key_maker.get_key(molecule)}
             )
 
         key = {"$or": tuple(map(make_dict, self._key_makers))}
-        # lru_cache requires that the parameters to the cached function
+        # The cache requires that the parameters to the cached function
         # are hashable objects.
-        return self._get(HashableDict(key))
+        return HashableDict(key)
 
     def _get(self, key):
         value = self._values.find_one(key)
@@ -197,3 +263,121 @@ class ValueMongoDb(ValueDatabase):
                 f"No molecule found in the database with a key of: {key}"
             )
         return value["v"]
+
+    def get_many(self, molecules, num_processes=1):
+        """
+        Get the stored values for many molecules, in a single query.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules whose values are to be retrieved from the
+            database.
+
+        num_processes : :class:`int`, optional
+            The number of processes used to make the keys of the
+            molecules.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps each molecule found in the database to its value.
+            Molecules which are not found are missing from the
+            :class:`dict`.
+
+        """
+
+        molecules = tuple(molecules)
+        with get_map(num_processes) as map_:
+            molecule_keys = map_(
+                functools.partial(_get_keys, self._key_makers),
+                molecules,
+            )
+
+        values = {}
+        for keys in molecule_keys:
+            for name, key in keys.items():
+                values.setdefault(name, []).append(key)
+        if not values:
+            return {}
+
+        documents = {}
+        for document in self._values.find(
+            {"$or": [{name: {"$in": keys}} for name, keys in values.items()]}
+        ):
+            for name in values:
+                if name in document:
+                    documents.setdefault((name, document[name]), document)
+
+        found = {}
+        for molecule, keys in zip(molecules, molecule_keys):
+            # Like get(), the value is found through any one of the
+            # keys of the molecule.
+            for name, key in keys.items():
+                document = documents.get((name, key))
+                if document is not None:
+                    found[molecule] = document["v"]
+                    break
+        return found
+
+    def get_cache_info(self):
+        """
+        Get statistics of the RAM-based caches.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps the name of each cache, ``"get"`` or ``"put"``,
+            to a :class:`.CacheInfo`, which holds its hits, misses,
+            evictions and estimated size.
+
+        """
+
+        return {
+            "get": self._get.cache_info(),
+            "put": self._put.cache_info(),
+        }
+
+    def invalidate(self, molecule):
+        """
+        Remove the cached result of :meth:`get` for `molecule`.
+
+        Use this if the database was changed by someone else, for
+        example by another process.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule, which was passed to :meth:`get`.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.invalidate(self._get_key(molecule))
+
+    def clear_cache(self):
+        """
+        Remove all entries from the RAM-based caches.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._get.cache_clear()
+        self._put.cache_clear()
+
+
+def _get_entry_size(key, value):
+    return get_json_size(key) + get_json_size(value)
+
+
+def _get_keys(key_makers, molecule):
+    return {
+        key_maker.get_key_name(): key_maker.get_key(molecule)
+        for key_maker in key_makers
+    }
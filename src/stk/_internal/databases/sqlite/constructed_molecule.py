@@ -0,0 +1,220 @@
+"""
+Constructed Molecule SQLite Database
+====================================
+
+"""
+
+import pathlib
+
+from stk._internal.json_serde.constructed_molecule import (
+    ConstructedMoleculeDejsonizer,
+    ConstructedMoleculeJsonizer,
+)
+
+from ..constructed_molecule import ConstructedMoleculeDatabase
+from .utilities import Connection, KeyedTable, get_keys
+
+
+class ConstructedMoleculeSqliteDb(ConstructedMoleculeDatabase):
+    """
+    Uses an SQLite file to store and retrieve constructed molecules.
+
+    The building blocks of the constructed molecules are stored in
+    the same table as the molecules of a :class:`.MoleculeSqliteDb`
+    using the same file, so they can be retrieved by it.
+
+    See Also
+    --------
+    :class:`.ConstructedMoleculeMongoDb`
+        If you want to store constructed molecules in MongoDB.
+
+    :class:`.MoleculeSqliteDb`
+        If you need to store and retrieve molecules, which are not
+        :class:`.ConstructedMolecule` instances.
+
+    Examples
+    --------
+    *Storing and Retrieving Constructed Molecules*
+
+    You want to store and retrieve a :class:`.ConstructedMolecule`
+    from the database
+
+    .. testcode:: storing-and-retrieving-constructed-molecules
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        db = stk.ConstructedMoleculeSqliteDb(
+            path=pathlib.Path(directory.name) / 'molecules.db',
+        )
+
+        polymer = stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                ),
+                repeating_unit='A',
+                num_repeating_units=2,
+            ),
+        )
+        db.put(polymer)
+
+        key_maker = stk.InchiKey()
+        retrieved = db.get({
+            key_maker.get_key_name(): key_maker.get_key(polymer),
+        })
+
+    .. testcode:: storing-and-retrieving-constructed-molecules
+        :hide:
+
+        _smiles = stk.Smiles()
+        assert _smiles.get_key(polymer) == _smiles.get_key(retrieved)
+        directory.cleanup()
+
+    """
+
+    def __init__(
+        self,
+        path,
+        table="constructed_molecules",
+        building_block_table="molecules",
+        jsonizer=None,
+        dejsonizer=None,
+        timeout=60.0,
+    ):
+        """
+        Initialize a :class:`.ConstructedMoleculeSqliteDb`.
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path` or :class:`str`
+            The path to the database file. It is created if it does
+            not exist.
+
+        table : :class:`str`, optional
+            The name of the table which stores the constructed
+            molecules.
+
+        building_block_table : :class:`str`, optional
+            The name of the table which stores the building blocks of
+            the constructed molecules.
+
+        jsonizer : :class:`.ConstructedMoleculeJsonizer`, optional
+            Used to create the JSON representations of molecules
+            stored in the database. If ``None``, a
+            :class:`.ConstructedMoleculeJsonizer` with default
+            parameters is used.
+
+        dejsonizer : :class:`.ConstructedMoleculeDejsonizer`, optional
+            Used to create :class:`.ConstructedMolecule` instances
+            from their JSON representations. If ``None``, a
+            :class:`.ConstructedMoleculeDejsonizer` is used.
+
+        timeout : :class:`float`, optional
+            The number of seconds to wait for another process to
+            finish writing to the database.
+
+        """
+
+        self._connection = Connection(pathlib.Path(path), timeout)
+        self._constructed_molecules = KeyedTable(table)
+        self._building_blocks = KeyedTable(building_block_table)
+        self._jsonizer = (
+            ConstructedMoleculeJsonizer() if jsonizer is None else jsonizer
+        )
+        self._dejsonizer = (
+            ConstructedMoleculeDejsonizer()
+            if dejsonizer is None
+            else dejsonizer
+        )
+        connection = self._connection.get()
+        self._constructed_molecules.create(connection)
+        self._building_blocks.create(connection)
+
+    def put(self, molecule):
+        self.put_many((molecule,))
+
+    def put_many(self, molecules):
+        connection = self._connection.get()
+        with connection:
+            for molecule in molecules:
+                json = self._jsonizer.to_json(
+                    molecule.with_canonical_atom_ordering(),
+                )
+                self._constructed_molecules.put(
+                    connection=connection,
+                    keys=get_keys(json),
+                    document={
+                        "molecule": json["molecule"],
+                        "constructedMolecule": json["constructedMolecule"],
+                        "matrix": json["matrix"],
+                    },
+                )
+                for building_block_json in json["buildingBlocks"]:
+                    self._building_blocks.put(
+                        connection=connection,
+                        keys=get_keys(building_block_json),
+                        document=dict(building_block_json),
+                    )
+
+    def get(self, key):
+        (molecule,) = self.get_many((key,))
+        return molecule
+
+    def get_many(self, keys):
+        connection = self._connection.get()
+        for key in keys:
+            json = self._constructed_molecules.get(connection, key)
+            if json is None:
+                raise KeyError(
+                    f"No molecule found in the database with a key of: {key}"
+                )
+            yield self._from_json(connection, json)
+
+    def get_all(self):
+        connection = self._connection.get()
+        for json in self._constructed_molecules.get_all(connection):
+            yield self._from_json(connection, json)
+
+    def _from_json(self, connection, json):
+        """
+        Get a :class:`.ConstructedMolecule` from its stored JSON.
+
+        Parameters
+        ----------
+        connection : :class:`sqlite3.Connection`
+            The connection to the database.
+
+        json : :class:`dict`
+            The stored JSON of the constructed molecule, which does
+            not include its building blocks.
+
+        Returns
+        -------
+        :class:`.ConstructedMolecule`
+            The constructed molecule.
+
+        """
+
+        def get_building_block(key):
+            building_block = self._building_blocks.get(connection, key)
+            if building_block is None:
+                raise KeyError(
+                    "No building block found in the database with a key "
+                    f"of: {key}"
+                )
+            return building_block
+
+        return self._dejsonizer.from_json(
+            json={
+                **json,
+                "buildingBlocks": tuple(
+                    map(
+                        get_building_block,
+                        json["constructedMolecule"]["BB"],
+                    )
+                ),
+            },
+        )
@@ -0,0 +1,172 @@
+"""
+Molecule SQLite Database
+========================
+
+"""
+
+import pathlib
+
+from stk._internal.json_serde.molecule import (
+    MoleculeDejsonizer,
+    MoleculeJsonizer,
+)
+
+from ..molecule import MoleculeDatabase
+from .utilities import Connection, KeyedTable, get_keys
+
+
+class MoleculeSqliteDb(MoleculeDatabase):
+    """
+    Uses an SQLite file to store and retrieve molecules.
+
+    No database server is needed, the whole database is a single file,
+    which can be read by many processes at the same time.
+
+    See Also
+    --------
+    :class:`.MoleculeMongoDb`
+        If you want to store molecules in MongoDB.
+
+    :class:`.ConstructedMoleculeSqliteDb`
+        If you want to store and retrieve :class:`.ConstructedMolecule`
+        instances.
+
+    Examples
+    --------
+    *Storing and Retrieving Molecules*
+
+    You want to store and retrieve a molecule from the database
+
+    .. testcode:: storing-and-retrieving-molecules
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        db = stk.MoleculeSqliteDb(
+            path=pathlib.Path(directory.name) / 'molecules.db',
+        )
+
+        molecule = stk.BuildingBlock('NCCN')
+        db.put(molecule)
+
+        key_maker = stk.InchiKey()
+        retrieved = db.get({
+            key_maker.get_key_name(): key_maker.get_key(molecule)
+        })
+
+    .. testcode:: storing-and-retrieving-molecules
+        :hide:
+
+        _smiles = stk.Smiles()
+        assert _smiles.get_key(molecule) == _smiles.get_key(retrieved)
+        directory.cleanup()
+
+    *Storing Many Molecules*
+
+    :meth:`.put_many` writes all of the molecules in a single
+    transaction, which is much faster than calling :meth:`.put`
+    for each one
+
+    .. testcode:: storing-many-molecules
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        db = stk.MoleculeSqliteDb(
+            path=pathlib.Path(directory.name) / 'molecules.db',
+        )
+        db.put_many(
+            stk.BuildingBlock(smiles)
+            for smiles in ('NCCN', 'BrCCBr', 'CCCC')
+        )
+
+    .. testcode:: storing-many-molecules
+        :hide:
+
+        assert len(list(db.get_all())) == 3
+        directory.cleanup()
+
+    """
+
+    def __init__(
+        self,
+        path,
+        table="molecules",
+        jsonizer=None,
+        dejsonizer=None,
+        timeout=60.0,
+    ):
+        """
+        Initialize a :class:`.MoleculeSqliteDb` instance.
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path` or :class:`str`
+            The path to the database file. It is created if it does
+            not exist.
+
+        table : :class:`str`, optional
+            The name of the table which stores the molecules.
+
+        jsonizer : :class:`.MoleculeJsonizer`, optional
+            Used to create the JSON representations of molecules
+            stored in the database. If ``None``, a
+            :class:`.MoleculeJsonizer` with default parameters is
+            used.
+
+        dejsonizer : :class:`.MoleculeDejsonizer`, optional
+            Used to create :class:`.Molecule` instances from their
+            JSON representations. If ``None``, a
+            :class:`.MoleculeDejsonizer` is used.
+
+        timeout : :class:`float`, optional
+            The number of seconds to wait for another process to
+            finish writing to the database.
+
+        """
+
+        self._connection = Connection(pathlib.Path(path), timeout)
+        self._molecules = KeyedTable(table)
+        self._jsonizer = MoleculeJsonizer() if jsonizer is None else jsonizer
+        self._dejsonizer = (
+            MoleculeDejsonizer() if dejsonizer is None else dejsonizer
+        )
+        self._molecules.create(self._connection.get())
+
+    def put(self, molecule):
+        self.put_many((molecule,))
+
+    def put_many(self, molecules):
+        connection = self._connection.get()
+        with connection:
+            for molecule in molecules:
+                json = self._jsonizer.to_json(
+                    molecule=molecule.with_canonical_atom_ordering(),
+                )
+                self._molecules.put(
+                    connection=connection,
+                    keys=get_keys(json),
+                    document=dict(json),
+                )
+
+    def get(self, key):
+        (molecule,) = self.get_many((key,))
+        return molecule
+
+    def get_many(self, keys):
+        connection = self._connection.get()
+        for key in keys:
+            json = self._molecules.get(connection, key)
+            if json is None:
+                raise KeyError(
+                    f"No molecule found in the database with a key of: {key}"
+                )
+            yield self._dejsonizer.from_json(json)
+
+    def get_all(self):
+        for json in self._molecules.get_all(self._connection.get()):
+            yield self._dejsonizer.from_json(json)
@@ -0,0 +1,324 @@
+"""
+SQLite Database Utilities
+=========================
+
+"""
+
+import base64
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import typing
+from collections import abc
+
+Document: typing.TypeAlias = dict[str, typing.Any]
+
+
+class Connection:
+    """
+    A connection to an SQLite database file, opened once per thread.
+
+    The database is put into write-ahead logging mode, so that any
+    number of processes can read from it while one writes to it.
+    SQLite connections cannot be shared between threads, so each
+    thread opens its own. A process which inherits a connection, for
+    example through a fork, opens its own instead of sharing the
+    parent's.
+
+    """
+
+    def __init__(self, path: pathlib.Path | str, timeout: float) -> None:
+        """
+        Parameters:
+
+            path:
+                The path to the database file.
+
+            timeout:
+                The number of seconds to wait for another process to
+                release a lock on the database.
+
+        """
+
+        self._path = pathlib.Path(path)
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Get the connection of the current thread.
+
+        Returns:
+
+            The connection.
+
+        """
+
+        connection: sqlite3.Connection | None = getattr(
+            self._local, "connection", None
+        )
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                database=self._path,
+                timeout=self._timeout,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {"_path": self._path, "_timeout": self._timeout}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__init__(  # type: ignore[misc]
+            path=state["_path"],
+            timeout=state["_timeout"],
+        )
+
+
+class KeyedTable:
+    """
+    A table of JSON documents, looked up by molecular keys.
+
+    Each document is stored once, and is found through any of its
+    molecular keys, such as its InChIKey. The key names and values
+    are held in a separate table, whose primary key indexes them.
+
+    A document is a :class:`dict`, which maps the name of a section
+    to a :class:`dict` or a :class:`list`. When a document is put into
+    the table, and one is already found under any of its molecular
+    keys, each of its sections is merged into the existing one.
+
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Parameters:
+
+            name:
+                The name of the table.
+
+        """
+
+        self._documents = _quote(name)
+        self._keys = _quote(f"{name}_keys")
+
+    def create(self, connection: sqlite3.Connection) -> None:
+        """
+        Create the table if it does not exist.
+
+        Parameters:
+
+            connection:
+                The connection to the database.
+
+        """
+
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._documents} ("
+                "id INTEGER PRIMARY KEY, "
+                "document TEXT NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._keys} ("
+                "key_name TEXT NOT NULL, "
+                "key_value TEXT NOT NULL, "
+                "document_id INTEGER NOT NULL, "
+                "PRIMARY KEY (key_name, key_value)"
+                ") WITHOUT ROWID"
+            )
+
+    def put(
+        self,
+        connection: sqlite3.Connection,
+        keys: dict[str, typing.Any],
+        document: Document,
+    ) -> None:
+        """
+        Put a document into the table.
+
+        This does not commit, so that many documents can be put in a
+        single transaction.
+
+        Parameters:
+
+            connection:
+                The connection to the database.
+
+            keys:
+                Maps the name of each molecular key of the document to
+                its value.
+
+            document:
+                The document.
+
+        """
+
+        document_ids = {
+            row[0]
+            for name, value in keys.items()
+            for row in connection.execute(
+                f"SELECT document_id FROM {self._keys} "
+                "WHERE key_name = ? AND key_value = ?",
+                (name, _dump_key(value)),
+            )
+        }
+        if document_ids:
+            document_id = min(document_ids)
+            for (old_document,) in connection.execute(
+                f"SELECT document FROM {self._documents} WHERE id = ?",
+                (document_id,),
+            ):
+                document = _merge(_load_document(old_document), document)
+            connection.execute(
+                f"UPDATE {self._documents} SET document = ? WHERE id = ?",
+                (_dump_document(document), document_id),
+            )
+        else:
+            document_id = connection.execute(
+                f"INSERT INTO {self._documents} (document) VALUES (?)",
+                (_dump_document(document),),
+            ).lastrowid
+        connection.executemany(
+            f"INSERT OR REPLACE INTO {self._keys} "
+            "(key_name, key_value, document_id) VALUES (?, ?, ?)",
+            (
+                (name, _dump_key(value), document_id)
+                for name, value in keys.items()
+            ),
+        )
+
+    def get(
+        self,
+        connection: sqlite3.Connection,
+        key: dict[str, typing.Any],
+    ) -> Document | None:
+        """
+        Get the document matching `key`.
+
+        Parameters:
+
+            connection:
+                The connection to the database.
+
+            key:
+                Maps the names of molecular keys to their values. The
+                document must hold all of them.
+
+        Returns:
+
+            The document, or ``None`` if no document matches `key`.
+
+        """
+
+        document_ids = set()
+        for name, value in key.items():
+            row = connection.execute(
+                f"SELECT document_id FROM {self._keys} "
+                "WHERE key_name = ? AND key_value = ?",
+                (name, _dump_key(value)),
+            ).fetchone()
+            if row is None:
+                return None
+            document_ids.add(row[0])
+        # All the molecular keys in key must belong to the same
+        # document.
+        if len(document_ids) != 1:
+            return None
+        (document_id,) = document_ids
+        (document,) = connection.execute(
+            f"SELECT document FROM {self._documents} WHERE id = ?",
+            (document_id,),
+        ).fetchone()
+        return _load_document(document)
+
+    def get_all(
+        self,
+        connection: sqlite3.Connection,
+    ) -> abc.Iterator[Document]:
+        """
+        Yield every document in the table.
+
+        Parameters:
+
+            connection:
+                The connection to the database.
+
+        Yields:
+
+            A document.
+
+        """
+
+        for (document,) in connection.execute(
+            f"SELECT document FROM {self._documents}"
+        ):
+            yield _load_document(document)
+
+
+def get_keys(molecule_json: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """
+    Get the molecular keys of a molecule.
+
+    Parameters:
+
+        molecule_json:
+            The JSON representation of the molecule.
+
+    Returns:
+
+        Maps the name of each molecular key to its value.
+
+    """
+
+    keys = dict(molecule_json["matrix"])
+    keys.pop("m")
+    return keys
+
+
+def _quote(identifier: str) -> str:
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _dump_key(value: typing.Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _dump_document(document: Document) -> str:
+    return json.dumps(document, default=_encode_bytes)
+
+
+def _load_document(document: str) -> Document:
+    return json.loads(document, object_hook=_decode_bytes)
+
+
+def _encode_bytes(value: typing.Any) -> dict[str, str]:
+    # Position matrices can be jsonized as raw bytes, which plain
+    # JSON cannot hold.
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def _decode_bytes(value: dict[str, typing.Any]) -> typing.Any:
+    if value.keys() == {"$bytes"}:
+        return base64.b64decode(value["$bytes"])
+    return value
+
+
+def _merge(document1: Document, document2: Document) -> Document:
+    merged = dict(document1)
+    for section, value in document2.items():
+        if isinstance(value, dict) and isinstance(merged.get(section), dict):
+            merged[section] = {**merged[section], **value}
+        else:
+            merged[section] = value
+    return merged
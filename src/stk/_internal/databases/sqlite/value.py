@@ -0,0 +1,121 @@
+"""
+Value SQLite Database
+=====================
+
+"""
+
+import pathlib
+
+from stk._internal.key_makers.inchi_key import InchiKey
+
+from ..value import ValueDatabase
+from .utilities import Connection, KeyedTable
+
+
+class ValueSqliteDb(ValueDatabase):
+    """
+    Uses an SQLite file to store and retrieve molecular property values.
+
+    See Also
+    --------
+    :class:`.ValueMongoDb`
+        If you want to store values in MongoDB.
+
+    Examples
+    --------
+    *Storing and Retrieving Molecular Property Values*
+
+    You want to store and retrieve the number of atoms of molecules
+
+    .. testcode:: storing-and-retrieving-molecular-property-values
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        db = stk.ValueSqliteDb(
+            path=pathlib.Path(directory.name) / 'values.db',
+            table='atom_counts',
+        )
+
+        molecule = stk.BuildingBlock('BrCCCBr')
+        db.put(molecule, molecule.get_num_atoms())
+        num_atoms = db.get(molecule)
+
+    .. testcode:: storing-and-retrieving-molecular-property-values
+        :hide:
+
+        assert num_atoms == molecule.get_num_atoms()
+        directory.cleanup()
+
+    """
+
+    def __init__(
+        self,
+        path,
+        table,
+        key_makers=None,
+        timeout=60.0,
+    ):
+        """
+        Initialize a :class:`.ValueSqliteDb` instance.
+
+        Parameters
+        ----------
+        path : :class:`pathlib.Path` or :class:`str`
+            The path to the database file. It is created if it does
+            not exist.
+
+        table : :class:`str`
+            The name of the table used for storing the property
+            values.
+
+        key_makers : :class:`tuple` of :class:`.MoleculeKeyMaker`
+            Used to make the keys of molecules, which the values
+            are associated with. If two molecules have the same
+            key, they will return the same value from the database.
+            If ``None``, only :class:`.InchiKey` is used.
+
+        timeout : :class:`float`, optional
+            The number of seconds to wait for another process to
+            finish writing to the database.
+
+        """
+
+        self._connection = Connection(pathlib.Path(path), timeout)
+        self._values = KeyedTable(table)
+        self._key_makers = (InchiKey(),) if key_makers is None else key_makers
+        self._values.create(self._connection.get())
+
+    def put(self, molecule, value):
+        self.put_many(((molecule, value),))
+
+    def put_many(self, items):
+        connection = self._connection.get()
+        with connection:
+            for molecule, value in items:
+                self._values.put(
+                    connection=connection,
+                    keys=self._get_keys(molecule),
+                    document={"value": {"v": value}},
+                )
+
+    def get(self, molecule):
+        connection = self._connection.get()
+        keys = self._get_keys(molecule)
+        # Like ValueMongoDb, a value is found through any one of the
+        # keys of the molecule.
+        for name, key in keys.items():
+            document = self._values.get(connection, {name: key})
+            if document is not None:
+                return document["value"]["v"]
+        raise KeyError(
+            f"No molecule found in the database with a key of: {keys}"
+        )
+
+    def _get_keys(self, molecule):
+        return {
+            key_maker.get_key_name(): key_maker.get_key(molecule)
+            for key_maker in self._key_makers
+        }
@@ -111,6 +111,28 @@ class ValueDatabase:
 
         raise NotImplementedError()
 
+    def put_many(self, items):
+        """
+        Put many values into the database.
+
+        By default, this calls :meth:`.put` on each item, but
+        subclasses can override it to write them in bulk.
+
+        Parameters
+        ----------
+        items : :class:`iterable` of :class:`tuple`
+            Each :class:`tuple` holds a :class:`.Molecule` and the
+            value associated with it.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        for molecule, value in items:
+            self.put(molecule, value)
+
     def get(self, molecule):
         """
         Get the stored value for `molecule`.
@@ -134,3 +156,33 @@ class ValueDatabase:
         """
 
         raise NotImplementedError()
+
+    def get_many(self, molecules):
+        """
+        Get the stored values for many molecules.
+
+        By default, this calls :meth:`.get` on each molecule, but
+        subclasses can override it to read them in bulk.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules whose values are to be retrieved from the
+            database.
+
+        Returns
+        -------
+        :class:`dict`
+            Maps each molecule found in the database to its value.
+            Molecules which are not found are missing from the
+            :class:`dict`.
+
+        """
+
+        values = {}
+        for molecule in molecules:
+            try:
+                values[molecule] = self.get(molecule)
+            except KeyError:
+                pass
+        return values
@@ -0,0 +1,507 @@
+"""
+Write-Behind Databases
+======================
+
+"""
+
+import collections
+import concurrent.futures
+import threading
+import time
+import weakref
+
+from .molecule import MoleculeDatabase
+from .value import ValueDatabase
+
+
+class WriteBehindMoleculeDb(MoleculeDatabase):
+    """
+    Buffers puts into a :class:`.MoleculeDatabase`.
+
+    Molecules put into the database are placed on a bounded queue,
+    and written to the wrapped database in bulk by a background
+    thread. Any pending puts are flushed before a read, and when the
+    database is closed.
+
+    See Also
+    --------
+    :class:`.WriteBehindValueDb`
+        If you want to buffer puts into a :class:`.ValueDatabase`.
+
+    Notes
+    -----
+    The database can be used by several threads, and sent to other
+    processes, for example by a parallel :class:`.FitnessCalculator`.
+    Each copy sent to another process gets its own queue and
+    background thread, which are started by its first put. Puts
+    waiting in a copy are written when it is closed or garbage
+    collected. Puts waiting in the original are not copied.
+
+    Errors raised by the wrapped database in the background are
+    raised again by the next call to :meth:`put`, :meth:`flush` or
+    :meth:`close`.
+
+    Examples
+    --------
+    *Buffering Puts*
+
+    You want to put many molecules into a database, without waiting
+    for each write to finish
+
+    .. testcode:: buffering-puts
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        with stk.WriteBehindMoleculeDb(
+            database=stk.MoleculeSqliteDb(
+                path=pathlib.Path(directory.name) / 'molecules.db',
+            ),
+        ) as db:
+            db.put(stk.BuildingBlock('BrCCBr'))
+            db.put(stk.BuildingBlock('BrCCCBr'))
+            # Time taken by each bulk write, in seconds.
+            flush_latencies = db.get_flush_latencies()
+
+    .. testcode:: buffering-puts
+        :hide:
+
+        directory.cleanup()
+
+    """
+
+    def __init__(self, database, max_queue_size=1000, batch_size=100):
+        """
+        Initialize a :class:`.WriteBehindMoleculeDb` instance.
+
+        Parameters
+        ----------
+        database : :class:`.MoleculeDatabase`
+            The database, which puts are written to.
+
+        max_queue_size : :class:`int`, optional
+            The maximum number of molecules waiting to be written.
+            When the queue is full, :meth:`put` blocks until there
+            is space.
+
+        batch_size : :class:`int`, optional
+            The maximum number of molecules written to `database`
+            in a single bulk write.
+
+        """
+
+        self._database = database
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._queue = _WriteBehindQueue(
+            write_many=database.put_many,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+        )
+        # Copies sent to other processes are usually never closed,
+        # so pending puts are also written when the database is
+        # garbage collected.
+        weakref.finalize(self, self._queue.close)
+
+    def put(self, molecule):
+        self._queue.put(molecule)
+
+    def put_many(self, molecules):
+        for molecule in molecules:
+            self._queue.put(molecule)
+
+    def get(self, key):
+        self._queue.flush()
+        return self._database.get(key)
+
+    def get_many(self, keys):
+        self._queue.flush()
+        return self._database.get_many(keys)
+
+    def get_all(self):
+        self._queue.flush()
+        return self._database.get_all()
+
+    def flush(self):
+        """
+        Wait until all pending puts are written.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._queue.flush()
+
+    def close(self):
+        """
+        Write all pending puts and stop the background thread.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._queue.close()
+
+    def get_queue_depth(self):
+        """
+        Get the number of puts waiting to be written.
+
+        Returns
+        -------
+        :class:`int`
+            The number of puts waiting to be written.
+
+        """
+
+        return self._queue.get_depth()
+
+    def get_flush_latencies(self):
+        """
+        Get the time taken by recent bulk writes.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`float`
+            The time taken by each of the most recent bulk writes,
+            in seconds, oldest first.
+
+        """
+
+        return self._queue.get_flush_latencies()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # Pending puts, the background thread and its lock are not
+        # sent to other processes.
+        return {
+            "database": self._database,
+            "max_queue_size": self._max_queue_size,
+            "batch_size": self._batch_size,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class WriteBehindValueDb(ValueDatabase):
+    """
+    Buffers puts into a :class:`.ValueDatabase`.
+
+    Values put into the database are placed on a bounded queue, and
+    written to the wrapped database in bulk by a background thread.
+    Any pending puts are flushed before a read, and when the database
+    is closed.
+
+    See Also
+    --------
+    :class:`.WriteBehindMoleculeDb`
+        If you want to buffer puts into a :class:`.MoleculeDatabase`.
+
+    Notes
+    -----
+    The database can be used by several threads, and sent to other
+    processes, for example by a parallel :class:`.FitnessCalculator`.
+    Each copy sent to another process gets its own queue and
+    background thread, which are started by its first put. Puts
+    waiting in a copy are written when it is closed or garbage
+    collected. Puts waiting in the original are not copied.
+
+    Errors raised by the wrapped database in the background are
+    raised again by the next call to :meth:`put`, :meth:`flush` or
+    :meth:`close`.
+
+    Examples
+    --------
+    *Buffering Fitness Values*
+
+    You want a :class:`.FitnessFunction` to store its values without
+    waiting for each write to finish
+
+    .. testcode:: buffering-fitness-values
+
+        import stk
+        import tempfile
+        import pathlib
+
+        directory = tempfile.TemporaryDirectory()
+        with stk.WriteBehindValueDb(
+            database=stk.ValueSqliteDb(
+                path=pathlib.Path(directory.name) / 'values.db',
+                table='fitness_values',
+            ),
+        ) as fitness_db:
+            fitness_function = stk.FitnessFunction(
+                fitness_function=lambda record: (
+                    record.get_molecule().get_num_atoms()
+                ),
+                output_database=fitness_db,
+            )
+            record = stk.MoleculeRecord(
+                topology_graph=stk.polymer.Linear(
+                    building_blocks=(
+                        stk.BuildingBlock('BrCCBr', [stk.BromoFactory()]),
+                    ),
+                    repeating_unit='A',
+                    num_repeating_units=2,
+                ),
+            )
+            value = fitness_function.get_fitness_value(record)
+
+    .. testcode:: buffering-fitness-values
+        :hide:
+
+        directory.cleanup()
+
+    """
+
+    def __init__(self, database, max_queue_size=1000, batch_size=100):
+        """
+        Initialize a :class:`.WriteBehindValueDb` instance.
+
+        Parameters
+        ----------
+        database : :class:`.ValueDatabase`
+            The database, which puts are written to.
+
+        max_queue_size : :class:`int`, optional
+            The maximum number of values waiting to be written.
+            When the queue is full, :meth:`put` blocks until there
+            is space.
+
+        batch_size : :class:`int`, optional
+            The maximum number of values written to `database`
+            in a single bulk write.
+
+        """
+
+        self._database = database
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._queue = _WriteBehindQueue(
+            write_many=database.put_many,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+        )
+        # Copies sent to other processes are usually never closed,
+        # so pending puts are also written when the database is
+        # garbage collected.
+        weakref.finalize(self, self._queue.close)
+
+    def put(self, molecule, value):
+        self._queue.put((molecule, value))
+
+    def put_many(self, items):
+        for item in items:
+            self._queue.put(item)
+
+    def get(self, molecule):
+        self._queue.flush()
+        return self._database.get(molecule)
+
+    def get_many(self, molecules):
+        self._queue.flush()
+        return self._database.get_many(molecules)
+
+    def flush(self):
+        """
+        Wait until all pending puts are written.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._queue.flush()
+
+    def close(self):
+        """
+        Write all pending puts and stop the background thread.
+
+        Returns
+        -------
+        None : :class:`NoneType`
+
+        """
+
+        self._queue.close()
+
+    def get_queue_depth(self):
+        """
+        Get the number of puts waiting to be written.
+
+        Returns
+        -------
+        :class:`int`
+            The number of puts waiting to be written.
+
+        """
+
+        return self._queue.get_depth()
+
+    def get_flush_latencies(self):
+        """
+        Get the time taken by recent bulk writes.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`float`
+            The time taken by each of the most recent bulk writes,
+            in seconds, oldest first.
+
+        """
+
+        return self._queue.get_flush_latencies()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # Pending puts, the background thread and its lock are not
+        # sent to other processes.
+        return {
+            "database": self._database,
+            "max_queue_size": self._max_queue_size,
+            "batch_size": self._batch_size,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class _WriteBehindQueue:
+    """
+    Writes items in bulk on a background thread.
+
+    Items are collected into batches, which are written in the order
+    they were put, by a single worker thread. A batch is handed to
+    the worker when it is full, or when the worker is idle. The
+    worker is started by the first batch.
+
+    """
+
+    def __init__(
+        self,
+        write_many,
+        max_queue_size,
+        batch_size,
+        num_flush_latencies=1000,
+    ):
+        """
+        Initialize a :class:`._WriteBehindQueue` instance.
+
+        Parameters
+        ----------
+        write_many : :class:`callable`
+            Takes a :class:`list` of items and writes them.
+
+        max_queue_size : :class:`int`
+            The maximum number of items waiting to be written.
+
+        batch_size : :class:`int`
+            The maximum number of items passed to `write_many` at
+            once.
+
+        num_flush_latencies : :class:`int`, optional
+            The number of recent flush latencies which are kept.
+
+        """
+
+        self._write_many = write_many
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._batch = []
+        # Holds the future and size of each batch handed to the
+        # worker, oldest first.
+        self._writes = collections.deque()
+        self._flush_latencies = collections.deque(
+            maxlen=num_flush_latencies,
+        )
+        self._closed = False
+        self._executor = None
+        # Guards the batch and the writes, which are shared by the
+        # threads putting items. The worker does not take it.
+        self._lock = threading.Lock()
+
+    def put(self, item):
+        with self._lock:
+            self._collect_finished_writes()
+            if self._closed:
+                raise RuntimeError("Cannot put into a closed database.")
+            while self._writes and self._get_depth() >= self._max_queue_size:
+                self._collect_oldest_write()
+            self._batch.append(item)
+            if len(self._batch) == self._batch_size or not self._writes:
+                self._submit()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                self._flush()
+                return
+            self._closed = True
+            try:
+                self._flush()
+            finally:
+                if self._executor is not None:
+                    self._executor.shutdown()
+
+    def get_depth(self):
+        with self._lock:
+            return self._get_depth()
+
+    def get_flush_latencies(self):
+        return tuple(self._flush_latencies)
+
+    def _flush(self):
+        self._submit()
+        while self._writes:
+            self._collect_oldest_write()
+
+    def _get_depth(self):
+        return len(self._batch) + sum(
+            size for future, size in self._writes if not future.done()
+        )
+
+    def _submit(self):
+        if self._batch:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1,
+                )
+            batch, self._batch = self._batch, []
+            self._writes.append(
+                (self._executor.submit(self._write, batch), len(batch)),
+            )
+
+    def _collect_oldest_write(self):
+        # Raises any error of the write.
+        future, _ = self._writes.popleft()
+        future.result()
+
+    def _collect_finished_writes(self):
+        while self._writes and self._writes[0][0].done():
+            self._collect_oldest_write()
+
+    def _write(self, batch):
+        start = time.perf_counter()
+        self._write_many(batch)
+        self._flush_latencies.append(time.perf_counter() - start)
@@ -13,6 +13,10 @@ from stk._internal.ea.generation import Generation
 from stk._internal.ea.molecule_record import MoleculeRecord
 from stk._internal.ea.mutation.mutator import MoleculeMutator
 from stk._internal.ea.selection.selectors.selector import Selector
+from stk._internal.key_makers.cached import (
+    CachedKeyMaker,
+    get_cached_key_maker,
+)
 from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
@@ -105,12 +109,23 @@ class EvolutionaryAlgorithm(typing.Generic[T]):
             key_maker:
                 Used to detect duplicate molecules in the EA. If two
                 molecules in a generation return the same key, one of them
-                is removed.
+                is removed. Keys are cached by molecule, so each
+                key is only made once. Selectors created with the
+                default key maker share a single cache of InChIs with
+                the EA.
 
             num_processes:
                 The number of parallel processes the EA should create.
                 If ``None``, all available cores will be used.
         """
+        inchi = CachedKeyMaker(Inchi())
+        if type(key_maker) is Inchi:
+            key_maker = inchi
+        else:
+            key_maker = get_cached_key_maker(key_maker)
+        generation_selector = generation_selector._with_shared_key_maker(inchi)
+        mutation_selector = mutation_selector._with_shared_key_maker(inchi)
+        crossover_selector = crossover_selector._with_shared_key_maker(inchi)
         if num_processes == 1:
             self._implementation = Serial(
                 initial_population=initial_population,
@@ -14,7 +14,6 @@ from stk._internal.ea.fitness_normalizers.fitness_normalizer import (
 from stk._internal.ea.molecule_record import MoleculeRecord
 from stk._internal.ea.mutation.mutator import MoleculeMutator
 from stk._internal.ea.mutation.record import MutationRecord
-from stk._internal.ea.selection.batch import Batch
 from stk._internal.ea.selection.selectors.selector import Selector
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
@@ -60,13 +59,29 @@ class Implementation(typing.Generic[T]):
         num_generations: int,
         map_: Map,
     ) -> Iterator[Generation[T]]:
-        def get_mutation_record(batch: Batch[T]) -> MutationRecord[T] | None:
-            return self._mutator.mutate(next(iter(batch)))
-
         def get_key(record: T) -> str:
             return self._key_maker.get_key(record.get_molecule())
 
-        population, keys = dedupe(self._initial_population, get_key)
+        # Graph keys are kept for each record, so that the keys of
+        # records which survive a generation are not made again.
+        record_graph_keys: dict[T, str | None] = {}
+
+        def get_graph_key(record: T) -> str | None:
+            if record not in record_graph_keys:
+                record_graph_keys[record] = (
+                    self._key_maker.get_topology_graph_key(
+                        record.get_topology_graph()
+                    )
+                )
+            return record_graph_keys[record]
+
+        population, graph_keys = dedupe(
+            items=self._initial_population,
+            get_key=get_graph_key,
+        )
+        records = construct(population, map_)
+        record_graph_keys.update(zip(records, map(get_graph_key, population)))
+        population, keys = dedupe(records, get_key)
 
         self._logger.info("Calculating fitness values of initial population.")
         fitness_values = dict(
@@ -98,31 +113,65 @@ class Implementation(typing.Generic[T]):
 
             self._logger.info("Doing mutations.")
             mutation_records = tuple(
-                record
-                for record in map(
-                    get_mutation_record,
-                    self._mutation_selector.select(normalized_fitness_values),
-                )
-                if record is not None
+                self._get_mutation_records(normalized_fitness_values)
             )
 
             self._logger.info("Calculating fitness values.")
 
-            offspring, keys = dedupe(
+            # Duplicates are rejected by their topology graph first,
+            # so that they are never constructed.
+            offspring, graph_keys = dedupe(
                 items=(
                     record.get_molecule_record()
                     for record in crossover_records
                 ),
-                get_key=get_key,
-                seen=keys,
+                get_key=get_graph_key,
+                seen=graph_keys,
             )
-            mutants, keys = dedupe(
+            mutants, graph_keys = dedupe(
                 items=(
                     record.get_molecule_record() for record in mutation_records
                 ),
-                get_key=get_key,
-                seen=keys,
+                get_key=get_graph_key,
+                seen=graph_keys,
+            )
+            self._logger.info("Constructing offspring.")
+            # map_ may construct copies of the records, so the records
+            # are replaced by the ones it returns.
+            constructed = dict(
+                zip(
+                    itertools.chain(offspring, mutants),
+                    construct(itertools.chain(offspring, mutants), map_),
+                )
+            )
+            record_graph_keys.update(
+                (record, get_graph_key(unconstructed))
+                for unconstructed, record in constructed.items()
+            )
+            offspring = [constructed[record] for record in offspring]
+            mutants = [constructed[record] for record in mutants]
+            crossover_records = tuple(
+                CrossoverRecord(
+                    molecule_record=constructed.get(
+                        record.get_molecule_record(),
+                        record.get_molecule_record(),
+                    ),
+                    crosser_name=record.get_crosser_name(),
+                )
+                for record in crossover_records
             )
+            mutation_records = tuple(
+                MutationRecord(
+                    molecule_record=constructed.get(
+                        record.get_molecule_record(),
+                        record.get_molecule_record(),
+                    ),
+                    mutator_name=record.get_mutator_name(),
+                )
+                for record in mutation_records
+            )
+            offspring, keys = dedupe(offspring, get_key, keys)
+            mutants, keys = dedupe(mutants, get_key, keys)
             fitness_values.update(
                 zip(
                     itertools.chain(offspring, mutants),
@@ -144,6 +193,12 @@ class Implementation(typing.Generic[T]):
                 ),
                 get_key=get_key,
             )
+            record_graph_keys = {
+                record: get_graph_key(record) for record in population
+            }
+            graph_keys = {
+                key for key in record_graph_keys.values() if key is not None
+            }
             fitness_values = {
                 record: fitness_values[record] for record in population
             }
@@ -169,17 +224,58 @@ class Implementation(typing.Generic[T]):
         for batch in self._crossover_selector.select(population):
             yield from self._crosser.cross(tuple(batch))
 
+    def _get_mutation_records(
+        self,
+        population: dict[T, float],
+    ) -> Iterator[MutationRecord[T]]:
+        for (record,) in self._mutation_selector.select(population):
+            mutation_record = self._mutator.mutate(record)
+            if mutation_record is not None:
+                yield mutation_record
+
 
 def dedupe(
     items: Iterable[A],
-    get_key: Callable[[A], str],
+    get_key: Callable[[A], str | None],
     seen: set[str] | None = None,
 ) -> tuple[list[A], set[str]]:
     if seen is None:
         seen = set()
     unique = []
     for item in items:
-        if (key := get_key(item)) not in seen:
+        key = get_key(item)
+        if key is None:
+            unique.append(item)
+        elif key not in seen:
             unique.append(item)
             seen.add(key)
     return unique, seen
+
+
+def construct(records: Iterable[T], map_: Map) -> list[T]:
+    """
+    Construct the molecules of `records` with `map_`.
+
+    Returns:
+        `records`, where each record which was not constructed is
+        replaced by the record returned by `map_`. If `map_` sends
+        records to other processes, these are copies.
+    """
+
+    constructed = list(records)
+    unconstructed = [
+        index
+        for index, record in enumerate(constructed)
+        if not record.is_constructed()
+    ]
+    for index, record in zip(
+        unconstructed,
+        map_(_construct, [constructed[index] for index in unconstructed]),
+    ):
+        constructed[index] = record
+    return constructed
+
+
+def _construct(record: T) -> T:
+    record.get_molecule()
+    return record
@@ -26,18 +26,34 @@ class MoleculeRecord(typing.Generic[T]):
             topology_graph:
                 The topology graph of a :class:`.ConstructedMolecule`.
         """
-        self._molecule = ConstructedMolecule(topology_graph)
+        self._molecule: ConstructedMolecule | None = None
         self._topology_graph = topology_graph
 
     def get_molecule(self) -> ConstructedMolecule:
         """
         Get the molecule held by the record.
 
+        The molecule is constructed the first time this method is
+        called, so that records which are discarded, for example as
+        duplicates, are never constructed.
+
         Returns:
             The molecule held by the record.
         """
+        if self._molecule is None:
+            self._molecule = ConstructedMolecule(self._topology_graph)
         return self._molecule
 
+    def is_constructed(self) -> bool:
+        """
+        Check if the molecule of the record has been constructed.
+
+        Returns:
+            ``True`` if :meth:`get_molecule` has constructed the
+            molecule.
+        """
+        return self._molecule is not None
+
     def get_topology_graph(self) -> T:
         """
         Get the topology graph of the molecule.
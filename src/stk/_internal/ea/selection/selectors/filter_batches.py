@@ -1,6 +1,8 @@
+import copy
 import typing
 
 from stk._internal.ea.molecule_record import MoleculeRecord
+from stk._internal.key_makers.cached import CachedKeyMaker
 
 from .selector import ExcludedBatches, IncludedBatches, Selector
 
@@ -61,6 +63,15 @@ class FilterBatches(Selector[T]):
         self._filter = filter
         self._selector = selector
 
+    def _with_shared_key_maker(
+        self,
+        key_maker: CachedKeyMaker,
+    ) -> typing.Self:
+        clone = copy.copy(self)
+        clone._filter = self._filter._with_shared_key_maker(key_maker)
+        clone._selector = self._selector._with_shared_key_maker(key_maker)
+        return clone
+
     def select(
         self,
         population: dict[T, float],
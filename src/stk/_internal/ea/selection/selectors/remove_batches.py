@@ -1,8 +1,10 @@
+import copy
 import typing
 from collections.abc import Iterator
 
 from stk._internal.ea.molecule_record import MoleculeRecord
 from stk._internal.ea.selection.batch import Batch
+from stk._internal.key_makers.cached import CachedKeyMaker
 
 from .selector import ExcludedBatches, IncludedBatches, Selector
 
@@ -59,6 +61,15 @@ class RemoveBatches(Selector[T]):
         self._remover = remover
         self._selector = selector
 
+    def _with_shared_key_maker(
+        self,
+        key_maker: CachedKeyMaker,
+    ) -> typing.Self:
+        clone = copy.copy(self)
+        clone._remover = self._remover._with_shared_key_maker(key_maker)
+        clone._selector = self._selector._with_shared_key_maker(key_maker)
+        return clone
+
     def select(
         self,
         population: dict[T, float],
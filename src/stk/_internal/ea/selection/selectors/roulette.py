@@ -1,14 +1,16 @@
 import typing
-from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Set as AbstractSet
 
 import numpy as np
 
 from stk._internal.ea.molecule_record import MoleculeRecord
-from stk._internal.ea.selection.batch import Batch
+from stk._internal.ea.selection.batch import Batch, BatchKey
 from stk._internal.ea.selection.selectors.yielded_batches import YieldedBatches
 from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
+from .sampling import BatchSampler, get_is_eligible
 from .selector import Selector
 
 T = typing.TypeVar("T", bound=MoleculeRecord)
@@ -108,6 +110,7 @@ class Roulette(Selector[T]):
             [dict[T, float]], dict[T, float]
         ] = lambda x: x,
         random_seed: int | np.random.Generator | None = None,
+        batch_sampling: bool = False,
     ) -> None:
         """
         Parameters:
@@ -138,8 +141,21 @@ class Roulette(Selector[T]):
 
             random_seed:
                 The random seed to use.
+
+            batch_sampling:
+                If ``True``, batches are drawn from the population when
+                they are needed, instead of making every possible batch
+                first. Use this when `batch_size` is larger than ``1``
+                and the population is large, because the number of
+                possible batches grows combinatorially. The
+                probability of yielding a batch is unchanged.
         """
-        super().__init__(key_maker, fitness_modifier, batch_size)
+        super().__init__(
+            key_maker=key_maker,
+            fitness_modifier=fitness_modifier,
+            batch_size=batch_size,
+            batch_sampling=batch_sampling,
+        )
 
         if random_seed is None or isinstance(random_seed, int):
             random_seed = np.random.default_rng(random_seed)
@@ -156,23 +172,100 @@ class Roulette(Selector[T]):
         batches: Sequence[Batch[T]],
         yielded_batches: YieldedBatches[T],
     ) -> Iterator[Batch[T]]:
-        while batches and yielded_batches.get_num() < self._num_batches:
-            total = sum(batch.get_fitness_value() for batch in batches)
-            weights = [batch.get_fitness_value() / total for batch in batches]
-            yield self._generator.choice(
-                batches,  # type: ignore
-                p=weights,
-            )
-
-            if not self._duplicate_molecules:
-                batches_ = filter(
-                    yielded_batches.has_no_yielded_molecules,
-                    batches,
+        fitness_values = np.array(
+            [batch.get_fitness_value() for batch in batches],
+            dtype=np.float64,
+        )
+        # Batches which can no longer be yielded are masked out, by
+        # setting their fitness value to 0, instead of filtering
+        # every batch after each yield.
+        batch_indices = _get_indices(
+            batches=batches,
+            get_keys=lambda batch: (batch.get_identity_key(),),
+            skip=self._duplicate_batches,
+        )
+        molecule_indices = _get_indices(
+            batches=batches,
+            get_keys=lambda batch: (
+                self._key_maker.get_key(record.get_molecule())
+                for record in batch
+            ),
+            skip=self._duplicate_molecules,
+        )
+        while yielded_batches.get_num() < self._num_batches:
+            total = fitness_values.sum()
+            if total <= 0:
+                return
+            # Masked batches have a probability of 0, so a given seed
+            # selects the same batches as drawing from the unmasked ones.
+            batch = batches[
+                int(
+                    self._generator.choice(
+                        len(batches),
+                        p=fitness_values / total,
+                    )
                 )
+            ]
+            yield batch
+
             if not self._duplicate_batches:
-                batches_ = filter(
-                    yielded_batches.is_unyielded_batch,
-                    batches,
-                )
-            if not self._duplicate_molecules or not self._duplicate_batches:
-                batches = tuple(batches_)
+                fitness_values[batch_indices[batch.get_identity_key()]] = 0
+            if not self._duplicate_molecules:
+                for record in batch:
+                    key = self._key_maker.get_key(record.get_molecule())
+                    fitness_values[molecule_indices[key]] = 0
+
+    def _select_by_sampling(
+        self,
+        population: dict[T, float],
+        is_allowed: Callable[[Batch[T]], bool],
+        yielded_batches: YieldedBatches[T],
+        included_batches: AbstractSet[BatchKey] | None,
+    ) -> Iterator[Batch[T]]:
+        sampler = BatchSampler(
+            population=population,
+            batch_size=self._batch_size,
+            key_maker=self._key_maker,
+            generator=self._generator,
+            is_allowed=get_is_eligible(
+                is_allowed=is_allowed,
+                yielded_batches=yielded_batches,
+                duplicate_molecules=self._duplicate_molecules,
+                duplicate_batches=self._duplicate_batches,
+            ),
+            included_batches=included_batches,
+        )
+
+        while yielded_batches.get_num() < self._num_batches:
+            batch = sampler.sample(weighted=True)
+            # The sampler only gives up when no eligible batch is left.
+            if batch is None:
+                return
+            yield batch
+
+
+def _get_indices(
+    batches: Sequence[Batch[T]],
+    get_keys: Callable[[Batch[T]], Iterable[typing.Hashable]],
+    skip: bool,
+) -> dict[typing.Hashable, list[int]]:
+    """
+    Map keys to the indices of the batches they are found in.
+
+    Parameters:
+        batches:
+            The batches to index.
+        get_keys:
+            Takes a batch and returns its keys.
+        skip:
+            If ``True``, the index is not needed and is left empty.
+    Returns:
+        Maps each key to the indices of the batches which have it.
+    """
+    indices: dict[typing.Hashable, list[int]] = {}
+    if skip:
+        return indices
+    for index, batch in enumerate(batches):
+        for key in get_keys(batch):
+            indices.setdefault(key, []).append(index)
+    return indices
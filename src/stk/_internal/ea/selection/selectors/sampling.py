@@ -0,0 +1,356 @@
+import itertools
+import math
+import typing
+from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+
+import numpy as np
+
+from stk._internal.ea.molecule_record import MoleculeRecord
+from stk._internal.key_makers.molecule import MoleculeKeyMaker
+
+from ..batch import Batch, BatchKey
+from .yielded_batches import YieldedBatches
+
+T = typing.TypeVar("T", bound=MoleculeRecord)
+
+
+class BatchSampler(typing.Generic[T]):
+    """
+    Draws batches from a population, without making every batch.
+
+    Batches are drawn by rejection sampling, so memory use does not
+    depend on the number of possible batches. If the batches which
+    can be drawn are given explicitly, they are made up front and
+    drawn from directly instead.
+    """
+
+    def __init__(
+        self,
+        population: dict[T, float],
+        batch_size: int,
+        key_maker: MoleculeKeyMaker,
+        generator: np.random.Generator,
+        is_allowed: Callable[[Batch[T]], bool],
+        included_batches: AbstractSet[BatchKey] | None = None,
+        max_attempts: int = 1000,
+    ) -> None:
+        """
+        Parameters:
+            population:
+                The molecule records which are to be batched, mapped
+                to their fitness values.
+
+            batch_size:
+                The number of records in a batch.
+
+            key_maker:
+                Used to get the keys of molecules in a batch.
+
+            generator:
+                The random number generator to use.
+
+            is_allowed:
+                Takes a drawn batch and returns ``True`` if the batch
+                can be returned. Batches which are not allowed are
+                drawn again.
+
+            included_batches:
+                The identity keys of the only batches which can be
+                drawn. If ``None``, any batch can be drawn.
+
+            max_attempts:
+                The maximum number of batches drawn at random by a
+                single call to :meth:`sample`. If none of them can be
+                returned, the remaining batches are made and drawn
+                from directly. Not used if `included_batches` is not
+                ``None``.
+        """
+        self._population = population
+        self._records = tuple(population)
+        self._batch_size = batch_size
+        self._key_maker = key_maker
+        self._generator = generator
+        self._is_allowed = is_allowed
+        self._max_attempts = max_attempts
+        self._included_batches = (
+            None
+            if included_batches is None
+            else tuple(self._get_included_batches(included_batches))
+        )
+        fitness_values = np.array(
+            [population[record] for record in self._records],
+            dtype=np.float64,
+        )
+        if self._included_batches is not None:
+            # A record is drawn as the anchor in proportion to its
+            # fitness value and the number of batches it is in, so
+            # that the probability of a batch stays proportional to
+            # the sum of its fitness values.
+            num_batches = np.zeros(len(self._records), dtype=np.float64)
+            for indices, _ in self._included_batches:
+                num_batches[list(indices)] += 1
+            fitness_values *= num_batches
+        total = fitness_values.sum()
+        self._weights = fitness_values / total if total else fitness_values
+
+    def _get_included_batches(
+        self,
+        included_batches: AbstractSet[BatchKey],
+    ) -> Iterator[tuple[tuple[int, ...], Batch[T]]]:
+        """
+        Make every batch of the population in `included_batches`.
+
+        Parameters:
+            included_batches:
+                The identity keys of the batches to make.
+
+        Yields:
+            The indices of the records in a batch, and the batch.
+        """
+        indices: dict[str, list[int]] = {}
+        for index, record in enumerate(self._records):
+            key = self._key_maker.get_key(record.get_molecule())
+            indices.setdefault(key, []).append(index)
+
+        batches = set()
+        for batch_key in included_batches:
+            if sum(count for _, count in batch_key) != self._batch_size:
+                continue
+            # Records with the same molecule are interchangeable, so
+            # every combination of them makes a batch with this key.
+            for combination in itertools.product(
+                *(
+                    itertools.combinations(indices.get(key, ()), count)
+                    for key, count in batch_key
+                )
+            ):
+                batches.add(tuple(sorted(itertools.chain(*combination))))
+
+        for batch_indices in sorted(batches):
+            yield batch_indices, self._get_batch(batch_indices)
+
+    def _get_batch(self, indices: Iterable[int]) -> Batch[T]:
+        return Batch(
+            records=(
+                (record, self._population[record])
+                for record in (self._records[index] for index in indices)
+            ),
+            key_maker=self._key_maker,
+        )
+
+    def get_num_batches(self) -> int:
+        """
+        Get the number of possible batches.
+
+        Returns:
+            The number of possible batches.
+        """
+        if self._included_batches is not None:
+            return len(self._included_batches)
+        return math.comb(len(self._records), self._batch_size)
+
+    def get_weights(self) -> np.ndarray:
+        """
+        Get the probability of drawing each record as the anchor.
+
+        Returns:
+            The probability of each record, in the iteration order of
+            the population.
+        """
+        return self._weights
+
+    def sample(
+        self,
+        weighted: bool,
+        anchor: int | None = None,
+        excluded_batches: AbstractSet[BatchKey] = frozenset(),
+    ) -> Batch[T] | None:
+        """
+        Draw an allowed batch.
+
+        Parameters:
+            weighted:
+                If ``True``, the probability of drawing a batch is
+                proportional to its fitness value, otherwise all
+                batches are equally likely.
+
+            anchor:
+                The index of a record, which must be in the batch.
+                If ``None``, the anchor is drawn. When the anchor is
+                drawn with probability proportional to its fitness
+                value, and the rest of the batch is drawn uniformly,
+                the probability of a batch is proportional to the sum
+                of its fitness values.
+
+            excluded_batches:
+                The identity keys of batches which must not be drawn,
+                in addition to those which are not allowed.
+
+        Returns:
+            The batch, or ``None`` if no batch can be drawn.
+        """
+        if self._included_batches is not None:
+            return self._sample_included(weighted, anchor, excluded_batches)
+
+        num_records = len(self._records)
+        if num_records < self._batch_size:
+            return None
+
+        for _ in range(self._max_attempts):
+            if anchor is not None:
+                anchor_ = anchor
+            elif weighted:
+                anchor_ = int(
+                    self._generator.choice(num_records, p=self._weights)
+                )
+            else:
+                anchor_ = int(self._generator.integers(num_records))
+            others = self._generator.choice(
+                num_records - 1,
+                size=self._batch_size - 1,
+                replace=False,
+            )
+            # Skip over the anchor.
+            others[others >= anchor_] += 1
+            batch = self._get_batch(sorted((anchor_, *others)))
+            if (
+                batch.get_identity_key() not in excluded_batches
+                and self._is_allowed(batch)
+            ):
+                return batch
+
+        # Few batches are left to draw, so they are found by making
+        # every batch, rather than ending selection early.
+        return self._choose(
+            batches=[
+                batch
+                for batch in map(self._get_batch, self._get_indices(anchor))
+                if batch.get_identity_key() not in excluded_batches
+                and self._is_allowed(batch)
+            ],
+            weighted=weighted and anchor is None,
+        )
+
+    def _get_indices(self, anchor: int | None) -> Iterator[tuple[int, ...]]:
+        """
+        Yield the indices of the records in every possible batch.
+
+        Parameters:
+            anchor:
+                The index of a record, which must be in the batch.
+                If ``None``, any batch is yielded.
+
+        Yields:
+            The sorted indices of the records in a batch.
+        """
+        indices = range(len(self._records))
+        if anchor is None:
+            yield from itertools.combinations(indices, self._batch_size)
+            return
+        for others in itertools.combinations(
+            (index for index in indices if index != anchor),
+            self._batch_size - 1,
+        ):
+            yield tuple(sorted((anchor, *others)))
+
+    def _sample_included(
+        self,
+        weighted: bool,
+        anchor: int | None,
+        excluded_batches: AbstractSet[BatchKey],
+    ) -> Batch[T] | None:
+        """
+        Draw an allowed batch from the included batches.
+
+        Parameters are the same as for :meth:`sample`.
+
+        Returns:
+            The batch, or ``None`` if no included batch is allowed.
+        """
+        assert self._included_batches is not None
+        return self._choose(
+            batches=[
+                batch
+                for indices, batch in self._included_batches
+                if (anchor is None or anchor in indices)
+                and batch.get_identity_key() not in excluded_batches
+                and self._is_allowed(batch)
+            ],
+            weighted=weighted and anchor is None,
+        )
+
+    def _choose(
+        self,
+        batches: list[Batch[T]],
+        weighted: bool,
+    ) -> Batch[T] | None:
+        """
+        Choose one of `batches`.
+
+        Parameters:
+            batches:
+                The batches to choose from.
+
+            weighted:
+                If ``True``, the probability of choosing a batch is
+                proportional to its fitness value, otherwise all
+                batches are equally likely.
+
+        Returns:
+            The batch, or ``None`` if no batch can be chosen.
+        """
+        if not batches:
+            return None
+        if not weighted:
+            return batches[self._generator.integers(len(batches))]
+
+        fitness_values = np.array(
+            [batch.get_fitness_value() for batch in batches],
+            dtype=np.float64,
+        )
+        total = fitness_values.sum()
+        if total <= 0:
+            return None
+        return batches[
+            self._generator.choice(len(batches), p=fitness_values / total)
+        ]
+
+
+def get_is_eligible(
+    is_allowed: Callable[[Batch[T]], bool],
+    yielded_batches: YieldedBatches[T],
+    duplicate_molecules: bool,
+    duplicate_batches: bool,
+) -> Callable[[Batch[T]], bool]:
+    """
+    Get a function which checks if a batch can be yielded.
+
+    Parameters:
+        is_allowed:
+            Takes a batch and returns ``True`` if it is allowed by
+            the included and excluded batches.
+        yielded_batches:
+            Keeps track of which batches have been yielded.
+        duplicate_molecules:
+            If ``True`` the same molecule can be yielded in more than
+            one batch.
+        duplicate_batches:
+            If ``True`` the same batch can be yielded more than once.
+    Returns:
+        Takes a batch and returns ``True`` if it can be yielded.
+    """
+
+    def is_eligible(batch: Batch[T]) -> bool:
+        return (
+            is_allowed(batch)
+            and (
+                duplicate_molecules
+                or yielded_batches.has_no_yielded_molecules(batch)
+            )
+            and (
+                duplicate_batches or yielded_batches.is_unyielded_batch(batch)
+            )
+        )
+
+    return is_eligible
@@ -1,9 +1,15 @@
+import copy
 import itertools
 import logging
 import typing
 from collections.abc import Callable, Iterator, Sequence, Set
 
 from stk._internal.ea.molecule_record import MoleculeRecord
+from stk._internal.key_makers.cached import (
+    CachedKeyMaker,
+    get_cached_key_maker,
+)
+from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
 from ..batch import Batch, BatchKey
@@ -72,6 +78,7 @@ class Selector(typing.Generic[T]):
         key_maker: MoleculeKeyMaker,
         fitness_modifier: Callable[[dict[T, float]], dict[T, float]],
         batch_size: int,
+        batch_sampling: bool = False,
     ) -> None:
         """
         Parameters:
@@ -88,10 +95,21 @@ class Selector(typing.Generic[T]):
 
             batch_size:
                 The number of molecules yielded at once.
+
+            batch_sampling:
+                If ``True``, batches are drawn from the population when
+                they are needed, with :meth:`._select_by_sampling`,
+                instead of making every possible batch first.
         """
-        self._key_maker = key_maker
+        # Batches and filters get the keys of the same molecules
+        # many times.
+        self._key_maker = get_cached_key_maker(key_maker)
+        # Plain InChI key makers, such as the default one, all make the
+        # same keys, so their cache can be shared with an EA.
+        self._has_inchi_key_maker = type(key_maker) is Inchi
         self._fitness_modifier = fitness_modifier
         self._batch_size = batch_size
+        self._batch_sampling = batch_sampling
 
     def select(
         self,
@@ -119,19 +137,27 @@ class Selector(typing.Generic[T]):
         Yields:
             A batch of selected molecule records.
         """
-        batches = tuple(
-            self._get_batches(
+        yielded_batches: YieldedBatches[T] = YieldedBatches(self._key_maker)
+        if self._batch_sampling:
+            selected = self._select_by_sampling(
                 population=self._fitness_modifier(population),
+                is_allowed=_get_is_allowed(included_batches, excluded_batches),
+                yielded_batches=yielded_batches,
                 included_batches=included_batches,
-                excluded_batches=excluded_batches,
             )
-        )
+        else:
+            selected = self._select_from_batches(
+                batches=tuple(
+                    self._get_batches(
+                        population=self._fitness_modifier(population),
+                        included_batches=included_batches,
+                        excluded_batches=excluded_batches,
+                    )
+                ),
+                yielded_batches=yielded_batches,
+            )
 
-        yielded_batches: YieldedBatches[T] = YieldedBatches(self._key_maker)
-        for batch in self._select_from_batches(
-            batches=batches,
-            yielded_batches=yielded_batches,
-        ):
+        for batch in selected:
             yielded_batches.update(batch)
             yield batch
 
@@ -140,6 +166,31 @@ class Selector(typing.Generic[T]):
             f"{cls_name} yielded {yielded_batches.get_num()} batches."
         )
 
+    def _with_shared_key_maker(
+        self,
+        key_maker: CachedKeyMaker,
+    ) -> typing.Self:
+        """
+        Get a clone which uses `key_maker` in place of an InChI one.
+
+        Parameters:
+            key_maker:
+                A key maker, which makes InChIs and whose cache is
+                shared with other users, such as an
+                :class:`.EvolutionaryAlgorithm`.
+        Returns:
+            A clone using `key_maker`, if this selector was created
+            with a plain :class:`.Inchi` key maker, such as the default
+            one, or this selector otherwise.
+        """
+        # Subclasses which do not call Selector.__init__ keep their
+        # own key makers.
+        if not getattr(self, "_has_inchi_key_maker", False):
+            return self
+        clone = copy.copy(self)
+        clone._key_maker = key_maker
+        return clone
+
     def _get_batches(
         self,
         population: dict[T, float],
@@ -168,22 +219,13 @@ class Selector(typing.Generic[T]):
                 A batch of molecules from `population`.
         """
 
-        def is_included(batch: Batch[T]) -> bool:
-            if included_batches is None:
-                return True
-            return batch.get_identity_key() in included_batches
-
-        def is_excluded(batch: Batch[T]) -> bool:
-            if excluded_batches is None:
-                return False
-            return batch.get_identity_key() in excluded_batches
-
+        is_allowed = _get_is_allowed(included_batches, excluded_batches)
         for records in itertools.combinations(population, self._batch_size):
             batch = Batch(
                 records=((record, population[record]) for record in records),
                 key_maker=self._key_maker,
             )
-            if is_included(batch) and not is_excluded(batch):
+            if is_allowed(batch):
                 yield batch
 
     def _select_from_batches(
@@ -204,3 +246,47 @@ class Selector(typing.Generic[T]):
             A selected batch.
         """
         raise NotImplementedError()
+
+    def _select_by_sampling(
+        self,
+        population: dict[T, float],
+        is_allowed: Callable[[Batch[T]], bool],
+        yielded_batches: YieldedBatches[T],
+        included_batches: Set[BatchKey] | None,
+    ) -> Iterator[Batch[T]]:
+        """
+        Yield batches drawn from `population`.
+
+        Used instead of :meth:`._select_from_batches` when batch
+        sampling is on.
+
+        Parameters:
+            population:
+                The molecule records which are to be batched.
+            is_allowed:
+                Takes a batch and returns ``True`` if it can be
+                yielded, based on the included and excluded batches.
+            yielded_batches:
+                Keeps track of which batches have been yielded. This
+                object automatically updates each time ``yield`` is called.
+            included_batches:
+                The identity keys of batches which are allowed to be
+                yielded, if ``None`` all batches can be yielded. If not
+                ``None``, batches are drawn from these directly.
+        Yields:
+            A selected batch.
+        """
+        raise NotImplementedError()
+
+
+def _get_is_allowed(
+    included_batches: Set[BatchKey] | None,
+    excluded_batches: Set[BatchKey] | None,
+) -> Callable[[Batch[T]], bool]:
+    def is_allowed(batch: Batch[T]) -> bool:
+        key = batch.get_identity_key()
+        if included_batches is not None and key not in included_batches:
+            return False
+        return excluded_batches is None or key not in excluded_batches
+
+    return is_allowed
@@ -1,14 +1,16 @@
 import typing
 from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Set as AbstractSet
 
 import numpy as np
 
 from stk._internal.ea.molecule_record import MoleculeRecord
-from stk._internal.ea.selection.batch import Batch
+from stk._internal.ea.selection.batch import Batch, BatchKey
 from stk._internal.ea.selection.selectors.yielded_batches import YieldedBatches
 from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
+from .sampling import BatchSampler, get_is_eligible
 from .selector import Selector
 
 T = typing.TypeVar("T", bound=MoleculeRecord)
@@ -76,6 +78,7 @@ class StochasticUniversalSampling(Selector[T]):
             [dict[T, float]], dict[T, float]
         ] = lambda x: x,
         random_seed: int | np.random.Generator | None = None,
+        batch_sampling: bool = False,
     ) -> None:
         """
         Parameters:
@@ -107,8 +110,23 @@ class StochasticUniversalSampling(Selector[T]):
 
             random_seed:
                 The random seed to use.
+
+            batch_sampling:
+                If ``True``, batches are drawn from the population when
+                they are needed, instead of making every possible batch
+                first. Use this when `batch_size` is larger than ``1``
+                and the population is large, because the number of
+                possible batches grows combinatorially. Pointers
+                are then laid out over molecules, and the rest of each
+                batch is drawn uniformly, so the probability of
+                yielding a batch is unchanged.
         """
-        super().__init__(key_maker, fitness_modifier, batch_size)
+        super().__init__(
+            key_maker=key_maker,
+            fitness_modifier=fitness_modifier,
+            batch_size=batch_size,
+            batch_sampling=batch_sampling,
+        )
 
         if random_seed is None or isinstance(random_seed, int):
             random_seed = np.random.default_rng(random_seed)
@@ -203,3 +221,59 @@ class StochasticUniversalSampling(Selector[T]):
                 continue
 
             yield batch
+
+    def _select_by_sampling(
+        self,
+        population: dict[T, float],
+        is_allowed: Callable[[Batch[T]], bool],
+        yielded_batches: YieldedBatches[T],
+        included_batches: AbstractSet[BatchKey] | None,
+    ) -> Iterator[Batch[T]]:
+        sampler = BatchSampler(
+            population=population,
+            batch_size=self._batch_size,
+            key_maker=self._key_maker,
+            generator=self._generator,
+            is_allowed=get_is_eligible(
+                is_allowed=is_allowed,
+                yielded_batches=yielded_batches,
+                duplicate_molecules=self._duplicate_molecules,
+                duplicate_batches=self._duplicate_batches,
+            ),
+            included_batches=included_batches,
+        )
+
+        # Pointers are laid out over molecules, rather than batches.
+        # Each pointer selects the molecule it points to, and the rest
+        # of its batch is drawn uniformly, which means the probability
+        # of a batch is still proportional to its fitness value.
+        # Molecules which are not in any eligible batch are removed
+        # from the line before the next round.
+        weights = sampler.get_weights().copy()
+        while (
+            yielded_batches.get_num() < self._num_batches and weights.sum() > 0
+        ):
+            molecule_positions = np.cumsum(weights / weights.sum())
+            num_pointers = typing.cast(
+                int,
+                min(
+                    self._num_batches - yielded_batches.get_num(),
+                    sampler.get_num_batches(),
+                    len(population),
+                ),
+            )
+            pointer_distance = 1 / num_pointers
+            pointers = (
+                self._generator.uniform(0, pointer_distance)
+                + np.arange(num_pointers) * pointer_distance
+            )
+            anchors = np.minimum(
+                np.searchsorted(molecule_positions, pointers),
+                len(population) - 1,
+            )
+            for anchor in anchors:
+                batch = sampler.sample(weighted=True, anchor=int(anchor))
+                if batch is None:
+                    weights[anchor] = 0
+                else:
+                    yield batch
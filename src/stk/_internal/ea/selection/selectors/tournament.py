@@ -1,14 +1,16 @@
 import typing
 from collections.abc import Callable, Iterator, Sequence
+from collections.abc import Set as AbstractSet
 
 import numpy as np
 
 from stk._internal.ea.molecule_record import MoleculeRecord
-from stk._internal.ea.selection.batch import Batch
+from stk._internal.ea.selection.batch import Batch, BatchKey
 from stk._internal.ea.selection.selectors.yielded_batches import YieldedBatches
 from stk._internal.key_makers.inchi import Inchi
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 
+from .sampling import BatchSampler, get_is_eligible
 from .selector import Selector
 
 T = typing.TypeVar("T", bound=MoleculeRecord)
@@ -70,6 +72,7 @@ class Tournament(Selector[T]):
             [dict[T, float]], dict[T, float]
         ] = lambda x: x,
         random_seed: int | np.random.Generator | None = None,
+        batch_sampling: bool = False,
     ) -> None:
         """
         Parameters:
@@ -100,8 +103,21 @@ class Tournament(Selector[T]):
 
             random_seed:
                 The random seed to use.
+
+            batch_sampling:
+                If ``True``, batches are drawn from the population when
+                they are needed, instead of making every possible batch
+                first. Use this when `batch_size` is larger than ``1``
+                and the population is large, because the number of
+                possible batches grows combinatorially. Tournaments
+                are then no larger than the population.
         """
-        super().__init__(key_maker, fitness_modifier, batch_size)
+        super().__init__(
+            key_maker=key_maker,
+            fitness_modifier=fitness_modifier,
+            batch_size=batch_size,
+            batch_sampling=batch_sampling,
+        )
 
         if random_seed is None or isinstance(random_seed, int):
             random_seed = np.random.default_rng(random_seed)
@@ -145,3 +161,50 @@ class Tournament(Selector[T]):
                 )
             if not self._duplicate_molecules or not self._duplicate_batches:
                 batches = tuple(batches_)
+
+    def _select_by_sampling(
+        self,
+        population: dict[T, float],
+        is_allowed: Callable[[Batch[T]], bool],
+        yielded_batches: YieldedBatches[T],
+        included_batches: AbstractSet[BatchKey] | None,
+    ) -> Iterator[Batch[T]]:
+        sampler = BatchSampler(
+            population=population,
+            batch_size=self._batch_size,
+            key_maker=self._key_maker,
+            generator=self._generator,
+            is_allowed=get_is_eligible(
+                is_allowed=is_allowed,
+                yielded_batches=yielded_batches,
+                duplicate_molecules=self._duplicate_molecules,
+                duplicate_batches=self._duplicate_batches,
+            ),
+            included_batches=included_batches,
+        )
+
+        # Tournaments are no larger than the population, so that
+        # their size does not depend on the number of possible batches.
+        max_tournament_size = min(sampler.get_num_batches(), len(population))
+        while (
+            max_tournament_size > 1
+            and yielded_batches.get_num() < self._num_batches
+        ):
+            tournament_size = self._generator.integers(
+                low=2, high=max_tournament_size + 1
+            )
+            # Competitors are drawn without replacement.
+            competitors: dict[BatchKey, Batch[T]] = {}
+            for _ in range(tournament_size):
+                batch = sampler.sample(
+                    weighted=False,
+                    excluded_batches=competitors.keys(),
+                )
+                if batch is None:
+                    break
+                competitors[batch.get_identity_key()] = batch
+            # The tournament can only take place if there is more than
+            # 1 batch.
+            if len(competitors) < 2:
+                return
+            yield max(competitors.values())
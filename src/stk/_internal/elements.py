@@ -21,6 +21,8 @@ class AtomImpl(Atom):
 
     """
 
+    __slots__ = []
+
     _atomic_number: ClassVar[int]
 
     def __init_subclass__(cls: type[AtomImpl], **kwargs) -> None:
@@ -67,6 +69,7 @@ class AtomImpl(Atom):
 
 
 class H(AtomImpl):
+    __slots__ = []
     _atomic_number = 1
 
     def clone(self) -> H:
@@ -77,6 +80,7 @@ class H(AtomImpl):
 
 
 class He(AtomImpl):
+    __slots__ = []
     _atomic_number = 2
 
     def clone(self) -> He:
@@ -87,6 +91,7 @@ class He(AtomImpl):
 
 
 class Li(AtomImpl):
+    __slots__ = []
     _atomic_number = 3
 
     def clone(self) -> Li:
@@ -97,6 +102,7 @@ class Li(AtomImpl):
 
 
 class Be(AtomImpl):
+    __slots__ = []
     _atomic_number = 4
 
     def clone(self) -> Be:
@@ -107,6 +113,7 @@ class Be(AtomImpl):
 
 
 class B(AtomImpl):
+    __slots__ = []
     _atomic_number = 5
 
     def clone(self) -> B:
@@ -117,6 +124,7 @@ class B(AtomImpl):
 
 
 class C(AtomImpl):
+    __slots__ = []
     _atomic_number = 6
 
     def clone(self) -> C:
@@ -127,6 +135,7 @@ class C(AtomImpl):
 
 
 class N(AtomImpl):
+    __slots__ = []
     _atomic_number = 7
 
     def clone(self) -> N:
@@ -138,6 +147,7 @@ class N(AtomImpl):
 
 # "O" is a valid elemental symbol.
 class O(AtomImpl):  # noqa
+    __slots__ = []
     _atomic_number = 8
 
     def clone(self) -> O:  # noqa
@@ -148,6 +158,7 @@ class O(AtomImpl):  # noqa
 
 
 class F(AtomImpl):
+    __slots__ = []
     _atomic_number = 9
 
     def clone(self) -> F:
@@ -158,6 +169,7 @@ class F(AtomImpl):
 
 
 class Ne(AtomImpl):
+    __slots__ = []
     _atomic_number = 10
 
     def clone(self) -> Ne:
@@ -168,6 +180,7 @@ class Ne(AtomImpl):
 
 
 class Na(AtomImpl):
+    __slots__ = []
     _atomic_number = 11
 
     def clone(self) -> Na:
@@ -178,6 +191,7 @@ class Na(AtomImpl):
 
 
 class Mg(AtomImpl):
+    __slots__ = []
     _atomic_number = 12
 
     def clone(self) -> Mg:
@@ -188,6 +202,7 @@ class Mg(AtomImpl):
 
 
 class Al(AtomImpl):
+    __slots__ = []
     _atomic_number = 13
 
     def clone(self) -> Al:
@@ -198,6 +213,7 @@ class Al(AtomImpl):
 
 
 class Si(AtomImpl):
+    __slots__ = []
     _atomic_number = 14
 
     def clone(self) -> Si:
@@ -208,6 +224,7 @@ class Si(AtomImpl):
 
 
 class P(AtomImpl):
+    __slots__ = []
     _atomic_number = 15
 
     def clone(self) -> P:
@@ -218,6 +235,7 @@ class P(AtomImpl):
 
 
 class S(AtomImpl):
+    __slots__ = []
     _atomic_number = 16
 
     def clone(self) -> S:
@@ -228,6 +246,7 @@ class S(AtomImpl):
 
 
 class Cl(AtomImpl):
+    __slots__ = []
     _atomic_number = 17
 
     def clone(self) -> Cl:
@@ -238,6 +257,7 @@ class Cl(AtomImpl):
 
 
 class Ar(AtomImpl):
+    __slots__ = []
     _atomic_number = 18
 
     def clone(self) -> Ar:
@@ -248,6 +268,7 @@ class Ar(AtomImpl):
 
 
 class K(AtomImpl):
+    __slots__ = []
     _atomic_number = 19
 
     def clone(self) -> K:
@@ -258,6 +279,7 @@ class K(AtomImpl):
 
 
 class Ca(AtomImpl):
+    __slots__ = []
     _atomic_number = 20
 
     def clone(self) -> Ca:
@@ -268,6 +290,7 @@ class Ca(AtomImpl):
 
 
 class Sc(AtomImpl):
+    __slots__ = []
     _atomic_number = 21
 
     def clone(self) -> Sc:
@@ -278,6 +301,7 @@ class Sc(AtomImpl):
 
 
 class Ti(AtomImpl):
+    __slots__ = []
     _atomic_number = 22
 
     def clone(self) -> Ti:
@@ -288,6 +312,7 @@ class Ti(AtomImpl):
 
 
 class V(AtomImpl):
+    __slots__ = []
     _atomic_number = 23
 
     def clone(self) -> V:
@@ -298,6 +323,7 @@ class V(AtomImpl):
 
 
 class Cr(AtomImpl):
+    __slots__ = []
     _atomic_number = 24
 
     def clone(self) -> Cr:
@@ -308,6 +334,7 @@ class Cr(AtomImpl):
 
 
 class Mn(AtomImpl):
+    __slots__ = []
     _atomic_number = 25
 
     def clone(self) -> Mn:
@@ -318,6 +345,7 @@ class Mn(AtomImpl):
 
 
 class Fe(AtomImpl):
+    __slots__ = []
     _atomic_number = 26
 
     def clone(self) -> Fe:
@@ -328,6 +356,7 @@ class Fe(AtomImpl):
 
 
 class Co(AtomImpl):
+    __slots__ = []
     _atomic_number = 27
 
     def clone(self) -> Co:
@@ -338,6 +367,7 @@ class Co(AtomImpl):
 
 
 class Ni(AtomImpl):
+    __slots__ = []
     _atomic_number = 28
 
     def clone(self) -> Ni:
@@ -348,6 +378,7 @@ class Ni(AtomImpl):
 
 
 class Cu(AtomImpl):
+    __slots__ = []
     _atomic_number = 29
 
     def clone(self) -> Cu:
@@ -358,6 +389,7 @@ class Cu(AtomImpl):
 
 
 class Zn(AtomImpl):
+    __slots__ = []
     _atomic_number = 30
 
     def clone(self) -> Zn:
@@ -368,6 +400,7 @@ class Zn(AtomImpl):
 
 
 class Ga(AtomImpl):
+    __slots__ = []
     _atomic_number = 31
 
     def clone(self) -> Ga:
@@ -378,6 +411,7 @@ class Ga(AtomImpl):
 
 
 class Ge(AtomImpl):
+    __slots__ = []
     _atomic_number = 32
 
     def clone(self) -> Ge:
@@ -388,6 +422,7 @@ class Ge(AtomImpl):
 
 
 class As(AtomImpl):
+    __slots__ = []
     _atomic_number = 33
 
     def clone(self) -> As:
@@ -398,6 +433,7 @@ class As(AtomImpl):
 
 
 class Se(AtomImpl):
+    __slots__ = []
     _atomic_number = 34
 
     def clone(self) -> Se:
@@ -408,6 +444,7 @@ class Se(AtomImpl):
 
 
 class Br(AtomImpl):
+    __slots__ = []
     _atomic_number = 35
 
     def clone(self) -> Br:
@@ -418,6 +455,7 @@ class Br(AtomImpl):
 
 
 class Kr(AtomImpl):
+    __slots__ = []
     _atomic_number = 36
 
     def clone(self) -> Kr:
@@ -428,6 +466,7 @@ class Kr(AtomImpl):
 
 
 class Rb(AtomImpl):
+    __slots__ = []
     _atomic_number = 37
 
     def clone(self) -> Rb:
@@ -438,6 +477,7 @@ class Rb(AtomImpl):
 
 
 class Sr(AtomImpl):
+    __slots__ = []
     _atomic_number = 38
 
     def clone(self) -> Sr:
@@ -448,6 +488,7 @@ class Sr(AtomImpl):
 
 
 class Y(AtomImpl):
+    __slots__ = []
     _atomic_number = 39
 
     def clone(self) -> Y:
@@ -458,6 +499,7 @@ class Y(AtomImpl):
 
 
 class Zr(AtomImpl):
+    __slots__ = []
     _atomic_number = 40
 
     def clone(self) -> Zr:
@@ -468,6 +510,7 @@ class Zr(AtomImpl):
 
 
 class Nb(AtomImpl):
+    __slots__ = []
     _atomic_number = 41
 
     def clone(self) -> Nb:
@@ -478,6 +521,7 @@ class Nb(AtomImpl):
 
 
 class Mo(AtomImpl):
+    __slots__ = []
     _atomic_number = 42
 
     def clone(self) -> Mo:
@@ -488,6 +532,7 @@ class Mo(AtomImpl):
 
 
 class Tc(AtomImpl):
+    __slots__ = []
     _atomic_number = 43
 
     def clone(self) -> Tc:
@@ -498,6 +543,7 @@ class Tc(AtomImpl):
 
 
 class Ru(AtomImpl):
+    __slots__ = []
     _atomic_number = 44
 
     def clone(self) -> Ru:
@@ -508,6 +554,7 @@ class Ru(AtomImpl):
 
 
 class Rh(AtomImpl):
+    __slots__ = []
     _atomic_number = 45
 
     def clone(self) -> Rh:
@@ -518,6 +565,7 @@ class Rh(AtomImpl):
 
 
 class Pd(AtomImpl):
+    __slots__ = []
     _atomic_number = 46
 
     def clone(self) -> Pd:
@@ -528,6 +576,7 @@ class Pd(AtomImpl):
 
 
 class Ag(AtomImpl):
+    __slots__ = []
     _atomic_number = 47
 
     def clone(self) -> Ag:
@@ -538,6 +587,7 @@ class Ag(AtomImpl):
 
 
 class Cd(AtomImpl):
+    __slots__ = []
     _atomic_number = 48
 
     def clone(self) -> Cd:
@@ -548,6 +598,7 @@ class Cd(AtomImpl):
 
 
 class In(AtomImpl):
+    __slots__ = []
     _atomic_number = 49
 
     def clone(self) -> In:
@@ -558,6 +609,7 @@ class In(AtomImpl):
 
 
 class Sn(AtomImpl):
+    __slots__ = []
     _atomic_number = 50
 
     def clone(self) -> Sn:
@@ -568,6 +620,7 @@ class Sn(AtomImpl):
 
 
 class Sb(AtomImpl):
+    __slots__ = []
     _atomic_number = 51
 
     def clone(self) -> Sb:
@@ -578,6 +631,7 @@ class Sb(AtomImpl):
 
 
 class Te(AtomImpl):
+    __slots__ = []
     _atomic_number = 52
 
     def clone(self) -> Te:
@@ -589,6 +643,7 @@ class Te(AtomImpl):
 
 # "I" is a valid elemental symbol.
 class I(AtomImpl):  # noqa
+    __slots__ = []
     _atomic_number = 53
 
     def clone(self) -> I:  # noqa
@@ -599,6 +654,7 @@ class I(AtomImpl):  # noqa
 
 
 class Xe(AtomImpl):
+    __slots__ = []
     _atomic_number = 54
 
     def clone(self) -> Xe:
@@ -609,6 +665,7 @@ class Xe(AtomImpl):
 
 
 class Cs(AtomImpl):
+    __slots__ = []
     _atomic_number = 55
 
     def clone(self) -> Cs:
@@ -619,6 +676,7 @@ class Cs(AtomImpl):
 
 
 class Ba(AtomImpl):
+    __slots__ = []
     _atomic_number = 56
 
     def clone(self) -> Ba:
@@ -629,6 +687,7 @@ class Ba(AtomImpl):
 
 
 class La(AtomImpl):
+    __slots__ = []
     _atomic_number = 57
 
     def clone(self) -> La:
@@ -639,6 +698,7 @@ class La(AtomImpl):
 
 
 class Ce(AtomImpl):
+    __slots__ = []
     _atomic_number = 58
 
     def clone(self) -> Ce:
@@ -649,6 +709,7 @@ class Ce(AtomImpl):
 
 
 class Pr(AtomImpl):
+    __slots__ = []
     _atomic_number = 59
 
     def clone(self) -> Pr:
@@ -659,6 +720,7 @@ class Pr(AtomImpl):
 
 
 class Nd(AtomImpl):
+    __slots__ = []
     _atomic_number = 60
 
     def clone(self) -> Nd:
@@ -669,6 +731,7 @@ class Nd(AtomImpl):
 
 
 class Pm(AtomImpl):
+    __slots__ = []
     _atomic_number = 61
 
     def clone(self) -> Pm:
@@ -679,6 +742,7 @@ class Pm(AtomImpl):
 
 
 class Sm(AtomImpl):
+    __slots__ = []
     _atomic_number = 62
 
     def clone(self) -> Sm:
@@ -689,6 +753,7 @@ class Sm(AtomImpl):
 
 
 class Eu(AtomImpl):
+    __slots__ = []
     _atomic_number = 63
 
     def clone(self) -> Eu:
@@ -699,6 +764,7 @@ class Eu(AtomImpl):
 
 
 class Gd(AtomImpl):
+    __slots__ = []
     _atomic_number = 64
 
     def clone(self) -> Gd:
@@ -709,6 +775,7 @@ class Gd(AtomImpl):
 
 
 class Tb(AtomImpl):
+    __slots__ = []
     _atomic_number = 65
 
     def clone(self) -> Tb:
@@ -719,6 +786,7 @@ class Tb(AtomImpl):
 
 
 class Dy(AtomImpl):
+    __slots__ = []
     _atomic_number = 66
 
     def clone(self) -> Dy:
@@ -729,6 +797,7 @@ class Dy(AtomImpl):
 
 
 class Ho(AtomImpl):
+    __slots__ = []
     _atomic_number = 67
 
     def clone(self) -> Ho:
@@ -739,6 +808,7 @@ class Ho(AtomImpl):
 
 
 class Er(AtomImpl):
+    __slots__ = []
     _atomic_number = 68
 
     def clone(self) -> Er:
@@ -749,6 +819,7 @@ class Er(AtomImpl):
 
 
 class Tm(AtomImpl):
+    __slots__ = []
     _atomic_number = 69
 
     def clone(self) -> Tm:
@@ -759,6 +830,7 @@ class Tm(AtomImpl):
 
 
 class Yb(AtomImpl):
+    __slots__ = []
     _atomic_number = 70
 
     def clone(self) -> Yb:
@@ -769,6 +841,7 @@ class Yb(AtomImpl):
 
 
 class Lu(AtomImpl):
+    __slots__ = []
     _atomic_number = 71
 
     def clone(self) -> Lu:
@@ -779,6 +852,7 @@ class Lu(AtomImpl):
 
 
 class Hf(AtomImpl):
+    __slots__ = []
     _atomic_number = 72
 
     def clone(self) -> Hf:
@@ -789,6 +863,7 @@ class Hf(AtomImpl):
 
 
 class Ta(AtomImpl):
+    __slots__ = []
     _atomic_number = 73
 
     def clone(self) -> Ta:
@@ -799,6 +874,7 @@ class Ta(AtomImpl):
 
 
 class W(AtomImpl):
+    __slots__ = []
     _atomic_number = 74
 
     def clone(self) -> W:
@@ -809,6 +885,7 @@ class W(AtomImpl):
 
 
 class Re(AtomImpl):
+    __slots__ = []
     _atomic_number = 75
 
     def clone(self) -> Re:
@@ -819,6 +896,7 @@ class Re(AtomImpl):
 
 
 class Os(AtomImpl):
+    __slots__ = []
     _atomic_number = 76
 
     def clone(self) -> Os:
@@ -829,6 +907,7 @@ class Os(AtomImpl):
 
 
 class Ir(AtomImpl):
+    __slots__ = []
     _atomic_number = 77
 
     def clone(self) -> Ir:
@@ -839,6 +918,7 @@ class Ir(AtomImpl):
 
 
 class Pt(AtomImpl):
+    __slots__ = []
     _atomic_number = 78
 
     def clone(self) -> Pt:
@@ -849,6 +929,7 @@ class Pt(AtomImpl):
 
 
 class Au(AtomImpl):
+    __slots__ = []
     _atomic_number = 79
 
     def clone(self) -> Au:
@@ -859,6 +940,7 @@ class Au(AtomImpl):
 
 
 class Hg(AtomImpl):
+    __slots__ = []
     _atomic_number = 80
 
     def clone(self) -> Hg:
@@ -869,6 +951,7 @@ class Hg(AtomImpl):
 
 
 class Tl(AtomImpl):
+    __slots__ = []
     _atomic_number = 81
 
     def clone(self) -> Tl:
@@ -879,6 +962,7 @@ class Tl(AtomImpl):
 
 
 class Pb(AtomImpl):
+    __slots__ = []
     _atomic_number = 82
 
     def clone(self) -> Pb:
@@ -889,6 +973,7 @@ class Pb(AtomImpl):
 
 
 class Bi(AtomImpl):
+    __slots__ = []
     _atomic_number = 83
 
     def clone(self) -> Bi:
@@ -899,6 +984,7 @@ class Bi(AtomImpl):
 
 
 class Po(AtomImpl):
+    __slots__ = []
     _atomic_number = 84
 
     def clone(self) -> Po:
@@ -909,6 +995,7 @@ class Po(AtomImpl):
 
 
 class At(AtomImpl):
+    __slots__ = []
     _atomic_number = 85
 
     def clone(self) -> At:
@@ -919,6 +1006,7 @@ class At(AtomImpl):
 
 
 class Rn(AtomImpl):
+    __slots__ = []
     _atomic_number = 86
 
     def clone(self) -> Rn:
@@ -929,6 +1017,7 @@ class Rn(AtomImpl):
 
 
 class Fr(AtomImpl):
+    __slots__ = []
     _atomic_number = 87
 
     def clone(self) -> Fr:
@@ -939,6 +1028,7 @@ class Fr(AtomImpl):
 
 
 class Ra(AtomImpl):
+    __slots__ = []
     _atomic_number = 88
 
     def clone(self) -> Ra:
@@ -949,6 +1039,7 @@ class Ra(AtomImpl):
 
 
 class Ac(AtomImpl):
+    __slots__ = []
     _atomic_number = 89
 
     def clone(self) -> Ac:
@@ -959,6 +1050,7 @@ class Ac(AtomImpl):
 
 
 class Th(AtomImpl):
+    __slots__ = []
     _atomic_number = 90
 
     def clone(self) -> Th:
@@ -969,6 +1061,7 @@ class Th(AtomImpl):
 
 
 class Pa(AtomImpl):
+    __slots__ = []
     _atomic_number = 91
 
     def clone(self) -> Pa:
@@ -979,6 +1072,7 @@ class Pa(AtomImpl):
 
 
 class U(AtomImpl):
+    __slots__ = []
     _atomic_number = 92
 
     def clone(self) -> U:
@@ -989,6 +1083,7 @@ class U(AtomImpl):
 
 
 class Np(AtomImpl):
+    __slots__ = []
     _atomic_number = 93
 
     def clone(self) -> Np:
@@ -999,6 +1094,7 @@ class Np(AtomImpl):
 
 
 class Pu(AtomImpl):
+    __slots__ = []
     _atomic_number = 94
 
     def clone(self) -> Pu:
@@ -1009,6 +1105,7 @@ class Pu(AtomImpl):
 
 
 class Am(AtomImpl):
+    __slots__ = []
     _atomic_number = 95
 
     def clone(self) -> Am:
@@ -1019,6 +1116,7 @@ class Am(AtomImpl):
 
 
 class Cm(AtomImpl):
+    __slots__ = []
     _atomic_number = 96
 
     def clone(self) -> Cm:
@@ -1029,6 +1127,7 @@ class Cm(AtomImpl):
 
 
 class Bk(AtomImpl):
+    __slots__ = []
     _atomic_number = 97
 
     def clone(self) -> Bk:
@@ -1039,6 +1138,7 @@ class Bk(AtomImpl):
 
 
 class Cf(AtomImpl):
+    __slots__ = []
     _atomic_number = 98
 
     def clone(self) -> Cf:
@@ -1049,6 +1149,7 @@ class Cf(AtomImpl):
 
 
 class Es(AtomImpl):
+    __slots__ = []
     _atomic_number = 99
 
     def clone(self) -> Es:
@@ -1059,6 +1160,7 @@ class Es(AtomImpl):
 
 
 class Fm(AtomImpl):
+    __slots__ = []
     _atomic_number = 100
 
     def clone(self) -> Fm:
@@ -1069,6 +1171,7 @@ class Fm(AtomImpl):
 
 
 class Md(AtomImpl):
+    __slots__ = []
     _atomic_number = 101
 
     def clone(self) -> Md:
@@ -1079,6 +1182,7 @@ class Md(AtomImpl):
 
 
 class No(AtomImpl):
+    __slots__ = []
     _atomic_number = 102
 
     def clone(self) -> No:
@@ -1089,6 +1193,7 @@ class No(AtomImpl):
 
 
 class Lr(AtomImpl):
+    __slots__ = []
     _atomic_number = 103
 
     def clone(self) -> Lr:
@@ -1099,6 +1204,7 @@ class Lr(AtomImpl):
 
 
 class Rf(AtomImpl):
+    __slots__ = []
     _atomic_number = 104
 
     def clone(self) -> Rf:
@@ -1109,6 +1215,7 @@ class Rf(AtomImpl):
 
 
 class Db(AtomImpl):
+    __slots__ = []
     _atomic_number = 105
 
     def clone(self) -> Db:
@@ -1119,6 +1226,7 @@ class Db(AtomImpl):
 
 
 class Sg(AtomImpl):
+    __slots__ = []
     _atomic_number = 106
 
     def clone(self) -> Sg:
@@ -1129,6 +1237,7 @@ class Sg(AtomImpl):
 
 
 class Bh(AtomImpl):
+    __slots__ = []
     _atomic_number = 107
 
     def clone(self) -> Bh:
@@ -1139,6 +1248,7 @@ class Bh(AtomImpl):
 
 
 class Hs(AtomImpl):
+    __slots__ = []
     _atomic_number = 108
 
     def clone(self) -> Hs:
@@ -1149,6 +1259,7 @@ class Hs(AtomImpl):
 
 
 class Mt(AtomImpl):
+    __slots__ = []
     _atomic_number = 109
 
     def clone(self) -> Mt:
@@ -1159,6 +1270,7 @@ class Mt(AtomImpl):
 
 
 class Ds(AtomImpl):
+    __slots__ = []
     _atomic_number = 110
 
     def clone(self) -> Ds:
@@ -1169,6 +1281,7 @@ class Ds(AtomImpl):
 
 
 class Rg(AtomImpl):
+    __slots__ = []
     _atomic_number = 111
 
     def clone(self) -> Rg:
@@ -1179,6 +1292,7 @@ class Rg(AtomImpl):
 
 
 class Cn(AtomImpl):
+    __slots__ = []
     _atomic_number = 112
 
     def clone(self) -> Cn:
@@ -1189,6 +1303,7 @@ class Cn(AtomImpl):
 
 
 class Nh(AtomImpl):
+    __slots__ = []
     _atomic_number = 113
 
     def clone(self) -> Nh:
@@ -1199,6 +1314,7 @@ class Nh(AtomImpl):
 
 
 class Fl(AtomImpl):
+    __slots__ = []
     _atomic_number = 114
 
     def clone(self) -> Fl:
@@ -1209,6 +1325,7 @@ class Fl(AtomImpl):
 
 
 class Mc(AtomImpl):
+    __slots__ = []
     _atomic_number = 115
 
     def clone(self) -> Mc:
@@ -1219,6 +1336,7 @@ class Mc(AtomImpl):
 
 
 class Lv(AtomImpl):
+    __slots__ = []
     _atomic_number = 116
 
     def clone(self) -> Lv:
@@ -1229,6 +1347,7 @@ class Lv(AtomImpl):
 
 
 class Ts(AtomImpl):
+    __slots__ = []
     _atomic_number = 117
 
     def clone(self) -> Ts:
@@ -1239,6 +1358,7 @@ class Ts(AtomImpl):
 
 
 class Og(AtomImpl):
+    __slots__ = []
     _atomic_number = 118
 
     def clone(self) -> Og:
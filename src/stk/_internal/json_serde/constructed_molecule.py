@@ -1,7 +1,5 @@
 from collections.abc import Iterable
 
-import numpy as np
-
 from stk._internal.atom_info import AtomInfo
 from stk._internal.bond_info import BondInfo
 from stk._internal.constructed_molecule import ConstructedMolecule
@@ -10,7 +8,14 @@ from stk._internal.key_makers.molecule import MoleculeKeyMaker
 from stk._internal.molecule import Molecule
 
 from .molecule import MoleculeDejsonizer, MoleculeJsonizer
-from .utilities import to_atom, to_atom_info, to_bond, to_bond_info
+from .utilities import (
+    PositionMatrixDtype,
+    to_atom,
+    to_atom_info,
+    to_bond,
+    to_bond_info,
+    to_position_matrix,
+)
 
 
 class ConstructedMoleculeJsonizer:
@@ -103,6 +108,7 @@ class ConstructedMoleculeJsonizer:
     def __init__(
         self,
         key_makers: Iterable[MoleculeKeyMaker] = (InchiKey(),),
+        position_matrix_dtype: PositionMatrixDtype | None = None,
     ) -> None:
         """
         Parameters:
@@ -111,8 +117,16 @@ class ConstructedMoleculeJsonizer:
                 included in their JSON representations. Keys allow
                 molecular data to reference itself when split across
                 multiple JSONs.
+            position_matrix_dtype:
+                If ``None``, position matrices are stored as nested
+                lists of floats. Otherwise, they are stored as raw
+                bytes of this type, which is more compact. This
+                applies to the building blocks too.
         """
-        self._jsonizer = MoleculeJsonizer(key_makers=())
+        self._jsonizer = MoleculeJsonizer(
+            key_makers=(),
+            position_matrix_dtype=position_matrix_dtype,
+        )
         self._key_makers = tuple(key_makers)
 
     def to_json(self, molecule: ConstructedMolecule) -> dict:
@@ -267,13 +281,50 @@ class ConstructedMoleculeDejsonizer:
         Returns:
             The constructed molecule.
         """
-        building_blocks = tuple(
-            map(
-                self._dejsonizer.from_json,
-                json["buildingBlocks"],
-            )
+        return self._from_json(
+            json=json,
+            building_blocks=tuple(
+                map(self._get_building_block, json["buildingBlocks"])
+            ),
         )
 
+    def _get_building_block(self, json: dict) -> Molecule:
+        """
+        Get a building block from its JSON.
+
+        Parameters:
+            json:
+                A JSON of the building block.
+
+        Returns:
+            The building block.
+        """
+        return self._dejsonizer.from_json(json)
+
+    def _from_json(
+        self,
+        json: dict,
+        building_blocks: tuple[Molecule, ...],
+    ) -> ConstructedMolecule:
+        """
+        Get a :class:`.ConstructedMolecule` from a JSON.
+
+        Used by databases, which keep their building blocks in a
+        cache, so that they are not dejsonized again for every
+        constructed molecule.
+
+        Parameters:
+            json:
+                A JSON of the constructed molecule. The
+                ``"buildingBlocks"`` entry is not used.
+
+            building_blocks:
+                The building blocks of the constructed molecule, in
+                the order of the ``"BB"`` entry of the JSON.
+
+        Returns:
+            The constructed molecule.
+        """
         num_building_blocks = {
             building_block: num
             for building_block, num in zip(
@@ -291,7 +342,7 @@ class ConstructedMoleculeDejsonizer:
         return ConstructedMolecule.init(
             atoms=atoms,
             bonds=bonds,
-            position_matrix=np.array(json["matrix"]["m"]),
+            position_matrix=to_position_matrix(json["matrix"]["m"]),
             atom_infos=tuple(
                 to_atom_info(
                     building_blocks=building_blocks,
@@ -1,7 +1,5 @@
 import typing
 
-import numpy as np
-
 from stk._internal.key_makers.inchi_key import InchiKey
 from stk._internal.key_makers.molecule import MoleculeKeyMaker
 from stk._internal.molecule import Molecule
@@ -10,10 +8,14 @@ from stk._internal.utilities.utilities import OneOrMany
 from .utilities import (
     AtomJson,
     BondJson,
+    PositionMatrixDtype,
+    PositionMatrixJson,
     atom_to_json,
     bond_to_json,
+    position_matrix_to_json,
     to_atom,
     to_bond,
+    to_position_matrix,
 )
 
 
@@ -23,7 +25,7 @@ class _MolecularGraphJson(typing.TypedDict):
 
 
 class _PositionMatrixJson(typing.TypedDict):
-    m: list[list[float]]
+    m: PositionMatrixJson
 
 
 class _MoleculeJson(typing.TypedDict):
@@ -98,11 +100,32 @@ class MoleculeJsonizer:
         name given by :meth:`.MoleculeKeyMaker.get_key_name` and the
         value given by :meth:`.MoleculeKeyMaker.get_key`.
 
+        *Storing Position Matrices Compactly*
+
+        By default, the position matrix is stored as nested lists of
+        floats. For large molecules, you can store it as raw bytes
+        instead, which makes documents smaller and faster to
+        serialize
+
+        .. testcode:: storing-position-matrices-compactly
+
+            import stk
+
+            jsonizer = stk.MoleculeJsonizer(
+                position_matrix_dtype='float32',
+            )
+            json = jsonizer.to_json(stk.BuildingBlock('NCCN'))
+
+        Both formats can be read by :class:`.MoleculeDejsonizer`. Note
+        that bytes can be stored by MongoDB, but are not part of
+        plain JSON.
+
     """
 
     def __init__(
         self,
         key_makers: OneOrMany[MoleculeKeyMaker] = (InchiKey(),),
+        position_matrix_dtype: PositionMatrixDtype | None = None,
     ) -> None:
         """
         Initialize a :class:`.MoleculeJsonizer` instance.
@@ -115,12 +138,20 @@ class MoleculeJsonizer:
                 molecular data to reference itself when split across
                 multiple JSONs.
 
+            position_matrix_dtype:
+                If ``None``, position matrices are stored as nested
+                lists of floats. Otherwise, they are stored as raw
+                bytes of this type, which is more compact.
+                ``"float32"`` halves the size again, at the cost of
+                precision.
+
         """
 
         if isinstance(key_makers, MoleculeKeyMaker):
             key_makers = (key_makers,)
 
         self._key_makers = tuple(key_makers)
+        self._position_matrix_dtype = position_matrix_dtype
 
     def to_json(
         self,
@@ -145,7 +176,10 @@ class MoleculeJsonizer:
             "b": tuple(map(bond_to_json, molecule.get_bonds())),
         }
         position_matrix: _PositionMatrixJson = {
-            "m": molecule.get_position_matrix().tolist(),
+            "m": position_matrix_to_json(
+                position_matrix=molecule.get_position_matrix(),
+                dtype=self._position_matrix_dtype,
+            ),
         }
         for key_maker in self._key_makers:
             key_name = key_maker.get_key_name()
@@ -212,7 +246,7 @@ class MoleculeDejsonizer:
                 to_bond(atoms, bond_json)
                 for bond_json in json["molecule"]["b"]
             ),
-            position_matrix=np.array(json["matrix"]["m"]),
+            position_matrix=to_position_matrix(json["matrix"]["m"]),
         )
 
     def __str__(self):
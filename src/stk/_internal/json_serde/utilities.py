@@ -4,6 +4,10 @@ JSON Deserialization Utilities
 
 """
 
+import typing
+
+import numpy as np
+
 from stk._internal.atom import Atom
 from stk._internal.atom_info import AtomInfo
 from stk._internal.bond import Bond
@@ -11,7 +15,7 @@ from stk._internal.bond_info import BondInfo
 
 
 def to_atom(id, json):
-    return Atom(id, json[0], json[1])
+    return Atom._init_element(id, json[0], json[1])
 
 
 def to_bond(atoms, json):
@@ -116,3 +120,74 @@ def bond_to_json(
         bond.get_order(),
         bond.get_periodicity(),
     )
+
+
+PositionMatrixDtype = typing.Literal["float32", "float64"]
+
+
+class PositionMatrixBytesJson(typing.TypedDict):
+    d: str
+    s: tuple[int, int]
+    b: bytes
+
+
+PositionMatrixJson = list[list[float]] | PositionMatrixBytesJson
+
+
+def position_matrix_to_json(
+    position_matrix: np.ndarray,
+    dtype: PositionMatrixDtype | None,
+) -> PositionMatrixJson:
+    """
+    Return a JSON representation of `position_matrix`.
+
+    Parameters:
+
+        position_matrix:
+            The position matrix to serialize.
+
+        dtype:
+            If ``None``, the matrix is serialized as nested lists.
+            Otherwise, the matrix is serialized as raw little-endian
+            bytes of this type, together with its shape.
+
+    Returns:
+
+        A JSON representation of `position_matrix`.
+
+    """
+
+    if dtype is None:
+        return position_matrix.tolist()
+
+    byte_dtype = np.dtype(dtype).newbyteorder("<")
+    return {
+        "d": byte_dtype.str,
+        "s": position_matrix.shape,
+        "b": position_matrix.astype(byte_dtype).tobytes(),
+    }
+
+
+def to_position_matrix(json: PositionMatrixJson) -> np.ndarray:
+    """
+    Get a position matrix from a JSON.
+
+    Parameters:
+
+        json:
+            A JSON representation of a position matrix, in either
+            the nested list or the bytes format.
+
+    Returns:
+
+        The position matrix.
+
+    """
+
+    if isinstance(json, dict):
+        return (
+            np.frombuffer(json["b"], dtype=json["d"])
+            .astype(np.float64)
+            .reshape(json["s"])
+        )
+    return np.array(json)
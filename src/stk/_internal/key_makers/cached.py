@@ -0,0 +1,111 @@
+import typing
+import weakref
+
+from stk._internal.molecule import Molecule
+
+from .molecule import MoleculeKeyMaker
+
+
+class CachedKeyMaker(MoleculeKeyMaker):
+    """
+    Caches the keys made by another key maker.
+
+    Keys are cached by molecule identity and held with weak
+    references, so the cache never keeps a molecule alive. Because
+    molecules are immutable, the key of a molecule never changes.
+
+    Examples:
+
+        *Avoiding Repeated InChI Generation*
+
+        You want to get the keys of the same molecules many times,
+        without generating their InChI every time
+
+        .. testcode:: avoiding-repeated-inchi-generation
+
+            import stk
+
+            key_maker = stk.CachedKeyMaker(stk.Inchi())
+            molecule = stk.BuildingBlock('NCCN')
+            key1 = key_maker.get_key(molecule)
+            # The InChI is not generated again.
+            key2 = key_maker.get_key(molecule)
+
+        .. testcode:: avoiding-repeated-inchi-generation
+            :hide:
+
+            assert key1 == key2
+            assert key_maker.get_num_hits() == 1
+            assert key_maker.get_num_misses() == 1
+
+    """
+
+    def __init__(self, key_maker: MoleculeKeyMaker) -> None:
+        """
+        Parameters:
+            key_maker:
+                The key maker, whose keys are cached.
+        """
+        self._key_maker = key_maker
+        self._keys: weakref.WeakKeyDictionary[Molecule, str] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def get_key_name(self) -> str:
+        return self._key_maker.get_key_name()
+
+    def get_key(self, molecule: Molecule) -> str:
+        key = self._keys.get(molecule)
+        if key is None:
+            self._num_misses += 1
+            key = self._keys[molecule] = self._key_maker.get_key(molecule)
+        else:
+            self._num_hits += 1
+        return key
+
+    def get_num_hits(self) -> int:
+        """
+        Get the number of keys which were found in the cache.
+
+        Returns:
+            The number of keys which were found in the cache.
+        """
+        return self._num_hits
+
+    def get_num_misses(self) -> int:
+        """
+        Get the number of keys which were made by the wrapped key maker.
+
+        Returns:
+            The number of keys which were made by the wrapped key
+            maker.
+        """
+        return self._num_misses
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Weak references cannot be sent to other processes.
+        return {"_key_maker": self._key_maker}
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        self.__init__(state["_key_maker"])  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return f"CachedKeyMaker({self._key_maker!r})"
+
+
+def get_cached_key_maker(key_maker: MoleculeKeyMaker) -> CachedKeyMaker:
+    """
+    Get a caching version of `key_maker`.
+
+    Parameters:
+        key_maker:
+            The key maker, whose keys should be cached.
+    Returns:
+        `key_maker`, if it already caches its keys, or a
+        :class:`.CachedKeyMaker` wrapping it.
+    """
+    if isinstance(key_maker, CachedKeyMaker):
+        return key_maker
+    return CachedKeyMaker(key_maker)
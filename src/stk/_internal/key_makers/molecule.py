@@ -1,7 +1,13 @@
+import typing
 from collections.abc import Callable
 
 from stk._internal.molecule import Molecule
 
+if typing.TYPE_CHECKING:
+    from stk._internal.topology_graphs.topology_graph.topology_graph import (
+        TopologyGraph,
+    )
+
 
 class MoleculeKeyMaker:
     """
@@ -90,6 +96,32 @@ class MoleculeKeyMaker:
         """
         return self._get_key(molecule)
 
+    def get_topology_graph_key(
+        self,
+        topology_graph: "TopologyGraph",
+    ) -> str | None:
+        """
+        Get a key of the molecule `topology_graph` constructs.
+
+        The key is made from the topology graph and the keys of its
+        building blocks, so the molecule is not constructed. It is
+        only used to find duplicates early, which means it is not
+        equal to the key :meth:`get_key` returns for the constructed
+        molecule.
+
+        Parameters:
+            topology_graph:
+                The topology graph for which a key is needed.
+        Returns:
+            The key. Topology graphs with the same key construct
+            molecules with the same key. ``None`` if no key can be
+            made without construction.
+        """
+        key = topology_graph._get_key(self.get_key)
+        if key is None:
+            return None
+        return f"{self.get_key_name()}:{key}"
+
     def __str__(self) -> str:
         return repr(self)
 
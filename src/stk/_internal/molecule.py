@@ -1,6 +1,7 @@
 import os
 import pathlib
 import typing
+import weakref
 from collections.abc import Iterable, Iterator
 
 import atomlite
@@ -24,6 +25,12 @@ from stk._internal.utilities.writers.mdl_mol import _write_mdl_mol_file
 from stk._internal.utilities.writers.pdb import _write_pdb_file
 from stk._internal.utilities.writers.xyz import _write_xyz_file
 
+# Maps each molecule to its canonical ordering. Molecules are held
+# with weak references, so the cache never keeps a molecule alive.
+_canonical_orderings: weakref.WeakKeyDictionary[
+    "Molecule", tuple[int, ...]
+] = weakref.WeakKeyDictionary()
+
 
 class Molecule:
     """
@@ -390,12 +397,15 @@ class Molecule:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        Molecule.__init__(
-            self=clone,
-            atoms=self._atoms,
-            bonds=self._bonds,
-            position_matrix=self._position_matrix.T,
-        )
+        # Atoms and bonds are immutable, so they can be shared. They
+        # are not passed to Molecule.__init__, so that any lazily
+        # created atoms and bonds are not created by cloning.
+        clone._atoms = self._atoms
+        clone._bonds = self._bonds
+        clone._position_matrix = np.array(self._position_matrix)
+        ordering = _canonical_orderings.get(self)
+        if ordering is not None:
+            _canonical_orderings[clone] = ordering
         return clone
 
     def get_atomic_positions(
@@ -834,7 +844,7 @@ class Molecule:
         atom_map = {
             atom.get_id(): atom.with_id(new_id)
             for new_id, atom in zip(
-                rdkit.CanonicalRankAtoms(self.to_rdkit_mol()),
+                self._get_canonical_ordering(),
                 self._atoms,
             )
         }
@@ -859,6 +869,8 @@ class Molecule:
                 ]
             ).T
         )
+        # The cached ordering was for the old atom ids.
+        _canonical_orderings.pop(self, None)
         return self
 
     def get_canonical_atom_ids(self) -> dict[int, int]:
@@ -874,11 +886,75 @@ class Molecule:
 
         return {
             old_id: new_id
-            for old_id, new_id in enumerate(
-                rdkit.CanonicalRankAtoms(self.to_rdkit_mol()),
-            )
+            for old_id, new_id in enumerate(self._get_canonical_ordering())
         }
 
+    def _get_canonical_ordering(self) -> tuple[int, ...]:
+        """
+        Get the id of each atom under canonical ordering.
+
+        The ordering is cached for each molecule, and passed on to
+        its clones, which share its atoms and bonds.
+
+        Returns:
+
+            The new id of each atom, ordered by current atom id.
+
+        """
+
+        ordering = _canonical_orderings.get(self)
+        if ordering is None:
+            ordering = _canonical_orderings[self] = _get_canonical_ordering(
+                atoms=self._atoms,
+                bonds=self._bonds,
+            )
+        return ordering
+
+    def _get_identity_arrays(self) -> tuple[np.ndarray, ...]:
+        """
+        Get arrays, which together describe how the molecule is stored.
+
+        The arrays are made without creating any lazily created atoms
+        and bonds, so they can be hashed cheaply. Molecules with
+        equal atoms, bonds and positions have equal arrays.
+
+        Returns:
+
+            The atomic numbers, charges, bonded atom ids, bond orders
+            and bond periodicities of the molecule, followed by its
+            ``(3, n)`` position matrix.
+
+        """
+
+        return (
+            np.fromiter(
+                (atom.get_atomic_number() for atom in self._atoms),
+                dtype=np.int64,
+                count=len(self._atoms),
+            ),
+            np.fromiter(
+                (atom.get_charge() for atom in self._atoms),
+                dtype=np.int64,
+                count=len(self._atoms),
+            ),
+            np.array(
+                [
+                    (bond.get_atom1().get_id(), bond.get_atom2().get_id())
+                    for bond in self._bonds
+                ],
+                dtype=np.int64,
+            ).reshape(-1, 2),
+            np.array(
+                [bond.get_order() for bond in self._bonds],
+                dtype=np.float64,
+            ),
+            np.array(
+                [bond.get_periodicity() for bond in self._bonds],
+                dtype=np.int64,
+            ).reshape(-1, 3),
+            self._position_matrix,
+        )
+
     def write(
         self,
         path: pathlib.Path | str,
@@ -925,3 +1001,28 @@ class Molecule:
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} at {id(self)}>"
+
+
+def _get_canonical_ordering(
+    atoms: Iterable[Atom],
+    bonds: Iterable[Bond],
+) -> tuple[int, ...]:
+    # Mirrors Molecule.to_rdkit_mol(), without the conformer, which
+    # does not affect the canonical ranks.
+    mol = rdkit.EditableMol(rdkit.Mol())
+    for atom in atoms:
+        rdkit_atom = rdkit.Atom(atom.get_atomic_number())
+        rdkit_atom.SetFormalCharge(atom.get_charge())
+        rdkit_atom.SetNoImplicit(True)
+        mol.AddAtom(rdkit_atom)
+
+    for bond in bonds:
+        order = bond.get_order()
+        mol.AddBond(
+            beginAtomIdx=bond.get_atom1().get_id(),
+            endAtomIdx=bond.get_atom2().get_id(),
+            order=(
+                rdkit.BondType.DATIVE if order == 9 else rdkit.BondType(order)
+            ),
+        )
+    return tuple(rdkit.CanonicalRankAtoms(mol.GetMol()))
@@ -1,7 +1,7 @@
 import itertools as it
 import typing
 from collections import Counter, abc
-from functools import partial
+from functools import lru_cache, partial
 from operator import getitem
 
 import numpy as np
@@ -429,9 +429,10 @@ class Cof(TopologyGraph):
         self._lattice_size = lattice_size
         self._periodic = periodic
 
-        lattice = self._get_lattice(self._vertex_alignments)
-        edges = self._get_edges(lattice)
-        vertices = self._get_vertices(lattice)
+        vertices, edges = self._get_skeleton(
+            lattice_size=tuple(lattice_size),
+            vertex_alignments=tuple(sorted(self._vertex_alignments.items())),
+        )
 
         if isinstance(building_blocks, dict):
             for building_block in building_blocks:
@@ -573,8 +574,45 @@ class Cof(TopologyGraph):
             EdgeGroup((edge,)) for edge in edges if not edge.is_periodic()
         )
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _get_skeleton(
+        cls,
+        lattice_size: tuple[int, int, int],
+        vertex_alignments: tuple[tuple[int, int], ...],
+    ) -> tuple[tuple[_CofVertex, ...], tuple[Edge, ...]]:
+        """
+        Get the vertices and edges of a lattice.
+
+        Expanding the prototypes into a lattice is done once for each
+        class, lattice size and set of vertex alignments. Vertices and
+        edges are cloned, rather than modified, by topology graphs,
+        so the cached ones are shared safely.
+
+        Parameters:
+
+            lattice_size:
+                The size of the lattice in the x, y and z directions.
+
+            vertex_alignments:
+                The items of the `vertex_alignments` :class:`dict`,
+                sorted by vertex id.
+
+        Returns:
+
+            The vertices, sorted by id, and the edges of the lattice.
+
+        """
+
+        lattice = cls._get_lattice(lattice_size, dict(vertex_alignments))
+        return (
+            tuple(cls._get_vertices(lattice_size, lattice)),
+            cls._get_edges(lattice_size, lattice),
+        )
+
+    @staticmethod
     def _get_vertices(
-        self,
+        lattice_size: tuple[int, int, int],
         lattice: list[list[list[dict[int, _CofVertex]]]],
     ) -> list[_CofVertex]:
         """
@@ -582,6 +620,9 @@ class Cof(TopologyGraph):
 
         Parameters:
 
+            lattice_size:
+                The size of the lattice in the x, y and z directions.
+
             lattice:
                 A nested list which can be in the form
                 ``lattice[x][y][z][vertex_id]`` which returns a vertex
@@ -593,7 +634,7 @@ class Cof(TopologyGraph):
 
         """
 
-        xdim, ydim, zdim = self._lattice_size
+        xdim, ydim, zdim = lattice_size
         vertices = []
         for x, y, z in it.product(
             range(xdim),
@@ -604,8 +645,10 @@ class Cof(TopologyGraph):
                 vertices.append(vertex)
         return sorted(vertices, key=lambda vertex: vertex.get_id())
 
+    @classmethod
     def _get_lattice(
-        self,
+        cls,
+        lattice_size: tuple[int, int, int],
         vertex_alignments: dict[int, int],
     ) -> list[list[list[dict[int, _CofVertex]]]]:
         """
@@ -613,6 +656,9 @@ class Cof(TopologyGraph):
 
         Parameters:
 
+            lattice_size:
+                The size of the lattice in the x, y and z directions.
+
             vertex_alignments:
                 A mapping from the id of a :class:`.Vertex`
                 to an :class:`.Edge` connected to it.
@@ -637,18 +683,18 @@ class Cof(TopologyGraph):
 
         """
 
-        xdim, ydim, zdim = (range(dim) for dim in self._lattice_size)
+        xdim, ydim, zdim = (range(dim) for dim in lattice_size)
         # vertex_clones is indexed as vertex_clones[x][y][z]
         lattice: list[list[list[dict[int, _CofVertex]]]] = [
             [[{} for _ in zdim] for _ in ydim] for _ in xdim
         ]
         # Make a clone of each vertex for each unit cell.
         cells = it.product(xdim, ydim, zdim)
-        vertices = it.product(cells, self._vertex_prototypes)
+        vertices = it.product(cells, cls._vertex_prototypes)
         for id_, (cell, vertex) in enumerate(vertices):
             x, y, z = cell
             shift = sum(
-                axis * dim for axis, dim in zip(cell, self._lattice_constants)
+                axis * dim for axis, dim in zip(cell, cls._lattice_constants)
             )
             lattice[x][y][z][vertex.get_id()] = vertex.__class__(
                 id=id_,
@@ -658,12 +704,20 @@ class Cof(TopologyGraph):
             )
         return lattice
 
-    def _get_edges(self, lattice: list) -> tuple[Edge, ...]:
+    @classmethod
+    def _get_edges(
+        cls,
+        lattice_size: tuple[int, int, int],
+        lattice: list,
+    ) -> tuple[Edge, ...]:
         """
         Create the edges of the topology graph instance.
 
         Parameters:
 
+            lattice_size:
+                The size of the lattice in the x, y and z directions.
+
             lattice:
                 A nested :class:`list` which can be indexed as
                 ``vertices[x][y][z]``, which will return a :class:`dict`
@@ -679,22 +733,22 @@ class Cof(TopologyGraph):
 
         edge_clones = []
         # Make a clone for each edge for each unit cell.
-        xdim, ydim, zdim = (range(dim) for dim in self._lattice_size)
+        xdim, ydim, zdim = (range(dim) for dim in lattice_size)
         cells = it.product(xdim, ydim, zdim)
-        edges = it.product(cells, self._edge_prototypes)
+        edges = it.product(cells, cls._edge_prototypes)
         for id_, (cell, edge) in enumerate(edges):
             x, y, z = cell
             # The cell in which the second vertex of the edge is found.
             periodic_cell = np.array(cell) + edge.get_periodicity()
             # Wrap around periodic cells, ie those that are less than 0
             # or greater than the lattice size along any dimension.
-            dims = zip(periodic_cell, self._lattice_size)
+            dims = zip(periodic_cell, lattice_size)
             x2, y2, z2 = np.array(
                 [(dim + max_dim) % max_dim for dim, max_dim in dims]
             )
             # The edge is not periodic if periodic_cell did not
             # have to wrap around.
-            dims = zip(periodic_cell, self._lattice_size)
+            dims = zip(periodic_cell, lattice_size)
             edge_is_not_periodic = all(
                 dim >= 0 and dim < max_dim for dim, max_dim in dims
             )
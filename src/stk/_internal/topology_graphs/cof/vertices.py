@@ -170,6 +170,23 @@ class _CofVertex(Vertex):
         )
         return cls(id, position, aligner_edge, cell)
 
+    def _get_placement_key(self, edges):
+        # Placement only depends on the positions of the edges
+        # relative to the vertex, and on their parent ids, which
+        # are used to sort them, so periodic copies of a vertex share
+        # a key.
+        return (
+            self.__class__,
+            self._aligner_edge,
+            tuple(
+                (
+                    edge.get_parent_id(),
+                    tuple(np.round(edge.get_position() - self._position, 6)),
+                )
+                for edge in edges
+            ),
+        )
+
     def clone(self):
         clone = super().clone()
         clone._aligner_edge = self._aligner_edge
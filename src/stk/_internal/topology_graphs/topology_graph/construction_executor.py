@@ -0,0 +1,495 @@
+import contextvars
+import io
+import itertools
+import os
+import pickle
+import tempfile
+import typing
+from collections import abc
+from functools import partial
+
+import numpy as np
+import pathos
+
+from stk._internal.atom import Atom
+from stk._internal.atom_info import AtomInfo
+from stk._internal.bond import Bond
+from stk._internal.bond_info import BondInfo
+from stk._internal.building_block import BuildingBlock
+from stk._internal.molecule import Molecule
+from stk._internal.reactions.reaction.reaction import Reaction
+from stk._internal.reactions.reaction.reaction_result import ReactionResult
+from stk._internal.topology_graphs.edge import Edge
+from stk._internal.topology_graphs.vertex import Vertex
+
+from .utilities import _Placement, _PlacementResult
+
+if typing.TYPE_CHECKING:
+    from .topology_graph import TopologyGraph
+
+# The executors which have been entered as a context manager, the
+# last one is used by default. Each thread has its own executors.
+_default_executors: contextvars.ContextVar[
+    tuple["ConstructionExecutor", ...]
+] = contextvars.ContextVar("default_executors", default=())
+
+# Gives each executor its own pool, rather than the one cached by
+# pathos for the number of processes.
+_pool_ids = itertools.count()
+
+# The building blocks loaded by a worker process, keyed by the
+# directory of the executor which wrote them and their key within it.
+_worker_building_blocks: dict[tuple[str, int], BuildingBlock] = {}
+# Maps the id of each building block loaded by a worker process to its
+# directory and key.
+_worker_building_block_keys: dict[int, tuple[str, int]] = {}
+
+
+class _ConstructionData(typing.NamedTuple):
+    """
+    The data of a molecule constructed in a worker process.
+
+    The fields match the parameters of
+    :meth:`.ConstructedMolecule.init`.
+
+    """
+
+    atoms: tuple[Atom, ...]
+    bonds: tuple[Bond, ...]
+    position_matrix: np.ndarray
+    atom_infos: tuple[AtomInfo, ...]
+    bond_infos: tuple[BondInfo, ...]
+    num_building_blocks: dict[Molecule, int]
+
+
+class ConstructionExecutor:
+    """
+    A pool of worker processes shared by many constructions.
+
+    By default, every parallel construction creates, and then tears
+    down, its own pool of worker processes. When many molecules are
+    built, starting these processes can take longer than the
+    construction itself. A :class:`.ConstructionExecutor` keeps its
+    worker processes alive, so that they can be reused by any number
+    of constructions.
+
+    Building blocks are cached by identity. Each distinct
+    :class:`.BuildingBlock` instance is sent to a worker process
+    once, rather than once for every vertex it is placed on. The
+    executor keeps a reference to every building block it has seen,
+    until it is closed.
+
+    Examples:
+
+        *Passing an Executor to a Topology Graph*
+
+        An executor can be given to any topology graph with
+        :meth:`.TopologyGraph.with_executor`
+
+        .. testcode:: passing-an-executor-to-a-topology-graph
+
+            import stk
+
+            bb1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+            bb2 = stk.BuildingBlock('BrCC(CBr)CBr', [stk.BromoFactory()])
+
+            with stk.ConstructionExecutor(num_processes=2) as executor:
+                cages = [
+                    stk.ConstructedMolecule(
+                        topology_graph=stk.cage.FourPlusSix(
+                            building_blocks=(bb1, bb2),
+                        ).with_executor(executor),
+                    )
+                    for _ in range(3)
+                ]
+
+        *Setting a Default Executor*
+
+        While an executor is used as a context manager, it is used
+        by every topology graph which was not given an executor
+        explicitly, including those created with
+        ``num_processes=1``. Only constructions in the same thread
+        use the executor by default
+
+        .. testcode:: setting-a-default-executor
+
+            import stk
+
+            bb1 = stk.BuildingBlock('BrCCBr', [stk.BromoFactory()])
+            bb2 = stk.BuildingBlock('BrCC(CBr)CBr', [stk.BromoFactory()])
+
+            with stk.ConstructionExecutor(num_processes=2):
+                cages = [
+                    stk.ConstructedMolecule(
+                        topology_graph=stk.cage.FourPlusSix(
+                            building_blocks=(bb1, bb2),
+                        ),
+                    )
+                    for _ in range(3)
+                ]
+
+        When the ``with`` block is exited, the executor is closed.
+
+    """
+
+    def __init__(self, num_processes: int) -> None:
+        """
+        Parameters:
+            num_processes:
+                The number of worker processes to create.
+        """
+        self._num_processes = num_processes
+        self._pool = pathos.pools.ProcessPool(
+            num_processes,
+            id=f"stk.ConstructionExecutor.{next(_pool_ids)}",
+        )
+        self._directory = tempfile.TemporaryDirectory(prefix="stk_")
+        # Holding on to every building block makes sure that its id
+        # cannot be reused by another building block.
+        self._building_blocks: list[BuildingBlock] = []
+        self._building_block_keys: dict[int, int] = {}
+        self._context_tokens: list[
+            contextvars.Token[tuple[ConstructionExecutor, ...]]
+        ] = []
+
+    def get_num_processes(self) -> int:
+        """
+        Get the number of worker processes.
+
+        Returns:
+            The number of worker processes.
+        """
+        return self._num_processes
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+
+        The executor cannot be used after it is closed.
+        """
+        self._pool.close()
+        self._pool.join()
+        self._pool.clear()
+        self._directory.cleanup()
+        self._building_blocks.clear()
+        self._building_block_keys.clear()
+
+    def _get_building_block_key(
+        self,
+        building_block: BuildingBlock,
+    ) -> int:
+        """
+        Get the key workers use to load `building_block`.
+
+        The first time a building block is seen, it is written to the
+        directory of the executor, from which the workers load it.
+
+        Parameters:
+            building_block:
+                The building block.
+
+        Returns:
+            The key of the building block.
+        """
+        key = self._building_block_keys.get(id(building_block))
+        if key is None:
+            key = len(self._building_blocks)
+            path = os.path.join(self._directory.name, f"{key}.pkl")
+            with open(path, "wb") as f:
+                pickle.dump(building_block, f)
+            self._building_blocks.append(building_block)
+            self._building_block_keys[id(building_block)] = key
+        return key
+
+    def _get_placement_results(
+        self,
+        vertices: tuple[Vertex, ...],
+        edges: tuple[tuple[Edge, ...], ...],
+        building_blocks: tuple[BuildingBlock, ...],
+    ) -> list[_PlacementResult]:
+        """
+        Place building blocks on vertices in the worker processes.
+
+        Parameters:
+            vertices:
+                The vertices which do the placement.
+
+            edges:
+                For each vertex, the edges connected to it.
+
+            building_blocks:
+                For each vertex, the building block placed on it.
+
+        Returns:
+            For each vertex, the result of the placement.
+        """
+        return self._pool.map(
+            partial(_get_placement_result, self._directory.name),
+            vertices,
+            edges,
+            tuple(map(self._get_building_block_key, building_blocks)),
+            chunksize=_get_chunk_size(
+                num_tasks=len(vertices),
+                num_processes=self._num_processes,
+            ),
+        )
+
+    def _get_reaction_results(
+        self,
+        reactions: tuple[Reaction, ...],
+    ) -> list[ReactionResult]:
+        """
+        Run reactions in the worker processes.
+
+        Parameters:
+            reactions:
+                The reactions to run.
+
+        Returns:
+            For each reaction, its result.
+        """
+        return self._pool.map(
+            _get_reaction_result,
+            reactions,
+            chunksize=_get_chunk_size(
+                num_tasks=len(reactions),
+                num_processes=self._num_processes,
+            ),
+        )
+
+    def _get_construction_data(
+        self,
+        topology_graphs: abc.Iterable["TopologyGraph"],
+    ) -> abc.Iterator[_ConstructionData]:
+        """
+        Construct molecules in the worker processes.
+
+        Each topology graph is constructed serially, in a single
+        worker process. Building blocks are sent as their key, so
+        the building blocks shared by many topology graphs are
+        loaded by each worker only once. The building blocks in the
+        yielded data are the ones held by the topology graphs.
+
+        Parameters:
+            topology_graphs:
+                The topology graphs to construct.
+
+        Yields:
+            The data of each constructed molecule, in the order of
+            `topology_graphs`.
+        """
+        topology_graphs = tuple(topology_graphs)
+        results = self._pool.imap(
+            partial(_get_construction_data, self._directory.name),
+            map(self._dump_topology_graph, topology_graphs),
+            chunksize=_get_chunk_size(
+                num_tasks=len(topology_graphs),
+                num_processes=self._num_processes,
+            ),
+        )
+        for result in results:
+            yield _BuildingBlockUnpickler(
+                file=io.BytesIO(result),
+                load_building_block=self._building_blocks.__getitem__,
+            ).load()
+
+    def _dump_topology_graph(self, topology_graph: "TopologyGraph") -> bytes:
+        """
+        Serialize a topology graph for a worker process.
+
+        Parameters:
+            topology_graph:
+                The topology graph.
+
+        Returns:
+            The serialized topology graph, which constructs serially
+            and holds keys in place of its building blocks.
+        """
+        for building_block in topology_graph.get_building_blocks():
+            self._get_building_block_key(building_block)
+        file = io.BytesIO()
+        _BuildingBlockPickler(
+            file=file,
+            get_key=self._building_block_keys.get,
+        ).dump(topology_graph.clone()._with_serial_construction())
+        return file.getvalue()
+
+    def __enter__(self) -> typing.Self:
+        self._context_tokens.append(
+            _default_executors.set((*_default_executors.get(), self)),
+        )
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _default_executors.reset(self._context_tokens.pop())
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_processes={self._num_processes})"
+        )
+
+
+def _get_default_executor() -> ConstructionExecutor | None:
+    """
+    Get the executor of the innermost ``with`` block, if any.
+
+    Returns:
+        The default executor, or ``None`` if there is none.
+    """
+    executors = _default_executors.get()
+    if executors:
+        return executors[-1]
+    return None
+
+
+def _load_building_block(directory: str, key: int) -> BuildingBlock:
+    """
+    Load a building block in a worker process.
+
+    Parameters:
+        directory:
+            The directory of the executor which wrote the building
+            block.
+
+        key:
+            The key of the building block.
+
+    Returns:
+        The building block.
+    """
+    building_block = _worker_building_blocks.get((directory, key))
+    if building_block is None:
+        with open(os.path.join(directory, f"{key}.pkl"), "rb") as f:
+            building_block = pickle.load(f)
+        _worker_building_blocks[(directory, key)] = building_block
+        _worker_building_block_keys[id(building_block)] = (directory, key)
+    return building_block
+
+
+def _get_placement_result(
+    directory: str,
+    vertex: Vertex,
+    edges: tuple[Edge, ...],
+    building_block_key: int,
+) -> _PlacementResult:
+    return _Placement(
+        vertex=vertex,
+        edges=edges,
+        building_block=_load_building_block(directory, building_block_key),
+    ).get_result()
+
+
+def _get_construction_data(directory: str, topology_graph: bytes) -> bytes:
+    # Workers forked inside a with block inherit the default executor,
+    # but must not use its pool, so construction is kept serial.
+    _default_executors.set(())
+    result = (
+        _BuildingBlockUnpickler(
+            file=io.BytesIO(topology_graph),
+            load_building_block=partial(_load_building_block, directory),
+        )
+        .load()
+        .construct()
+    )
+    data = _ConstructionData(
+        atoms=tuple(result.get_atoms()),
+        bonds=tuple(result.get_bonds()),
+        position_matrix=result.get_position_matrix(),
+        atom_infos=tuple(result.get_atom_infos()),
+        bond_infos=tuple(result.get_bond_infos()),
+        num_building_blocks={
+            building_block: result.get_num_building_block(building_block)
+            for building_block in result.get_building_blocks()
+        },
+    )
+
+    def get_key(building_block_id: int) -> int | None:
+        directory_key = _worker_building_block_keys.get(building_block_id)
+        if directory_key is None or directory_key[0] != directory:
+            return None
+        return directory_key[1]
+
+    file = io.BytesIO()
+    _BuildingBlockPickler(file, get_key).dump(data)
+    return file.getvalue()
+
+
+class _BuildingBlockPickler(pickle.Pickler):
+    """
+    Pickles building blocks as their executor key.
+
+    """
+
+    def __init__(
+        self,
+        file: typing.BinaryIO,
+        get_key: abc.Callable[[int], int | None],
+    ) -> None:
+        """
+        Parameters:
+            file:
+                The file to write to.
+
+            get_key:
+                Takes the id of a building block and returns its key,
+                or ``None`` if the building block should be pickled
+                normally.
+        """
+        super().__init__(file)
+        self._get_key = get_key
+
+    def persistent_id(self, obj: object) -> int | None:
+        if isinstance(obj, BuildingBlock):
+            return self._get_key(id(obj))
+        return None
+
+
+class _BuildingBlockUnpickler(pickle.Unpickler):
+    """
+    Unpickles building blocks pickled as their executor key.
+
+    """
+
+    def __init__(
+        self,
+        file: typing.BinaryIO,
+        load_building_block: abc.Callable[[int], BuildingBlock],
+    ) -> None:
+        """
+        Parameters:
+            file:
+                The file to read from.
+
+            load_building_block:
+                Takes the key of a building block and returns it.
+        """
+        super().__init__(file)
+        self._load_building_block = load_building_block
+
+    def persistent_load(self, pid: typing.Any) -> BuildingBlock:
+        return self._load_building_block(pid)
+
+
+def _get_reaction_result(reaction: Reaction) -> ReactionResult:
+    return reaction.get_result()
+
+
+def _get_chunk_size(num_tasks: int, num_processes: int) -> int:
+    """
+    Get the number of tasks sent to a process at a time.
+
+    Sending tasks in chunks keeps the communication overhead low,
+    while having a few chunks per process keeps the load balanced.
+
+    Parameters:
+        num_tasks:
+            The total number of tasks.
+
+        num_processes:
+            The number of processes running the tasks.
+
+    Returns:
+        The chunk size.
+    """
+    return max(1, num_tasks // (4 * num_processes))
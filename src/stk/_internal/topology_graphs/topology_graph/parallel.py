@@ -1,10 +1,18 @@
+from collections import abc
+
 import pathos
 
+from stk._internal.building_block import BuildingBlock
 from stk._internal.construction_state.construction_state import (
     ConstructionState,
 )
+from stk._internal.reactions.reaction.reaction import Reaction
+from stk._internal.reactions.reaction.reaction_result import ReactionResult
+from stk._internal.topology_graphs.edge import Edge
+from stk._internal.topology_graphs.vertex import Vertex
 
-from .utilities import _Placement
+from .construction_executor import ConstructionExecutor
+from .utilities import _Placement, _PlacementCache, _PlacementResult
 
 
 class _Parallel:
@@ -13,7 +21,10 @@ class _Parallel:
     """
 
     def __init__(
-        self, stages: tuple[tuple[int, ...], ...], num_processes: int
+        self,
+        stages: tuple[tuple[int, ...], ...],
+        num_processes: int,
+        executor: ConstructionExecutor | None = None,
     ) -> None:
         """
         Initialize a :class:`._Parallel` instance.
@@ -27,37 +38,94 @@ class _Parallel:
 
             num_processes:
                 The number of parallel processes to spawn.
+
+            executor:
+                The executor which runs the construction. If ``None``,
+                the pool of `num_processes` worker processes cached by
+                :mod:`pathos` is used.
         """
         self._stages = stages
         self._num_processes = num_processes
+        self._executor = executor
 
     def _place_building_blocks(
         self,
         state: ConstructionState,
     ) -> ConstructionState:
-        with pathos.pools.ProcessPool(self._num_processes) as pool:
-            for stage in self._stages:
-                vertices = tuple(state.get_vertices(stage))
-                building_blocks = tuple(map(state.get_building_block, stage))
-                edges = tuple(map(state.get_edges, stage))
-                placements = map(
-                    _Placement,
-                    vertices,
-                    edges,
-                    building_blocks,
-                )
-                placement_results = pool.map(
-                    lambda placement: placement.get_result(),
-                    placements,
-                )
-                state = state.with_placement_results(
-                    vertices=vertices,
-                    edges=edges,
-                    building_blocks=building_blocks,
-                    results=placement_results,
-                )
+        placement_cache = _PlacementCache()
+        for stage in self._stages:
+            vertices = tuple(state.get_vertices(stage))
+            building_blocks = tuple(map(state.get_building_block, stage))
+            edges = tuple(map(state.get_edges, stage))
+            placement_results = placement_cache.get_results(
+                vertices=vertices,
+                edges=edges,
+                building_blocks=building_blocks,
+                get_results=self._get_placement_results,
+            )
+            state = state.with_placement_results(
+                vertices=vertices,
+                edges=edges,
+                building_blocks=building_blocks,
+                results=placement_results,
+            )
         return state
 
+    def _get_placement_results(
+        self,
+        vertices: tuple[Vertex, ...],
+        edges: tuple[tuple[Edge, ...], ...],
+        building_blocks: tuple[BuildingBlock, ...],
+    ) -> abc.Iterable[_PlacementResult]:
+        if self._executor is not None:
+            return self._executor._get_placement_results(
+                vertices=vertices,
+                edges=edges,
+                building_blocks=building_blocks,
+            )
+        placements = map(
+            _Placement,
+            vertices,
+            edges,
+            building_blocks,
+        )
+        return self._get_pool().map(
+            lambda placement: placement.get_result(),
+            placements,
+        )
+
+    def _get_reaction_results(
+        self,
+        reactions: tuple[Reaction, ...],
+    ) -> abc.Iterable[ReactionResult]:
+        if self._executor is not None:
+            return self._executor._get_reaction_results(reactions)
+        return self._get_pool().map(
+            lambda reaction: reaction.get_result(),
+            reactions,
+        )
+
+    def _get_pool(self) -> pathos.pools.ProcessPool:
+        # pathos keeps the pool alive, so that it is shared by every
+        # construction with the same number of processes.
+        return pathos.pools.ProcessPool(self._num_processes)
+
+    def _with_executor(self, executor: ConstructionExecutor) -> "_Parallel":
+        return _Parallel(
+            stages=self._stages,
+            num_processes=executor.get_num_processes(),
+            executor=executor,
+        )
+
+    def get_stages(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Get the placement stages.
+
+        Returns:
+            For each stage, the ids of the vertices placed in it.
+        """
+        return self._stages
+
     def get_num_stages(self) -> int:
         """
         Get the number of placement stages.
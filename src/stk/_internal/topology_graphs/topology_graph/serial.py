@@ -1,8 +1,17 @@
+from collections import abc
+
+from stk._internal.building_block import BuildingBlock
 from stk._internal.construction_state.construction_state import (
     ConstructionState,
 )
+from stk._internal.reactions.reaction.reaction import Reaction
+from stk._internal.reactions.reaction.reaction_result import ReactionResult
+from stk._internal.topology_graphs.edge import Edge
+from stk._internal.topology_graphs.vertex import Vertex
 
-from .utilities import _Placement
+from .construction_executor import ConstructionExecutor
+from .parallel import _Parallel
+from .utilities import _Placement, _PlacementCache, _PlacementResult
 
 
 class _Serial:
@@ -25,19 +34,16 @@ class _Serial:
         self,
         state: ConstructionState,
     ) -> ConstructionState:
+        placement_cache = _PlacementCache()
         for stage in self._stages:
             vertices = tuple(state.get_vertices(stage))
             building_blocks = tuple(map(state.get_building_block, stage))
             edges = tuple(map(state.get_edges, stage))
-            placements = map(
-                _Placement,
-                vertices,
-                edges,
-                building_blocks,
-            )
-            placement_results = map(
-                lambda placement: placement.get_result(),
-                placements,
+            placement_results = placement_cache.get_results(
+                vertices=vertices,
+                edges=edges,
+                building_blocks=building_blocks,
+                get_results=_get_placement_results,
             )
             state = state.with_placement_results(
                 vertices=vertices,
@@ -47,6 +53,31 @@ class _Serial:
             )
         return state
 
+    def _get_reaction_results(
+        self,
+        reactions: tuple[Reaction, ...],
+    ) -> abc.Iterable[ReactionResult]:
+        return map(
+            lambda reaction: reaction.get_result(),
+            reactions,
+        )
+
+    def _with_executor(self, executor: ConstructionExecutor) -> _Parallel:
+        return _Parallel(
+            stages=self._stages,
+            num_processes=executor.get_num_processes(),
+            executor=executor,
+        )
+
+    def get_stages(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Get the placement stages.
+
+        Returns:
+            For each stage, the ids of the vertices placed in it.
+        """
+        return self._stages
+
     def get_num_stages(self) -> int:
         """
         Get the number of placement stages.
@@ -55,3 +86,20 @@ class _Serial:
             The number of placement stages.
         """
         return len(self._stages)
+
+
+def _get_placement_results(
+    vertices: tuple[Vertex, ...],
+    edges: tuple[tuple[Edge, ...], ...],
+    building_blocks: tuple[BuildingBlock, ...],
+) -> abc.Iterable[_PlacementResult]:
+    placements = map(
+        _Placement,
+        vertices,
+        edges,
+        building_blocks,
+    )
+    return map(
+        lambda placement: placement.get_result(),
+        placements,
+    )
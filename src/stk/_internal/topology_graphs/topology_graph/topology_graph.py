@@ -4,6 +4,8 @@ from functools import partial
 
 import numpy as np
 
+from stk._internal.atom import Atom
+from stk._internal.bond import Bond
 from stk._internal.building_block import BuildingBlock
 from stk._internal.construction_result.construction_result import (
     ConstructionResult,
@@ -15,6 +17,10 @@ from stk._internal.optimizers.optimizer import Optimizer
 from stk._internal.reaction_factories.reaction_factory import ReactionFactory
 from stk._internal.topology_graphs.edge import Edge
 from stk._internal.topology_graphs.edge_group import EdgeGroup
+from stk._internal.topology_graphs.topology_graph.construction_executor import (  # noqa
+    ConstructionExecutor,
+    _get_default_executor,
+)
 from stk._internal.topology_graphs.topology_graph.parallel import (
     _Parallel,
 )
@@ -255,6 +261,7 @@ class TopologyGraph:
         self._edge_groups = edge_groups
 
         self._optimizer = optimizer
+        self._executor: ConstructionExecutor | None = None
 
     def _with_building_blocks(
         self,
@@ -324,6 +331,49 @@ class TopologyGraph:
         """
         return self.clone()._with_building_blocks(building_block_map)
 
+    def _with_executor(
+        self,
+        executor: ConstructionExecutor,
+    ) -> typing.Self:
+        """
+        Modify the topology graph.
+
+        """
+        self._executor = executor
+        return self
+
+    def with_executor(
+        self,
+        executor: ConstructionExecutor,
+    ) -> typing.Self:
+        """
+        Return a clone which constructs with `executor`.
+
+        The worker processes of `executor` are used for construction,
+        regardless of the `num_processes` the topology graph was
+        initialized with.
+
+        Parameters:
+
+            executor:
+                The executor used for construction.
+
+        Returns:
+            The clone.
+        """
+        return self.clone()._with_executor(executor)
+
+    def _with_serial_construction(self) -> typing.Self:
+        """
+        Modify the topology graph so that it constructs serially.
+
+        """
+        self._executor = None
+        self._implementation = _Serial(
+            stages=self._implementation.get_stages(),
+        )
+        return self
+
     def clone(self) -> typing.Self:
         """
         Return a clone.
@@ -340,6 +390,7 @@ class TopologyGraph:
         clone._edges = self._edges
         clone._reaction_factory = self._reaction_factory
         clone._implementation = self._implementation
+        clone._executor = self._executor
         clone._optimizer = self._optimizer
         clone._edge_groups = self._edge_groups
         clone._scale_multiplier = self._scale_multiplier
@@ -393,6 +444,38 @@ class TopologyGraph:
         """
         return len(self._building_block_vertices.get(building_block, []))
 
+    def _get_key(
+        self,
+        get_building_block_key: abc.Callable[[BuildingBlock], str],
+    ) -> str | None:
+        """
+        Get a key of the topology graph, without constructing it.
+
+        Parameters:
+            get_building_block_key:
+                Takes a building block of the topology graph and
+                returns its key.
+
+        Returns:
+            The key. Topology graphs with the same key construct
+            the same molecule, though topology graphs which construct
+            the same molecule may have different keys. ``None`` if
+            the topology graph holds state which cannot be compared
+            without construction.
+        """
+        try:
+            return _get_state(
+                value={
+                    name: value
+                    for name, value in vars(self).items()
+                    if name not in ("_implementation", "_executor")
+                },
+                get_building_block_key=get_building_block_key,
+                type_name=f"{type(self).__module__}.{type(self).__qualname__}",
+            )
+        except (_UnidentifiableError, RecursionError):
+            return None
+
     def _get_lattice_constants(self) -> abc.Iterator[np.ndarray]:
         """
         Yield the lattice constants of the topology graph.
@@ -483,7 +566,7 @@ class TopologyGraph:
             The new construction state, updated to account for the
             placed building blocks.
         """
-        return self._implementation._place_building_blocks(state)
+        return self._get_implementation()._place_building_blocks(state)
 
     def _run_reactions(
         self,
@@ -505,12 +588,29 @@ class TopologyGraph:
             state,
         )
         reactions = tuple(map(get_reaction, self._edge_groups))
-        results = map(
-            lambda reaction: reaction.get_result(),
-            reactions,
-        )
+        results = self._get_implementation()._get_reaction_results(reactions)
         return state.with_reaction_results(reactions, results)
 
+    def _get_implementation(self) -> _TopologyGraphImplementation:
+        """
+        Get the implementation used for construction.
+
+        If the topology graph was given an executor, it is used,
+        otherwise the executor of the innermost active
+        :class:`.ConstructionExecutor` context is used. If there is
+        neither, the implementation chosen during initialization is
+        used.
+
+        Returns:
+            The implementation.
+        """
+        executor = self._executor
+        if executor is None:
+            executor = _get_default_executor()
+        if executor is None:
+            return self._implementation
+        return self._implementation._with_executor(executor)
+
     def _get_stages(
         self,
         construction_stages,
@@ -541,3 +641,88 @@ class TopologyGraph:
 
     def __repr__(self) -> str:
         raise NotImplementedError()
+
+
+class _UnidentifiableError(Exception):
+    pass
+
+
+def _get_state(
+    value: typing.Any,
+    get_building_block_key: abc.Callable[[BuildingBlock], str],
+    type_name: str | None = None,
+) -> str:
+    """
+    Get a string, which is equal for values with equal state.
+
+    Parameters:
+        value:
+            The value whose state is needed.
+
+        get_building_block_key:
+            Takes a building block and returns its key.
+
+        type_name:
+            The name used for the type of `value`. If ``None``, the
+            type name is not included.
+
+    Returns:
+        The state of `value`.
+
+    Raises:
+        :class:`_UnidentifiableError`:
+            If the state of `value` cannot be found, for example
+            because it has no attributes to compare.
+    """
+
+    def get_state(item: typing.Any) -> str:
+        return _get_state(item, get_building_block_key)
+
+    if isinstance(value, BuildingBlock):
+        # The functional groups and placers of a building block
+        # change the constructed molecule, but not its key.
+        state = (
+            f"BuildingBlock({get_building_block_key(value)!r}, "
+            f"{get_state(tuple(value.get_atoms()))}, "
+            f"{get_state(tuple(value.get_bonds()))}, "
+            f"{get_state(tuple(value.get_functional_groups()))}, "
+            f"{get_state(tuple(value.get_placer_ids()))})"
+        )
+    elif isinstance(value, Atom):
+        state = (
+            f"{type(value).__name__}({value.get_id()}, {value.get_charge()})"
+        )
+    elif isinstance(value, Bond):
+        state = (
+            f"Bond({value.get_atom1().get_id()}, "
+            f"{value.get_atom2().get_id()}, {value.get_order()}, "
+            f"{get_state(value.get_periodicity())})"
+        )
+    elif value is None or isinstance(value, bool | int | float | str):
+        state = repr(value)
+    elif isinstance(value, np.generic | np.ndarray):
+        state = get_state(value.tolist())
+    elif isinstance(value, type):
+        state = f"{value.__module__}.{value.__qualname__}"
+    elif isinstance(value, tuple | list):
+        state = f"({', '.join(map(get_state, value))})"
+    elif isinstance(value, frozenset | set):
+        state = f"{{{', '.join(sorted(map(get_state, value)))}}}"
+    elif isinstance(value, dict):
+        items = sorted(
+            f"{get_state(key)}: {get_state(item)}"
+            for key, item in value.items()
+        )
+        state = f"{{{', '.join(items)}}}"
+    elif hasattr(value, "__dict__") and not callable(value):
+        state = _get_state(
+            value=vars(value),
+            get_building_block_key=get_building_block_key,
+            type_name=f"{type(value).__module__}.{type(value).__qualname__}",
+        )
+    else:
+        raise _UnidentifiableError()
+
+    if type_name is None:
+        return state
+    return f"{type_name}{state}"
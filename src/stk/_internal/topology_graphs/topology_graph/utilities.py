@@ -9,9 +9,18 @@ import typing
 import numpy as np
 
 if typing.TYPE_CHECKING:
+    from stk._internal.building_block import BuildingBlock
     from stk._internal.construction_state.construction_state import (
         ConstructionState,
     )
+    from stk._internal.reactions.reaction.reaction import Reaction
+    from stk._internal.reactions.reaction.reaction_result import (
+        ReactionResult,
+    )
+    from stk._internal.topology_graphs.edge import Edge
+    from stk._internal.topology_graphs.vertex import Vertex
+
+    from .construction_executor import ConstructionExecutor
 
 
 class _TopologyGraphImplementation(typing.Protocol):
@@ -20,6 +29,21 @@ class _TopologyGraphImplementation(typing.Protocol):
     ) -> "ConstructionState":
         pass
 
+    def _get_reaction_results(
+        self,
+        reactions: tuple["Reaction", ...],
+    ) -> typing.Iterable["ReactionResult"]:
+        pass
+
+    def _with_executor(
+        self,
+        executor: "ConstructionExecutor",
+    ) -> "_TopologyGraphImplementation":
+        pass
+
+    def get_stages(self) -> tuple[tuple[int, ...], ...]:
+        pass
+
     def get_num_stages(self) -> int:
         pass
 
@@ -102,3 +126,163 @@ class _Placement:
             position_matrix=position_matrix,
             functional_group_edges=functional_group_edges,
         )
+
+
+class _PlacementCache:
+    """
+    Reuses placements of vertices related by a translation.
+
+    A vertex whose placement key matches that of an already placed
+    vertex holding the same building block, is not placed again.
+    Instead, the cached position matrix is shifted onto the vertex
+    and the cached functional group to edge mapping is carried over
+    to its edges.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a :class:`._PlacementCache`.
+        """
+        self._results: dict[typing.Hashable, _CachedPlacement] = {}
+
+    def get_results(
+        self,
+        vertices: tuple["Vertex", ...],
+        edges: tuple[tuple["Edge", ...], ...],
+        building_blocks: tuple["BuildingBlock", ...],
+        get_results: typing.Callable[..., typing.Iterable[_PlacementResult]],
+    ) -> list[_PlacementResult]:
+        """
+        Get the results of placements.
+
+        Parameters:
+            vertices:
+                The vertices which do the placement.
+
+            edges:
+                For each vertex, the edges connected to it.
+
+            building_blocks:
+                For each vertex, the building block placed on it.
+
+            get_results:
+                Takes `vertices`, `edges` and `building_blocks`, as
+                keyword arguments, for the placements which are not
+                cached, and returns their results.
+
+        Returns:
+            For each vertex, the result of the placement.
+        """
+        keys: list[typing.Hashable] = []
+        misses: dict[int, None] = {}
+        first_misses: dict[typing.Hashable, int] = {}
+        for index, (vertex, vertex_edges, building_block) in enumerate(
+            zip(vertices, edges, building_blocks)
+        ):
+            key = vertex._get_placement_key(vertex_edges)
+            if key is not None:
+                key = (id(building_block), key)
+                if key in self._results or key in first_misses:
+                    keys.append(key)
+                    continue
+                first_misses[key] = index
+            keys.append(key)
+            misses[index] = None
+
+        miss_results = dict(
+            zip(
+                misses,
+                get_results(
+                    vertices=tuple(vertices[index] for index in misses),
+                    edges=tuple(edges[index] for index in misses),
+                    building_blocks=tuple(
+                        building_blocks[index] for index in misses
+                    ),
+                ),
+            )
+        )
+        for key, index in first_misses.items():
+            self._results[key] = _CachedPlacement(
+                position=vertices[index].get_position(),
+                edge_ids=tuple(edge.get_id() for edge in edges[index]),
+                result=miss_results[index],
+            )
+
+        results = []
+        for index, key in enumerate(keys):
+            if index in miss_results:
+                results.append(miss_results[index])
+            else:
+                results.append(
+                    self._results[key].get_result(
+                        position=vertices[index].get_position(),
+                        edges=edges[index],
+                    )
+                )
+        return results
+
+
+class _CachedPlacement:
+    """
+    A placement result which can be translated to another vertex.
+
+    """
+
+    def __init__(
+        self,
+        position: np.ndarray,
+        edge_ids: tuple[int, ...],
+        result: _PlacementResult,
+    ) -> None:
+        """
+        Initialize a :class:`._CachedPlacement`.
+
+        Parameters:
+            position:
+                The position of the vertex which did the placement.
+
+            edge_ids:
+                The ids of the edges connected to the vertex which did
+                the placement.
+
+            result:
+                The result of the placement.
+        """
+        self._position = position
+        self._edge_indices = {
+            edge_id: index for index, edge_id in enumerate(edge_ids)
+        }
+        self._result = result
+
+    def get_result(
+        self,
+        position: np.ndarray,
+        edges: tuple["Edge", ...],
+    ) -> _PlacementResult:
+        """
+        Get the result of the placement on another vertex.
+
+        Parameters:
+            position:
+                The position of the other vertex.
+
+            edges:
+                The edges connected to the other vertex.
+
+        Returns:
+            The result of the placement.
+        """
+        position_matrix = self._result.position_matrix + (
+            position - self._position
+        )
+        position_matrix.setflags(write=False)
+        return _PlacementResult(
+            position_matrix=position_matrix,
+            functional_group_edges={
+                fg_id: edges[self._edge_indices[edge_id]].get_id()
+                for fg_id, edge_id in (
+                    self._result.functional_group_edges.items()
+                )
+            },
+        )
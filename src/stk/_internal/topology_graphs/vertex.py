@@ -197,6 +197,32 @@ class Vertex:
 
         raise NotImplementedError()
 
+    def _get_placement_key(
+        self,
+        edges: tuple[Edge, ...],
+    ) -> typing.Hashable | None:
+        """
+        Get a key for caching the placement done by the vertex.
+
+        Two vertices with the same key, given the same building
+        block, must place it identically, up to a translation by the
+        difference in their positions. They must also map its
+        functional groups to the edge at the same index in `edges`.
+
+        Parameters:
+
+            edges:
+                The edges to which the vertex is attached.
+
+        Returns:
+
+            The key, or ``None`` if placements done by the vertex
+            should not be cached, which is the default.
+
+        """
+
+        return None
+
     def __str__(self) -> str:
         position = self._position.tolist()
         return f"Vertex(id={self._id}, position={position})"
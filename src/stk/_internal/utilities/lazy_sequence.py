@@ -0,0 +1,89 @@
+"""
+Lazy Sequence
+=============
+
+"""
+
+from __future__ import annotations
+
+import typing
+from collections import abc
+
+T = typing.TypeVar("T")
+
+
+class LazySequence(abc.Sequence[T]):
+    """
+    An immutable sequence, whose items are created on first access.
+
+    The length of the sequence is known up front, so taking the
+    :func:`len` of the sequence does not create its items.
+
+    """
+
+    __slots__ = ["_get_items", "_items", "_num_items"]
+
+    _get_items: abc.Callable[[], abc.Iterable[T]] | None
+    _num_items: int
+    _items: tuple[T, ...] | None
+
+    def __init__(
+        self,
+        get_items: abc.Callable[[], abc.Iterable[T]],
+        num_items: int,
+    ) -> None:
+        """
+        Initialize a :class:`.LazySequence`.
+
+        Parameters:
+
+            get_items:
+                Creates the items of the sequence. Called at most
+                once.
+
+            num_items:
+                The number of items `get_items` will create.
+
+        """
+
+        self._get_items = get_items
+        self._num_items = num_items
+        self._items = None
+
+    def _get_tuple(self) -> tuple[T, ...]:
+        if self._items is None:
+            self._items = tuple(typing.cast(abc.Callable, self._get_items)())
+            # Drop any data held only to create the items.
+            self._get_items = None
+        return self._items
+
+    def __len__(self) -> int:
+        return self._num_items
+
+    @typing.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> tuple[T, ...]: ...
+
+    def __getitem__(self, index):
+        return self._get_tuple()[index]
+
+    def __iter__(self) -> abc.Iterator[T]:
+        return iter(self._get_tuple())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySequence):
+            other = other._get_tuple()
+        return self._get_tuple() == other
+
+    def __hash__(self) -> int:
+        return hash(self._get_tuple())
+
+    def __reduce__(self):
+        # Pickle as a plain tuple, so that the data used to create the
+        # items does not need to be pickled.
+        return tuple, (self._get_tuple(),)
+
+    def __repr__(self) -> str:
+        return repr(self._get_tuple())
@@ -8,7 +8,10 @@ from .fixtures import *  # noqa
 
 
 @pytest.fixture(
-    params=(lazy_fixture("constructed_molecule_mongo_db"),),
+    params=(
+        lazy_fixture("constructed_molecule_mongo_db"),
+        lazy_fixture("constructed_molecule_sqlite_db"),
+    ),
 )
 def case_data(request) -> CaseData:
     return request.param
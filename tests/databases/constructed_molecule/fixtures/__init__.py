@@ -1 +1,2 @@
 from .constructed_molecule_mongo_db import *  # noqa
+from .constructed_molecule_sqlite_db import *  # noqa
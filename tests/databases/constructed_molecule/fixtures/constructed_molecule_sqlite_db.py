@@ -0,0 +1,34 @@
+import pathlib
+
+import pytest
+import rdkit.Chem.AllChem as rdkit
+
+import stk
+
+from ..case_data import CaseData
+
+
+@pytest.fixture
+def constructed_molecule_sqlite_db(tmp_path: pathlib.Path) -> CaseData:
+    return CaseData(
+        database=stk.ConstructedMoleculeSqliteDb(
+            path=tmp_path / "molecules.db",
+        ),
+        molecule=stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(
+                    stk.BuildingBlock(
+                        smiles="BrCCBr",
+                        functional_groups=[stk.BromoFactory()],
+                    ),
+                ),
+                repeating_unit="A",
+                num_repeating_units=2,
+            ),
+        ),
+        key={
+            "InChIKey": rdkit.MolToInchiKey(
+                rdkit.MolFromSmiles(SMILES="BrCCCCBr")
+            ),
+        },
+    )
@@ -35,6 +35,35 @@ def test_put_caching(mongo_client):
     assert cache_info.misses == 2
 
 
+def test_put_caching_does_not_create_atoms(mongo_client):
+    database_name = "_test_put_caching_does_not_create_atoms"
+    mongo_client.drop_database(database_name)
+
+    database = stk.ConstructedMoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+    )
+    molecule = stk.BuildingBlock("BrCCCBr", [stk.BromoFactory()])
+    topology_graph = stk.polymer.Linear(
+        building_blocks=(molecule,),
+        repeating_unit="A",
+        num_repeating_units=3,
+    )
+    database.put(stk.ConstructedMolecule(topology_graph))
+    polymer = stk.ConstructedMolecule(topology_graph)
+    database.put(polymer)
+
+    cache_info = database._put.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    # A put found in the cache does not create the atoms, bonds or
+    # infos of the molecule.
+    assert polymer._atoms._items is None
+    assert polymer._bonds._items is None
+    assert polymer._atom_infos._items is None
+    assert polymer._bond_infos._items is None
+
+
 def test_get_caching(mongo_client):
     database_name = "_test_get_caching"
     mongo_client.drop_database(database_name)
@@ -66,3 +95,44 @@ def test_get_caching(mongo_client):
     cache_info = database._get.cache_info()
     assert cache_info.hits == 1
     assert cache_info.misses == 1
+
+
+def test_building_block_caching(mongo_client):
+    database_name = "_test_building_block_caching"
+    mongo_client.drop_database(database_name)
+
+    database = stk.ConstructedMoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+        get_lru_cache_size=0,
+    )
+    molecule = stk.BuildingBlock("BrCCCBr", [stk.BromoFactory()])
+    polymers = tuple(
+        stk.ConstructedMolecule(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(molecule,),
+                repeating_unit="A",
+                num_repeating_units=num_repeating_units,
+            ),
+        )
+        for num_repeating_units in (2, 3)
+    )
+    database.put_many(polymers)
+    retrieved = tuple(
+        database.get(
+            {
+                stk.InchiKey().get_key_name(): (
+                    stk.InchiKey().get_key(polymer)
+                ),
+            }
+        )
+        for polymer in polymers
+    )
+
+    cache_info = database._get_building_block.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    # The building block is dejsonized only once.
+    (building_block1,) = retrieved[0].get_building_blocks()
+    (building_block2,) = retrieved[1].get_building_blocks()
+    assert building_block1 is building_block2
@@ -0,0 +1,26 @@
+from tests.utilities import is_equivalent_constructed_molecule
+
+
+def test_put_many(case_data):
+    """
+    Test :meth:`.ConstructedMoleculeDatabase.put_many` and
+    :meth:`.get_many`.
+
+    Parameters
+    ----------
+    case_data : :class:`.CaseData`
+        A test case. Holds the database to test and the molecule to
+        place into the database.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    case_data.database.put_many([case_data.molecule])
+    (retrieved,) = case_data.database.get_many([case_data.key])
+    is_equivalent_constructed_molecule(
+        case_data.molecule.with_canonical_atom_ordering(),
+        retrieved.with_canonical_atom_ordering(),
+    )
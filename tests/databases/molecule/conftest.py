@@ -6,7 +6,11 @@ from .fixtures import *  # noqa
 
 
 @pytest.fixture(
-    params=(lazy_fixture("molecule_mongo_db"),),
+    params=(
+        lazy_fixture("molecule_mongo_db"),
+        lazy_fixture("molecule_sqlite_db"),
+        lazy_fixture("write_behind_molecule_db"),
+    ),
 )
 def case_data(request):
     return request.param
@@ -1 +1,3 @@
 from .molecule_mongo_db import *  # noqa
+from .molecule_sqlite_db import *  # noqa
+from .write_behind_molecule_db import *  # noqa
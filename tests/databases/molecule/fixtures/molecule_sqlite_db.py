@@ -0,0 +1,17 @@
+import pathlib
+
+import pytest
+import rdkit.Chem.AllChem as rdkit
+
+import stk
+
+from ..case_data import CaseData
+
+
+@pytest.fixture
+def molecule_sqlite_db(tmp_path: pathlib.Path) -> CaseData:
+    return CaseData(
+        database=stk.MoleculeSqliteDb(tmp_path / "molecules.db"),
+        molecule=stk.BuildingBlock("BrCCBr"),
+        key={"InChIKey": rdkit.MolToInchiKey(rdkit.MolFromSmiles("BrCCBr"))},
+    )
@@ -0,0 +1,20 @@
+import pathlib
+
+import pytest
+import rdkit.Chem.AllChem as rdkit
+
+import stk
+
+from ..case_data import CaseData
+
+
+@pytest.fixture
+def write_behind_molecule_db(tmp_path: pathlib.Path) -> CaseData:
+    return CaseData(
+        database=stk.WriteBehindMoleculeDb(
+            database=stk.MoleculeSqliteDb(tmp_path / "molecules.db"),
+            batch_size=2,
+        ),
+        molecule=stk.BuildingBlock("BrCCBr"),
+        key={"InChIKey": rdkit.MolToInchiKey(rdkit.MolFromSmiles("BrCCBr"))},
+    )
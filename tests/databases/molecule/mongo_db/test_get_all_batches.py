@@ -0,0 +1,79 @@
+import stk
+from tests.utilities import is_equivalent_molecule
+
+
+def test_get_all_batches(mongo_client):
+    database_name = "_test_get_all_batches"
+    mongo_client.drop_database(database_name)
+
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+    )
+    smiles = stk.Smiles()
+    molecules = {
+        smiles.get_key(molecule): molecule
+        for molecule in (
+            stk.BuildingBlock("BrCCBr"),
+            stk.BuildingBlock("BrCCCBr"),
+            stk.BuildingBlock("BrCCCCBr"),
+        )
+    }
+    database.put_many(molecules.values())
+
+    batches = tuple(database.get_all_batches(batch_size=2))
+    assert tuple(map(len, batches)) == (2, 1)
+    for batch in batches:
+        for retrieved in batch:
+            is_equivalent_molecule(
+                molecule1=molecules[
+                    smiles.get_key(retrieved)
+                ].with_canonical_atom_ordering(),
+                molecule2=retrieved.with_canonical_atom_ordering(),
+            )
+
+
+def test_get_all_batches_mixed_keys(mongo_client):
+    """
+    Test that position matrices are found through any molecular key.
+
+    Parameters
+    ----------
+    mongo_client : :class:`pymongo.MongoClient`
+        The mongo client the database should connect to.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    database_name = "_test_get_all_batches_mixed_keys"
+    mongo_client.drop_database(database_name)
+
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+        jsonizer=stk.MoleculeJsonizer(key_makers=(stk.Smiles(),)),
+        indices=("InChIKey", "SMILES"),
+    )
+    # Adds an InChIKey to the molecule document, but not to the
+    # position matrix document used by database.
+    other_database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+        position_matrix_collection="other_position_matrices",
+        jsonizer=stk.MoleculeJsonizer(
+            key_makers=(stk.InchiKey(), stk.Smiles()),
+        ),
+    )
+    molecule = stk.BuildingBlock("BrCCBr")
+    database.put(molecule)
+    other_database.put(molecule)
+
+    (batch,) = database.get_all_batches()
+    (retrieved,) = batch
+    is_equivalent_molecule(
+        molecule1=molecule.with_canonical_atom_ordering(),
+        molecule2=retrieved.with_canonical_atom_ordering(),
+    )
@@ -58,3 +58,44 @@ def test_get_caching(mongo_client):
     cache_info = database._get.cache_info()
     assert cache_info.hits == 1
     assert cache_info.misses == 1
+
+
+def test_get_cache_eviction(mongo_client):
+    database_name = "_test_get_cache_eviction"
+    mongo_client.drop_database(database_name)
+
+    molecules = (
+        stk.BuildingBlock("CCC"),
+        stk.BuildingBlock("CCO"),
+    )
+    keys = tuple(
+        {
+            stk.InchiKey().get_key_name(): stk.InchiKey().get_key(molecule),
+        }
+        for molecule in molecules
+    )
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+    )
+    database.put_many(molecules)
+    database.get(keys[0])
+    entry_size = database.get_cache_info()["get"].num_bytes
+
+    # Only one molecule fits into the cache.
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+        get_lru_cache_bytes=entry_size * 3 // 2,
+    )
+    database.get(keys[0])
+    database.get(keys[1])
+    database.get(keys[0])
+    cache_info = database.get_cache_info()["get"]
+    assert cache_info.hits == 0
+    assert cache_info.misses == 3
+    assert cache_info.evictions == 2
+    assert cache_info.num_bytes <= entry_size * 3 // 2
+
+    database.invalidate(keys[0])
+    assert database.get_cache_info()["get"].currsize == 0
@@ -0,0 +1,23 @@
+import numpy as np
+
+import stk
+
+
+def test_partial_loading(mongo_client):
+    database_name = "_test_partial_loading"
+    mongo_client.drop_database(database_name)
+
+    database = stk.MoleculeMongoDb(
+        mongo_client=mongo_client,
+        database=database_name,
+    )
+    molecule = stk.BuildingBlock("BrCCBr").with_canonical_atom_ordering()
+    database.put(molecule)
+    key_maker = stk.InchiKey()
+    key = key_maker.get_key(molecule)
+
+    assert np.allclose(
+        database.get_position_matrix({"InChIKey": key}),
+        molecule.get_position_matrix(),
+    )
+    assert tuple(database.iter_keys("InChIKey")) == (key,)
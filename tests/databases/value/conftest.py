@@ -6,7 +6,11 @@ from .fixtures import *  # noqa
 
 
 @pytest.fixture(
-    params=(lazy_fixture("mongo_db"),),
+    params=(
+        lazy_fixture("mongo_db"),
+        lazy_fixture("sqlite_db"),
+        lazy_fixture("write_behind_db"),
+    ),
 )
 def case_data(request):
     return request.param
@@ -1 +1,3 @@
 from .mongo_db import *  # noqa
+from .sqlite_db import *  # noqa
+from .write_behind_db import *  # noqa
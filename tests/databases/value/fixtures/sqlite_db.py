@@ -0,0 +1,19 @@
+import pathlib
+
+import pytest
+
+import stk
+
+from ..case_data import CaseData
+
+
+@pytest.fixture
+def sqlite_db(tmp_path: pathlib.Path) -> CaseData:
+    return CaseData(
+        database=stk.ValueSqliteDb(
+            path=tmp_path / "values.db",
+            table="values",
+        ),
+        molecule=stk.BuildingBlock("BrCCBr"),
+        value=12,
+    )
@@ -0,0 +1,22 @@
+import pathlib
+
+import pytest
+
+import stk
+
+from ..case_data import CaseData
+
+
+@pytest.fixture
+def write_behind_db(tmp_path: pathlib.Path) -> CaseData:
+    return CaseData(
+        database=stk.WriteBehindValueDb(
+            database=stk.ValueSqliteDb(
+                path=tmp_path / "values.db",
+                table="values",
+            ),
+            batch_size=2,
+        ),
+        molecule=stk.BuildingBlock("BrCCBr"),
+        value=12,
+    )
@@ -0,0 +1,23 @@
+import stk
+
+
+def test_get_many(case_data):
+    """
+    Test :meth:`.ValueDatabase.get_many`.
+
+    Parameters
+    ----------
+    case_data : :class:`.CaseData`
+        A test case. Holds the database to test and the value to put
+        into it.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    missing = stk.BuildingBlock("NCCN")
+    case_data.database.put(case_data.molecule, case_data.value)
+    values = case_data.database.get_many([case_data.molecule, missing])
+    assert values == {case_data.molecule: case_data.value}
@@ -0,0 +1,144 @@
+import gc
+import pathlib
+import pickle
+import threading
+import time
+
+import pytest
+
+import stk
+
+
+class _GatedValueDb(stk.ValueDatabase):
+    """
+    Stores values in memory, once its gate is opened.
+
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[stk.Molecule, float] = {}
+        self.gate = threading.Event()
+        self.error: Exception | None = None
+
+    def put(self, molecule: stk.Molecule, value: float) -> None:
+        self.put_many([(molecule, value)])
+
+    def put_many(self, items) -> None:
+        self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        self.values.update(items)
+
+    def get(self, molecule: stk.Molecule) -> float:
+        return self.values[molecule]
+
+
+def _get_molecules(num_molecules: int) -> list[stk.BuildingBlock]:
+    return [
+        stk.BuildingBlock("Br" + "C" * (i + 1) + "Br")
+        for i in range(num_molecules)
+    ]
+
+
+def _wait_for_writes(database: stk.WriteBehindValueDb) -> None:
+    while database.get_queue_depth():
+        time.sleep(0.01)
+
+
+def test_get_queue_depth() -> None:
+    inner = _GatedValueDb()
+    database = stk.WriteBehindValueDb(inner, max_queue_size=10, batch_size=2)
+    molecules = _get_molecules(3)
+    for value, molecule in enumerate(molecules):
+        database.put(molecule, value)
+    assert database.get_queue_depth() == 3
+
+    inner.gate.set()
+    database.flush()
+    assert database.get_queue_depth() == 0
+    assert inner.values == {
+        molecule: value for value, molecule in enumerate(molecules)
+    }
+    database.close()
+
+
+def test_get_flush_latencies() -> None:
+    inner = _GatedValueDb()
+    inner.gate.set()
+    database = stk.WriteBehindValueDb(inner, batch_size=2)
+    assert database.get_flush_latencies() == ()
+
+    for value, molecule in enumerate(_get_molecules(5)):
+        database.put(molecule, value)
+    database.flush()
+    latencies = database.get_flush_latencies()
+    assert 1 <= len(latencies) <= 5
+    assert all(latency >= 0 for latency in latencies)
+    database.close()
+
+
+def test_put_blocks_at_max_queue_size() -> None:
+    inner = _GatedValueDb()
+    database = stk.WriteBehindValueDb(inner, max_queue_size=2, batch_size=1)
+    molecules = _get_molecules(3)
+    database.put(molecules[0], 0)
+    database.put(molecules[1], 1)
+    assert database.get_queue_depth() == 2
+
+    thread = threading.Thread(target=database.put, args=(molecules[2], 2))
+    thread.start()
+    thread.join(timeout=0.2)
+    assert thread.is_alive()
+
+    inner.gate.set()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    database.flush()
+    assert len(inner.values) == 3
+    database.close()
+
+
+@pytest.mark.parametrize(
+    "call",
+    (
+        lambda database: database.put(stk.BuildingBlock("NCCN"), 1),
+        lambda database: database.flush(),
+        lambda database: database.close(),
+    ),
+)
+def test_background_error_is_raised_again(call) -> None:
+    inner = _GatedValueDb()
+    inner.gate.set()
+    inner.error = ValueError("Write failed.")
+    database = stk.WriteBehindValueDb(inner)
+    database.put(stk.BuildingBlock("BrCCBr"), 1)
+    _wait_for_writes(database)
+    with pytest.raises(ValueError, match="Write failed."):
+        call(database)
+
+
+def test_put_after_close() -> None:
+    inner = _GatedValueDb()
+    inner.gate.set()
+    database = stk.WriteBehindValueDb(inner)
+    database.close()
+    with pytest.raises(RuntimeError):
+        database.put(stk.BuildingBlock("BrCCBr"), 1)
+
+
+def test_copy_writes_pending_puts(tmp_path: pathlib.Path) -> None:
+    database = stk.WriteBehindValueDb(
+        database=stk.ValueSqliteDb(
+            path=tmp_path / "values.db",
+            table="values",
+        ),
+    )
+    # This is what happens when the database is sent to a worker
+    # process.
+    copy = pickle.loads(pickle.dumps(database))
+    molecule = stk.BuildingBlock("BrCCBr")
+    copy.put(molecule, 12)
+    del copy
+    gc.collect()
+    assert database.get(molecule) == 12
+    database.close()
@@ -0,0 +1,69 @@
+import stk
+
+
+def _get_building_block(smiles):
+    return stk.BuildingBlock(smiles, [stk.BromoFactory()])
+
+
+def _get_polymer(building_block):
+    return stk.MoleculeRecord(
+        topology_graph=stk.polymer.Linear(
+            building_blocks=(building_block,),
+            repeating_unit="A",
+            num_repeating_units=2,
+        ),
+    )
+
+
+def test_get_generations_parallel_mutants():
+    """
+    Test that mutants made in a parallel EA differ from their parents.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    smiles = stk.Smiles()
+    replacements = tuple(
+        map(_get_building_block, ("BrCOCBr", "BrCSCBr", "BrCOCOCBr"))
+    )
+    replacement_keys = set(map(smiles.get_key, replacements))
+    ea = stk.EvolutionaryAlgorithm(
+        initial_population=tuple(
+            _get_polymer(_get_building_block(smiles))
+            for smiles in ("BrCCBr", "BrCCCBr", "BrCCCCBr", "BrCNCBr")
+        ),
+        fitness_calculator=stk.FitnessFunction(
+            fitness_function=lambda record: (
+                record.get_molecule().get_num_atoms()
+            ),
+        ),
+        mutator=stk.RandomBuildingBlock(
+            building_blocks=replacements,
+            is_replaceable=lambda building_block: True,
+            random_seed=4,
+        ),
+        crosser=stk.GeneticRecombination(
+            get_gene=lambda building_block: 0,
+        ),
+        generation_selector=stk.Best(num_batches=4),
+        mutation_selector=stk.Roulette(num_batches=3, random_seed=5),
+        crossover_selector=stk.Roulette(
+            num_batches=0,
+            batch_size=2,
+            random_seed=6,
+        ),
+        num_processes=2,
+    )
+
+    num_mutants = 0
+    for generation in ea.get_generations(3):
+        for mutation_record in generation.get_mutation_records():
+            molecule = mutation_record.get_molecule_record().get_molecule()
+            assert not replacement_keys.isdisjoint(
+                map(smiles.get_key, molecule.get_building_blocks())
+            )
+            num_mutants += 1
+    assert num_mutants > 0
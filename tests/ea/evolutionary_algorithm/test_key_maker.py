@@ -0,0 +1,60 @@
+import stk
+
+
+def _get_evolutionary_algorithm(key_maker, selector_key_maker):
+    return stk.EvolutionaryAlgorithm(
+        initial_population=(),
+        fitness_calculator=stk.FitnessFunction(
+            fitness_function=lambda record: 1,
+        ),
+        mutator=stk.RandomMutator(mutators=()),
+        crosser=stk.GeneticRecombination(
+            get_gene=lambda building_block: 0,
+        ),
+        generation_selector=stk.Best(num_batches=4),
+        mutation_selector=stk.FilterBatches(
+            filter=stk.Best(num_batches=4),
+            selector=stk.Roulette(num_batches=3, random_seed=5),
+        ),
+        crossover_selector=stk.Roulette(
+            num_batches=2,
+            batch_size=2,
+            key_maker=selector_key_maker,
+        ),
+        key_maker=key_maker,
+        num_processes=1,
+    )
+
+
+def test_default_key_makers_share_cache():
+    """
+    Test that the EA and default-built selectors share a key maker.
+    """
+
+    smiles = stk.Smiles()
+    ea = _get_evolutionary_algorithm(stk.Inchi(), smiles)
+    implementation = ea._implementation
+    key_maker = implementation._key_maker
+    assert isinstance(key_maker, stk.CachedKeyMaker)
+    assert implementation._generation_selector._key_maker is key_maker
+    mutation_selector = implementation._mutation_selector
+    assert mutation_selector._filter._key_maker is key_maker
+    assert mutation_selector._selector._key_maker is key_maker
+    crossover_key_maker = implementation._crossover_selector._key_maker
+    assert crossover_key_maker is not key_maker
+    assert crossover_key_maker.get_key_name() == smiles.get_key_name()
+
+
+def test_custom_key_maker_is_not_shared():
+    """
+    Test that selectors do not use a non-InChI key maker of the EA.
+    """
+
+    ea = _get_evolutionary_algorithm(stk.Smiles(), stk.Inchi())
+    implementation = ea._implementation
+    key_maker = implementation._key_maker
+    assert key_maker.get_key_name() == stk.Smiles().get_key_name()
+    selector_key_maker = implementation._generation_selector._key_maker
+    assert selector_key_maker is not key_maker
+    assert selector_key_maker.get_key_name() == "InChI"
+    assert implementation._crossover_selector._key_maker is selector_key_maker
@@ -1,6 +1,7 @@
 from typing import Any
 
 import pytest
+
 import stk
 
 from ..case_data import CaseData
@@ -74,6 +75,26 @@ def stochastic_universal_sampling_population_1() -> dict[
                 [3, 4],
             ),
         ),
+        lambda population: CaseData.new(
+            selector=stk.StochasticUniversalSampling(
+                batch_size=2,
+                duplicate_batches=False,
+                batch_sampling=True,
+            ),
+            population=population,
+            selected=(
+                [0, 1],
+                [0, 2],
+                [0, 3],
+                [0, 4],
+                [1, 2],
+                [1, 3],
+                [1, 4],
+                [2, 3],
+                [2, 4],
+                [3, 4],
+            ),
+        ),
     ),
 )
 def stochastic_universal_sampling(
@@ -1,6 +1,7 @@
 from typing import Any
 
 import pytest
+
 import stk
 
 from ..case_data import CaseData
@@ -69,6 +70,25 @@ def tournament_population_1() -> dict[stk.MoleculeRecord[Any], float]:
                 [2, 4],
             ),
         ),
+        lambda population: CaseData.new(
+            selector=stk.Tournament(
+                batch_size=2,
+                duplicate_batches=False,
+                batch_sampling=True,
+            ),
+            population=population,
+            selected=(
+                [0, 1],
+                [0, 2],
+                [0, 3],
+                [0, 4],
+                [1, 2],
+                [1, 3],
+                [1, 4],
+                [2, 3],
+                [2, 4],
+            ),
+        ),
     ),
 )
 def tournament(
@@ -0,0 +1,168 @@
+import itertools
+import typing
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+import stk
+
+T = typing.TypeVar("T", bound=stk.MoleculeRecord)
+
+
+def _get_record(num_repeating_units: int) -> stk.MoleculeRecord[typing.Any]:
+    return stk.MoleculeRecord(
+        topology_graph=stk.polymer.Linear(
+            building_blocks=[
+                stk.BuildingBlock("BrCCBr", stk.BromoFactory()),
+            ],
+            repeating_unit="A",
+            num_repeating_units=num_repeating_units,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def population() -> dict[stk.MoleculeRecord[typing.Any], float]:
+    # Two records hold the same molecule, so some batches can be made
+    # from more than one combination of records.
+    return {
+        _get_record(2): 10,
+        _get_record(3): 6,
+        _get_record(3): 4,
+        _get_record(4): 3,
+        _get_record(5): 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "get_selector",
+    (
+        lambda batch_sampling: stk.Roulette(
+            num_batches=1,
+            batch_size=2,
+            random_seed=1,
+            batch_sampling=batch_sampling,
+        ),
+        lambda batch_sampling: stk.StochasticUniversalSampling(
+            num_batches=1,
+            batch_size=2,
+            random_seed=1,
+            batch_sampling=batch_sampling,
+        ),
+    ),
+)
+@pytest.mark.parametrize("num_included_batches", (None, 3))
+def test_batch_sampling_frequencies(
+    population: dict[stk.MoleculeRecord[typing.Any], float],
+    get_selector: Callable[[bool], stk.Selector[typing.Any]],
+    num_included_batches: int | None,
+) -> None:
+    """
+    Test that batch sampling selects batches as often as selecting
+    from every batch does.
+
+    Parameters:
+        population:
+            The population to select from.
+        get_selector:
+            Takes the value of `batch_sampling` and returns the
+            selector to test.
+        num_included_batches:
+            The number of batches passed as `included_batches`. If
+            ``None``, all batches can be selected.
+    """
+    included_batches = None
+    if num_included_batches is not None:
+        inchi = stk.Inchi()
+        included_batches = {
+            stk.Batch(
+                records={record: population[record] for record in records},
+                key_maker=inchi,
+            ).get_identity_key()
+            for records in itertools.islice(
+                itertools.combinations(population, 2),
+                num_included_batches,
+            )
+        }
+
+    num_selections = 3000
+    frequencies1 = _get_frequencies(
+        selector=get_selector(False),
+        population=population,
+        included_batches=included_batches,
+        num_selections=num_selections,
+    )
+    frequencies2 = _get_frequencies(
+        selector=get_selector(True),
+        population=population,
+        included_batches=included_batches,
+        num_selections=num_selections,
+    )
+    assert frequencies1.keys() == frequencies2.keys()
+    for key in frequencies1:
+        assert abs(frequencies1[key] - frequencies2[key]) < 0.04
+
+
+def _get_frequencies(
+    selector: stk.Selector[T],
+    population: dict[T, float],
+    included_batches: set[stk.BatchKey] | None,
+    num_selections: int,
+) -> dict[stk.BatchKey, float]:
+    counts: Counter[stk.BatchKey] = Counter(
+        batch.get_identity_key()
+        for _ in range(num_selections)
+        for batch in selector.select(
+            population=population,
+            included_batches=included_batches,
+        )
+    )
+    return {key: count / num_selections for key, count in counts.items()}
+
+
+@pytest.mark.parametrize(
+    "get_selector",
+    (
+        lambda batch_sampling: stk.Roulette(
+            duplicate_batches=False,
+            random_seed=2,
+            batch_sampling=batch_sampling,
+        ),
+        lambda batch_sampling: stk.StochasticUniversalSampling(
+            duplicate_batches=False,
+            random_seed=2,
+            batch_sampling=batch_sampling,
+        ),
+    ),
+)
+def test_batch_sampling_rare_batches(
+    get_selector: Callable[[bool], stk.Selector[typing.Any]],
+) -> None:
+    """
+    Test that batch sampling selects batches, which are rarely drawn.
+
+    Once the likely batches are selected, almost every drawn batch is
+    rejected, but the rare batch must still be selected.
+
+    Parameters:
+        get_selector:
+            Takes the value of `batch_sampling` and returns the
+            selector to test.
+    """
+    population = {
+        _get_record(2): 1,
+        _get_record(3): 1,
+        _get_record(4): 1e-12,
+    }
+    expected = {
+        batch.get_identity_key()
+        for batch in get_selector(False).select(population)
+    }
+    selected = [
+        batch.get_identity_key()
+        for batch in get_selector(True).select(population)
+    ]
+    assert len(expected) == len(population)
+    assert len(selected) == len(population)
+    assert set(selected) == expected
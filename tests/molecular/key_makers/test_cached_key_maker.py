@@ -0,0 +1,33 @@
+import gc
+import pickle
+
+import stk
+
+
+def test_cached_key_maker():
+    """
+    Test :class:`.CachedKeyMaker`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    key_maker = stk.CachedKeyMaker(stk.InchiKey())
+    assert key_maker.get_key_name() == "InChIKey"
+
+    molecule = stk.BuildingBlock("NCCN")
+    key = stk.InchiKey().get_key(molecule)
+    assert key_maker.get_key(molecule) == key
+    assert key_maker.get_key(molecule) == key
+    assert key_maker.get_num_misses() == 1
+    assert key_maker.get_num_hits() == 1
+
+    # The cache does not keep molecules alive.
+    del molecule
+    gc.collect()
+    assert len(key_maker._keys) == 0
+
+    clone = pickle.loads(pickle.dumps(key_maker))
+    assert clone.get_key(stk.BuildingBlock("NCCN")) == key
@@ -0,0 +1,91 @@
+import stk
+
+
+def _get_linear(smiles, orientations):
+    return stk.polymer.Linear(
+        building_blocks=(stk.BuildingBlock(smiles, [stk.BromoFactory()]),),
+        repeating_unit="A",
+        num_repeating_units=3,
+        orientations=orientations,
+    )
+
+
+def test_get_topology_graph_key():
+    """
+    Test :meth:`.MoleculeKeyMaker.get_topology_graph_key`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    key_maker = stk.InchiKey()
+    key1 = key_maker.get_topology_graph_key(
+        _get_linear("BrCCBr", (0,)),
+    )
+    assert key1 is not None
+    assert key1 == key_maker.get_topology_graph_key(
+        _get_linear("BrCCBr", (0,)),
+    )
+    assert key1 != key_maker.get_topology_graph_key(
+        _get_linear("BrCCCBr", (0,)),
+    )
+    assert key1 != key_maker.get_topology_graph_key(
+        _get_linear("BrCCBr", (1,)),
+    )
+
+
+def test_get_topology_graph_key_functional_groups():
+    """
+    Test that topology graph keys depend on functional groups.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    linker = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    building_block = stk.BuildingBlock(
+        smiles="BrCC(CBr)CC(Br)CCBr",
+        functional_groups=[stk.BromoFactory()],
+    )
+    functional_groups = tuple(building_block.get_functional_groups())
+    cage1 = stk.cage.FourPlusSix(
+        building_blocks=(
+            building_block.with_functional_groups(functional_groups[:3]),
+            linker,
+        ),
+    )
+    cage2 = stk.cage.FourPlusSix(
+        building_blocks=(
+            building_block.with_functional_groups(functional_groups[1:]),
+            linker,
+        ),
+    )
+
+    key_maker = stk.InchiKey()
+    assert key_maker.get_key(
+        stk.ConstructedMolecule(cage1)
+    ) != key_maker.get_key(stk.ConstructedMolecule(cage2))
+    key1 = key_maker.get_topology_graph_key(cage1)
+    assert key1 is not None
+    assert key1 != key_maker.get_topology_graph_key(cage2)
+
+
+def test_molecule_record_is_lazy():
+    """
+    Test that :class:`.MoleculeRecord` constructs on demand.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    record = stk.MoleculeRecord(_get_linear("BrCCBr", (0,)))
+    assert not record.is_constructed()
+    molecule = record.get_molecule()
+    assert record.is_constructed()
+    assert record.get_molecule() is molecule
@@ -0,0 +1,49 @@
+import pytest
+
+import stk
+
+
+@pytest.fixture(
+    params=(stk.BuildingBlock("BrC1=C(Br)[C+]=N1", [stk.BromoFactory()]),),
+)
+def linear_building_block(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        stk.BuildingBlock(
+            smiles="Br[C+]1C2(Br)[C+]=N[C+]2[C+](Br)[C+](Br)[C+2]1",
+            functional_groups=[stk.BromoFactory()],
+        ),
+    ),
+)
+def nonlinear_building_block(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=(
+        lambda building_blocks: stk.cof.Kagome(
+            building_blocks=building_blocks,
+            lattice_size=(3, 3, 1),
+        ),
+        lambda building_blocks: stk.cof.Kagome(
+            building_blocks=building_blocks,
+            lattice_size=(3, 3, 1),
+            vertex_alignments={0: 1, 1: 1},
+        ),
+        lambda building_blocks: stk.cof.PeriodicKagome(
+            building_blocks=building_blocks,
+            lattice_size=(3, 3, 1),
+        ),
+    ),
+)
+def topology_graph(
+    request,
+    linear_building_block,
+    nonlinear_building_block,
+):
+    return request.param(
+        (linear_building_block, nonlinear_building_block),
+    )
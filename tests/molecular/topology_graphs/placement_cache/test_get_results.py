@@ -0,0 +1,58 @@
+import numpy as np
+
+from stk._internal.topology_graphs.topology_graph.utilities import (
+    _Placement,
+    _PlacementCache,
+)
+
+
+def test_get_results(topology_graph):
+    """
+    Test :meth:`._PlacementCache.get_results`.
+
+    Parameters
+    ----------
+    topology_graph : :class:`.TopologyGraph`
+        The topology graph whose vertices are placed with, and
+        without, the cache.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    state = topology_graph._get_construction_state()
+    placement_cache = _PlacementCache()
+    for stage in topology_graph._implementation.get_stages():
+        vertices = tuple(state.get_vertices(stage))
+        edges = tuple(map(state.get_edges, stage))
+        building_blocks = tuple(map(state.get_building_block, stage))
+        results = placement_cache.get_results(
+            vertices=vertices,
+            edges=edges,
+            building_blocks=building_blocks,
+            get_results=_get_results,
+        )
+        expected_results = _get_results(vertices, edges, building_blocks)
+        for result, expected in zip(results, expected_results):
+            assert np.allclose(
+                a=result.position_matrix,
+                b=expected.position_matrix,
+                atol=1e-6,
+            )
+            assert (
+                result.functional_group_edges
+                == expected.functional_group_edges
+            )
+
+
+def _get_results(vertices, edges, building_blocks):
+    return [
+        _Placement(vertex, vertex_edges, building_block).get_result()
+        for vertex, vertex_edges, building_block in zip(
+            vertices,
+            edges,
+            building_blocks,
+        )
+    ]
@@ -50,6 +50,55 @@ from .case_data import CaseData
                 )
             ),
         ),
+        lambda: CaseData(
+            dejsonizer=stk.MoleculeDejsonizer(),
+            json={
+                "molecule": {
+                    "a": (
+                        (35, 0),
+                        (6, 2),
+                        (6, 2),
+                        (35, 0),
+                    ),
+                    "b": (
+                        (0, 1, 1, (0, 0, 0)),
+                        (1, 2, 1, (0, 0, 0)),
+                        (2, 3, 1, (0, 0, 0)),
+                    ),
+                    "InChI": "InChI=1S/C2Br2/c3-1-2-4/q+4",
+                    "InChIKey": "UWAHASCVLDBPQQ-UHFFFAOYSA-N",
+                },
+                "matrix": {
+                    "InChI": "InChI=1S/C2Br2/c3-1-2-4/q+4",
+                    "InChIKey": "UWAHASCVLDBPQQ-UHFFFAOYSA-N",
+                    "m": {
+                        "d": "<f4",
+                        "s": [4, 3],
+                        "b": np.array(
+                            [
+                                [0.0, 0.0, 0.0],
+                                [1.0, 0.0, 0.0],
+                                [2.0, 0.0, 0.0],
+                                [3.0, 0.0, 0.0],
+                            ],
+                            dtype="<f4",
+                        ).tobytes(),
+                    },
+                },
+            },
+            molecule=stk.BuildingBlock(
+                smiles="Br[C+2][C+2]Br",
+            ).with_position_matrix(
+                np.array(
+                    [
+                        [0.0, 0.0, 0.0],
+                        [1.0, 0.0, 0.0],
+                        [2.0, 0.0, 0.0],
+                        [3.0, 0.0, 0.0],
+                    ]
+                )
+            ),
+        ),
         lambda: CaseData(
             dejsonizer=stk.ConstructedMoleculeDejsonizer(),
             json={